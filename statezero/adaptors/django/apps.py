@@ -65,6 +65,12 @@ class StateZeroDjangoConfig(DjangoAppConfig):
             registry
         )  # Raises an exception if a non StateZero model is implicitly exposed
         config.event_bus.set_registry(registry)
+        # Build the model graph once; requests share the frozen copy.
+        config.orm_provider.freeze_model_graph()
+        # Optimization plans depend on the models and registry, which are now final.
+        from statezero.adaptors.django.query_optimizer import clear_optimization_plan_cache
+
+        clear_optimization_plan_cache()
 
         # Print the list of published models and actions to confirm StateZero is running.
         try:
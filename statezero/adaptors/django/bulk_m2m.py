@@ -0,0 +1,98 @@
+"""
+Set-based ManyToMany assignment for bulk updates.
+
+Calling ``.set()`` on every updated row costs several queries per row. For
+forward ManyToMany fields with an auto-created through table,
+``set_many_to_many`` instead reads the existing links for all affected rows,
+then deletes the stale links and ``bulk_create``s the missing ones on the
+through model, in pk batches of ``STATEZERO_PK_IN_BATCH_SIZE``.
+
+The set-based path does not send ``m2m_changed``. Set
+``STATEZERO_BULK_M2M_SIGNALS = True`` to keep per-row ``.set()`` calls and
+their signals. Custom through models and symmetrical self-references always
+use ``.set()``.
+"""
+from typing import Any, Dict, Iterable, List, Set, Tuple, Type
+
+from django.conf import settings
+from django.db import connections, models
+
+from statezero.adaptors.django.prefetch import batch_size, pk_in_batches
+
+
+def per_row_signals() -> bool:
+    return getattr(settings, "STATEZERO_BULK_M2M_SIGNALS", False)
+
+
+def _is_set_based(field: Any) -> bool:
+    return (
+        isinstance(field, models.ManyToManyField)
+        and field.remote_field.through._meta.auto_created
+        and not field.remote_field.symmetrical
+    )
+
+
+def set_many_to_many(
+    model: Type[models.Model],
+    pks: List[Any],
+    m2m_data: Dict[str, Iterable[Any]],
+    using: str = "default",
+) -> None:
+    """Make each ManyToMany field in ``m2m_data`` hold exactly the given values on every row in ``pks``."""
+    if not pks:
+        return
+    per_row = {}
+    for field_name, values in m2m_data.items():
+        field = model._meta.get_field(field_name)
+        if per_row_signals() or not _is_set_based(field):
+            per_row[field_name] = values
+        else:
+            _set_links(field, pks, values, using)
+
+    if per_row:
+        manager = model._base_manager.using(using)
+        for condition in pk_in_batches("pk", pks, using):
+            for instance in manager.filter(condition):
+                for field_name, values in per_row.items():
+                    getattr(instance, field_name).set(values)
+
+
+def _set_links(field: models.ManyToManyField, pks: List[Any], values: Iterable[Any], using: str) -> None:
+    through = field.remote_field.through
+    source = through._meta.get_field(field.m2m_field_name())
+    target = through._meta.get_field(field.m2m_reverse_field_name())
+    target_model = target.remote_field.model
+
+    # Normalise like RelatedManager.set(): instances or raw pk values
+    target_ids = list(
+        dict.fromkeys(
+            target.get_foreign_related_value(value)[0]
+            if isinstance(value, target_model)
+            else target.get_prep_value(value)
+            for value in values
+        )
+    )
+
+    manager = through._base_manager.using(using)
+    existing: Set[Tuple[Any, Any]] = set()
+    for condition in pk_in_batches(source.attname, pks, using):
+        rows = manager.filter(condition)
+        existing.update(rows.values_list(source.attname, target.attname))
+
+    wanted = set(target_ids)
+    if any(target_id not in wanted for _, target_id in existing):
+        for condition in pk_in_batches(source.attname, pks, using):
+            manager.filter(condition).exclude(**{f"{target.attname}__in": target_ids}).delete()
+
+    missing = [
+        through(**{source.attname: pk, target.attname: target_id})
+        for pk in pks
+        for target_id in target_ids
+        if (pk, target_id) not in existing
+    ]
+    if missing:
+        manager.bulk_create(
+            missing,
+            batch_size=batch_size(),
+            ignore_conflicts=connections[using].features.supports_ignore_conflicts,
+        )
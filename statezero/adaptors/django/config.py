@@ -32,11 +32,15 @@ class DjangoLocalConfig(AppConfig):
         from statezero.adaptors.django.orm import DjangoORMAdapter
         from statezero.adaptors.django.schemas import DjangoSchemaGenerator
         from statezero.adaptors.django.serializers import DRFDynamicSerializer
+        from statezero.adaptors.django.values_serializer import ValuesReadSerializer
         from statezero.adaptors.django.search_providers.basic_search import BasicSearchProvider
         from statezero.core.event_bus import EventBus
 
         # Initialize serializer, schema generator, and ORM adapter.
-        self.serializer = DRFDynamicSerializer()
+        if getattr(settings, 'STATEZERO_VALUES_READS', False):
+            self.serializer = ValuesReadSerializer()
+        else:
+            self.serializer = DRFDynamicSerializer()
         self.schema_generator = DjangoSchemaGenerator()
         self.orm_provider = DjangoORMAdapter()
         self.context_manager = query_timeout
@@ -1,19 +1,141 @@
-from typing import Dict, Set, List, Optional, Callable, Type, Union, Any
+from functools import lru_cache
+from typing import Dict, Set, List, Optional, Callable, Tuple, Type, Union, Any
 from django.db import models
+from django.db.models import F
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.query import QuerySet
 from django.apps import apps
 from django.core.exceptions import FieldDoesNotExist
 
+# Annotation names for repr values computed in SQL
+REPR_STR_ANNOTATION = "_statezero_repr_str"
+REPR_IMG_ANNOTATION = "_statezero_repr_img"
+
+
+def get_repr_annotations(model: Type[models.Model]) -> Dict[str, Any]:
+    """
+    Return the SQL annotations for the model's ``repr_expression`` and
+    ``repr_image``, or an empty dict if the model has none or omits ``repr``.
+    """
+    from statezero.adaptors.django.config import registry
+
+    try:
+        model_config = registry.get_config(model)
+    except ValueError:
+        return {}
+    if not model_config.include_repr:
+        return {}
+
+    annotations = {}
+    if model_config.repr_expression is not None:
+        expression = model_config.repr_expression
+        annotations[REPR_STR_ANNOTATION] = F(expression) if isinstance(expression, str) else expression
+    if model_config.repr_image is not None:
+        annotations[REPR_IMG_ANNOTATION] = F(model_config.repr_image)
+    return annotations
+
+
+@lru_cache(maxsize=None)
+def _repr_image_converter(model: Type[models.Model], path: str) -> Callable[[Any], Any]:
+    """File fields hold a storage name in SQL; turn it into the file's URL."""
+    current = model
+    parts = path.split(LOOKUP_SEP)
+    for part in parts[:-1]:
+        current = current._meta.get_field(part).related_model
+    field = current._meta.get_field(parts[-1])
+    if isinstance(field, models.FileField):
+        return lambda name: field.storage.url(name) if name else None
+    return lambda value: value
+
+
+def _repr_text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def instance_repr(obj: models.Model) -> Dict[str, Any]:
+    """
+    The ``repr`` of an instance. Values annotated from the model's repr
+    expression and image path are used when present; otherwise ``str(obj)``
+    and ``obj.__img__()``.
+    """
+    values = obj.__dict__
+    if REPR_IMG_ANNOTATION in values:
+        from statezero.adaptors.django.config import registry
+
+        path = registry.get_config(type(obj)).repr_image
+        img_repr = _repr_image_converter(type(obj), path)(values[REPR_IMG_ANNOTATION])
+    else:
+        img_repr = obj.__img__() if hasattr(obj, "__img__") else None
+
+    if REPR_STR_ANNOTATION in values:
+        str_repr = _repr_text(values[REPR_STR_ANNOTATION])
+    else:
+        str_repr = str(obj)
+
+    return {
+        "str": str_repr,
+        "img": img_repr
+    }
+
+
+def row_repr_reader(model: Type[models.Model]) -> Optional[Callable[[Dict[str, Any]], Dict[str, Any]]]:
+    """
+    Return a function building ``repr`` from a ``values()`` row annotated with
+    ``get_repr_annotations``, or None if the repr needs the model instance.
+    """
+    annotations = get_repr_annotations(model)
+    if REPR_STR_ANNOTATION not in annotations:
+        return None
+    if REPR_IMG_ANNOTATION not in annotations:
+        if hasattr(model, "__img__"):
+            return None
+        return lambda row: {"str": _repr_text(row[REPR_STR_ANNOTATION]), "img": None}
+
+    from statezero.adaptors.django.config import registry
+
+    convert_img = _repr_image_converter(model, registry.get_config(model).repr_image)
+    return lambda row: {
+        "str": _repr_text(row[REPR_STR_ANNOTATION]),
+        "img": convert_img(row[REPR_IMG_ANNOTATION]),
+    }
+
+
+def _traversal_plan(
+    model: Type[models.Model],
+    model_key: Optional[str],
+    fields_map: Dict[str, Set[str]],
+) -> Tuple[Optional[str], List[Tuple[str, bool]]]:
+    """
+    Resolve, once per model class, which relation fields to follow.
+    Returns the fields_map key for the model and (field_name, is_many) pairs.
+    """
+    allowed_fields = fields_map.get(model_key, set()) if model_key else set()
+    relations = []
+    for field_name in allowed_fields:
+        try:
+            field_def = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            # Skip computed properties and non-existent fields
+            continue
+        if field_def.is_relation:
+            relations.append((field_name, field_def.many_to_many or field_def.one_to_many))
+    return model_key, relations
+
+
 def collect_models_by_type(
     obj, 
     fields_map: Dict[str, Set[str]], 
     collected: Optional[Dict[str, List[models.Model]]] = None,
     get_model_name: Optional[Callable[[Union[models.Model, Type[models.Model]]], str]] = None,
-    visited: Optional[Set[str]] = None
+    visited: Optional[Set[Tuple[str, Any]]] = None
 ) -> Dict[str, List[models.Model]]:
     """
     Collects model instances by their type based on a fields_map.
     Uses prefetched/preselected data that's already loaded.
+
+    Walks the instances depth-first with an explicit stack. Relation fields
+    are resolved once per model class, fields_map keys are normalised once,
+    and instances are de-duplicated by (model, pk).
     
     Args:
         obj: Django model instance or queryset
@@ -25,98 +147,66 @@ def collect_models_by_type(
                     }
         collected: Dict to store collected models by type
         get_model_name: Optional function to get model name in the format used in fields_map
-        visited: Set of already visited instance IDs to prevent cycles
+        visited: Set of already visited (model name, pk) pairs to prevent cycles
         
     Returns:
         Dict mapping model types to lists of model instances
     """
-    # Initialize collection dictionary
     if collected is None:
         collected = {}
-    
-    # Initialize visited set to prevent cycles
     if visited is None:
         visited = set()
-    
-    # Handle querysets
-    if isinstance(obj, (QuerySet, list, tuple)):
-        for item in obj:
-            collect_models_by_type(item, fields_map, collected, get_model_name, visited)
-        return collected
-    
-    # Skip None objects
-    if obj is None:
-        return collected
-    
-    # Get model info using the provided function or default
-    model = obj.__class__
-    model_type = get_model_name(obj)
-    
-    # Create a unique ID for this instance to detect cycles
-    instance_id = f"{model_type}:{obj.pk}"
-    if instance_id in visited:
-        # Already processed this instance
-        return collected
-    
-    # Mark as visited
-    visited.add(instance_id)
-    
-    # Add this model instance to the collection
-    if model_type.lower() in [k.lower() for k in fields_map.keys()]:
-        # Find the correct case in the fields_map
-        for key in fields_map.keys():
-            if key.lower() == model_type.lower():
-                model_type = key
-                break
-        
-        if model_type not in collected:
-            collected[model_type] = []
-        
-        # Check if this instance is already in the collection
-        if obj not in collected[model_type]:
-            collected[model_type].append(obj)
-    
-    # Process related fields based on fields_map
-    # Find the case-insensitive match
-    model_key = None
+
+    # Case-insensitive lookup of fields_map keys, computed once
+    keys_by_lower = {}
     for key in fields_map.keys():
-        if key.lower() == model_type.lower():
-            model_key = key
-            break
-    
-    allowed_fields = fields_map.get(model_key, set()) if model_key else set()
-    
-    # If no fields specified for this model, don't traverse further
-    if not allowed_fields:
-        return collected
-    
-    # Process each allowed field
-    for field_name in allowed_fields:
-        try:
-            # Try to get model field definition
-            field_def = model._meta.get_field(field_name)
-            
-            # Only process relation fields
-            if field_def.is_relation:
-                # Get the related value - this will use prefetched/selected data when available
-                related_obj = getattr(obj, field_name)
-                
-                if related_obj is None:
-                    continue
-                
-                # For many-to-many or reverse FK relations
-                if field_def.many_to_many or field_def.one_to_many:
-                    # This will use prefetch_related data if available
-                    related_qs = related_obj.all()
-                    collect_models_by_type(related_qs, fields_map, collected, get_model_name, visited)
-                else:
-                    # This will use select_related data if available
-                    collect_models_by_type(related_obj, fields_map, collected, get_model_name, visited)
-                    
-        except FieldDoesNotExist:
-            # Skip computed properties and non-existent fields
+        keys_by_lower.setdefault(key.lower(), key)
+
+    # Per model class: (model name, fields_map key, relations to follow)
+    plans: Dict[Type[models.Model], Tuple[str, Optional[str], List[Tuple[str, bool]]]] = {}
+
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+
+        # Expand querysets and lists in order
+        if isinstance(current, (QuerySet, list, tuple)):
+            stack.extend(reversed(list(current)))
             continue
-    
+
+        # Skip None objects
+        if current is None:
+            continue
+
+        model = current.__class__
+        plan = plans.get(model)
+        if plan is None:
+            model_type = get_model_name(current)
+            model_key, relations = _traversal_plan(
+                model, keys_by_lower.get(model_type.lower()), fields_map
+            )
+            plan = plans[model] = (model_type, model_key, relations)
+        model_type, model_key, relations = plan
+
+        # Detect cycles and instances reached through several paths
+        instance_id = (model_type, current.pk)
+        if instance_id in visited:
+            continue
+        visited.add(instance_id)
+
+        if model_key is not None:
+            collected.setdefault(model_key, []).append(current)
+
+        children = []
+        for field_name, is_many in relations:
+            # This will use select_related / prefetch_related data when available
+            related_obj = getattr(current, field_name)
+            if related_obj is None:
+                continue
+            children.append(related_obj.all() if is_many else related_obj)
+        # Push in reverse so they are visited in field order
+        stack.extend(reversed(children))
+
     return collected
 
 def collect_from_queryset(
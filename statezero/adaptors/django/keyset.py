@@ -0,0 +1,167 @@
+"""
+Keyset (cursor) pagination.
+
+Offset pagination makes the database walk and discard every row before the
+page, and pages shift when rows are inserted between requests. A keyset page
+instead seeks past the row a cursor points at: the cursor holds that row's
+values for every ordering field plus the primary key, which always ends the
+ordering so that every row has a distinct position.
+
+Ordering fields sort with NULLs last in both directions on every backend, so
+the seek predicate means the same thing everywhere. Cursors are opaque,
+URL-safe strings that also record the ordering they were made for.
+"""
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import or_
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db.models import F, Q, QuerySet
+
+from statezero.core.exceptions import ValidationError
+
+# (field path, descending)
+OrderingKey = Tuple[str, bool]
+
+
+def ordering_keys(queryset: QuerySet, order_by: List[str]) -> List[OrderingKey]:
+    """
+    The ordering of a keyset page: ``order_by`` followed by the primary key.
+
+    The model's default ordering is not used, since cursors expose the ordering
+    values and only the requested ordering paths have been permission checked,
+    segment by segment (see ASTParser._validate_cursor_ordering).
+    """
+    opts = queryset.model._meta
+    keys: List[OrderingKey] = []
+    for entry in order_by:
+        if entry == "?":
+            raise ValidationError("Random ordering cannot be used with cursor pagination.")
+        field = entry.lstrip("-")
+        if field == "pk":
+            field = opts.pk.name
+        if field not in {key[0] for key in keys}:
+            keys.append((field, entry.startswith("-")))
+    if opts.pk.name not in {key[0] for key in keys}:
+        keys.append((opts.pk.name, False))
+    return keys
+
+
+def encode_cursor(keys: List[OrderingKey], values: Tuple[Any, ...]) -> str:
+    payload = {
+        "o": [f"-{field}" if desc else field for field, desc in keys],
+        "v": list(values),
+    }
+    # str() keeps full precision for datetimes and decimals; lookups parse it back
+    raw = json.dumps(payload, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(keys: List[OrderingKey], cursor: str) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        ordering, values = payload["o"], payload["v"]
+    except (AttributeError, TypeError, KeyError, ValueError, binascii.Error):
+        raise ValidationError("Invalid pagination cursor.")
+    if ordering != [f"-{field}" if desc else field for field, desc in keys]:
+        raise ValidationError("The pagination cursor was created for a different ordering.")
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise ValidationError("Invalid pagination cursor.")
+    return values
+
+
+def seek_filter(keys: List[OrderingKey], values: List[Any], before: bool = False) -> Q:
+    """Rows strictly after (or before) ``values`` in the order ``keys`` describe."""
+    branches = []
+    equal = Q()
+    for (field, desc), value in zip(keys, values):
+        beyond = _beyond(field, desc, value, before)
+        if beyond is not None:
+            branches.append(equal & beyond)
+        equal &= Q(**{f"{field}__isnull": True}) if value is None else Q(**{field: value})
+    if not branches:
+        return Q(pk__in=[])
+    return reduce(or_, branches)
+
+
+def _beyond(field: str, desc: bool, value: Any, before: bool) -> Optional[Q]:
+    """Rows whose ``field`` alone sorts after (or before) ``value``; NULLs sort last."""
+    if value is None:
+        # Nothing sorts after NULL, and every non-NULL value sorts before it
+        return Q(**{f"{field}__isnull": False}) if before else None
+    lookup = "lt" if desc != before else "gt"
+    condition = Q(**{f"{field}__{lookup}": value})
+    if not before:
+        condition |= Q(**{f"{field}__isnull": True})
+    return condition
+
+
+def _order_expressions(keys: List[OrderingKey], reverse: bool = False) -> list:
+    # NULLs sort last going forward, so they come first in reverse
+    nulls = {"nulls_first": True} if reverse else {"nulls_last": True}
+    return [
+        F(field).desc(**nulls) if desc != reverse else F(field).asc(**nulls)
+        for field, desc in keys
+    ]
+
+
+class KeysetPage:
+    """
+    One page of a keyset-paginated queryset.
+
+    ``queryset`` is the seek query (ordered, filtered past the cursor and
+    limited to one row more than the page), which identifies the page for
+    caching. ``fetch`` runs it for the page's keys and returns the page rows in
+    display order together with the cursors of the neighbouring pages.
+    """
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        order_by: List[str],
+        limit: Optional[int],
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ):
+        if after is not None and before is not None:
+            raise ValidationError("Use either 'after' or 'before', not both.")
+        self.keys = ordering_keys(queryset, order_by)
+        self.limit = limit
+        self.after = after
+        self.before = before
+        self.rows = queryset.order_by(*_order_expressions(self.keys))
+
+        cursor = before if before is not None else after
+        seek = queryset
+        if cursor is not None:
+            seek = seek.filter(
+                seek_filter(self.keys, decode_cursor(self.keys, cursor), before=before is not None)
+            )
+        seek = seek.order_by(*_order_expressions(self.keys, reverse=before is not None))
+        self.queryset = seek if limit is None else seek[: limit + 1]
+
+    def fetch(self) -> Tuple[QuerySet, Dict[str, Optional[str]]]:
+        pk_name = self.rows.model._meta.pk.name
+        pk_index = [field for field, _ in self.keys].index(pk_name)
+
+        key_rows = list(self.queryset.values_list(*(field for field, _ in self.keys)))
+        has_more = self.limit is not None and len(key_rows) > self.limit
+        key_rows = key_rows[: self.limit]
+        if self.before is not None:
+            key_rows.reverse()
+
+        first = encode_cursor(self.keys, key_rows[0]) if key_rows else None
+        last = encode_cursor(self.keys, key_rows[-1]) if key_rows else None
+        if self.before is not None:
+            cursors = {"prev_cursor": first if has_more else None, "next_cursor": last}
+        else:
+            cursors = {
+                "prev_cursor": first if self.after is not None else None,
+                "next_cursor": last if has_more else None,
+            }
+
+        rows = self.rows.filter(pk__in=[row[pk_index] for row in key_rows])
+        return rows, cursors
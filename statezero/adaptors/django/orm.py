@@ -1,17 +1,24 @@
 import logging
+from functools import reduce
+from operator import or_
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
 import networkx as nx
 from django.apps import apps
 from django.core.exceptions import FieldDoesNotExist
-from django.db import models, transaction
-from django.db.models import Avg, Count, Max, Min, Q, Sum, QuerySet
+from django.db import connections, models, transaction
+from django.db.models import Avg, Count, Max, Min, Q, Sum, QuerySet, Window
+from django.db.models.query import ModelIterable
 from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 from rest_framework import serializers
 
 
+from statezero.adaptors.django.bulk_m2m import set_many_to_many
 from statezero.adaptors.django.config import config, registry
+from statezero.adaptors.django.keyset import KeysetPage
+from statezero.adaptors.django.prefetch import pk_in_batches
+from statezero.adaptors.django.returning import delete_returning, update_returning
 from statezero.core.classes import FieldNode, ModelNode
 from statezero.core.event_bus import EventBus
 from statezero.core.exceptions import (
@@ -20,6 +27,8 @@ from statezero.core.exceptions import (
     PermissionDenied,
     ValidationError,
 )
+from statezero.core.model_graph import ModelGraph
+from statezero.core.permission_resolver import get_permission_resolver
 from statezero.core.interfaces import (
     AbstractCustomQueryset,
     AbstractORMProvider,
@@ -149,8 +158,7 @@ def check_object_permissions(
     Raises PermissionDenied if none of the permissions grant access.
     """
     allowed_obj_actions = set()
-    for perm_cls in permissions:
-        perm = perm_cls()
+    for perm in get_permission_resolver(registry, req).instances_for(permissions):
         allowed_obj_actions |= perm.allowed_object_actions(req, instance, model)
     if action not in allowed_obj_actions:
         raise PermissionDenied(
@@ -175,8 +183,7 @@ def check_bulk_permissions(
             check_object_permissions(req, instance, action, permissions, model)
     else:
         allowed = False
-        for perm_cls in permissions:
-            perm = perm_cls()
+        for perm in get_permission_resolver(registry, req).instances_for(permissions):
             # Assume bulk_operation_allowed is defined on all permission classes.
             if perm.bulk_operation_allowed(req, items, action, model):
                 allowed = True
@@ -187,10 +194,26 @@ def check_bulk_permissions(
             )
 
 
+def _total_recording_iterable(sink: Dict[str, Any]) -> Type[ModelIterable]:
+    """A ModelIterable that stores the ``_statezero_total`` window of the first row in ``sink``."""
+
+    class TotalRecordingIterable(ModelIterable):
+        def __iter__(self):
+            sink["read"] = True
+            for instance in super().__iter__():
+                if "total" not in sink:
+                    sink["total"] = instance._statezero_total
+                yield instance
+
+    return TotalRecordingIterable
+
+
 class DjangoORMAdapter(AbstractORMProvider):
     def __init__(self) -> None:
-        # No instance state - completely stateless
-        pass
+        # No per-request state. The only attribute is the model graph frozen
+        # at startup, which is immutable and safe to share between requests.
+        self._frozen_graph: Optional[ModelGraph] = None
+        self._frozen_model_count = 0
 
     # --- QueryEngine Methods ---
     def filter_node(self, queryset: QuerySet, node: Dict[str, Any]) -> QuerySet:
@@ -434,20 +457,6 @@ class DjangoORMAdapter(AbstractORMProvider):
             except Exception:
                 regular_data[key] = value
 
-        # Execute the update with regular (non-M2M) fields
-        rows_updated = 0
-        if regular_data:
-            rows_updated = qs.update(**regular_data)
-
-        # Handle M2M fields by setting them on each instance
-        if m2m_data:
-            instances = list(qs)
-            if not rows_updated:
-                rows_updated = len(instances)
-            for instance in instances:
-                for field_name, value in m2m_data.items():
-                    getattr(instance, field_name).set(value)
-
         # Expand update_fields to include all DB fields for custom serializers (e.g., MoneyField)
         # This ensures .only() fetches companion fields like price_currency for MoneyField
         # Remove M2M fields from update_fields since .only() doesn't support them
@@ -469,11 +478,36 @@ class DjangoORMAdapter(AbstractORMProvider):
                 # If field lookup fails, include as-is
                 expanded_update_fields.add(field_name)
 
-        # After update, fetch the updated instances
-        if expanded_update_fields:
-            updated_instances = list(qs.only(*expanded_update_fields))
+        # Execute the update with regular (non-M2M) fields. On PostgreSQL the
+        # UPDATE returns the changed rows; elsewhere the affected pks are
+        # snapshotted first, since the update may move rows out of the filter
+        updated_instances = None
+        if regular_data:
+            updated_instances = update_returning(qs, regular_data, expanded_update_fields)
+
+        if updated_instances is not None:
+            pks = [instance.pk for instance in updated_instances]
+            rows_updated = len(pks)
         else:
-            updated_instances = list(qs)
+            pks = list(qs.values_list("pk", flat=True))
+            rows_updated = 0
+            if regular_data:
+                rows_updated = qs.update(**regular_data)
+            elif m2m_data:
+                rows_updated = len(pks)
+
+        # Write M2M fields set-based on their through tables
+        if m2m_data:
+            set_many_to_many(model, pks, m2m_data, using=qs.db)
+
+        # Otherwise reload the updated rows by pk
+        if updated_instances is None:
+            rows = model._base_manager.db_manager(qs.db).only(*expanded_update_fields)
+            updated_instances = [
+                instance
+                for condition in pk_in_batches("pk", pks, qs.db)
+                for instance in rows.filter(condition)
+            ]
 
         # Triggers cache invalidation and broadcast to the frontend
         config.event_bus.emit_bulk_event(ActionType.BULK_UPDATE, updated_instances)
@@ -499,11 +533,10 @@ class DjangoORMAdapter(AbstractORMProvider):
 
         check_bulk_permissions(req, qs, ActionType.DELETE, permissions, model)
 
-        # TODO: this should be a values list, but we need to check the bulk event emitter code
+        # Deleted rows come back as pk-only instances, like notify_bulk_deleted(Model, pks)
         pk_field_name = model._meta.pk.name
-        instances = list(qs.only(pk_field_name))
-
-        deleted, _ = qs.delete()
+        deleted, pks = delete_returning(qs)
+        instances = [model(pk=pk) for pk in pks]
 
         # Triggers cache invalidation and broadcast to the frontend
         config.event_bus.emit_bulk_event(ActionType.BULK_DELETE, instances)
@@ -800,6 +833,71 @@ class DjangoORMAdapter(AbstractORMProvider):
 
         return qs
 
+    def fetch_list_with_total(
+        self,
+        queryset: QuerySet,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        req: RequestType = None,
+        permissions: List[Type[AbstractPermission]] = None,
+    ) -> Tuple[QuerySet, Callable[[], int]]:
+        """
+        Fetch a page and the total row count of the unsliced queryset.
+
+        On PostgreSQL the page itself carries a ``COUNT(*) OVER ()`` window, and
+        the total is read from its first row as the serializer consumes it, so
+        the permission-filtered query runs once. An empty page has no row to
+        read it from: it means zero rows unless it was past the end, which costs
+        one count. Elsewhere (and for DISTINCT querysets, where the window would
+        count duplicates) the total is one extra count of the same queryset.
+        """
+        if connections[queryset.db].vendor == "postgresql" and not queryset.query.distinct:
+            sink: Dict[str, Any] = {}
+            rows = self.fetch_list(
+                queryset.annotate(_statezero_total=Window(Count("*"))),
+                offset=offset,
+                limit=limit,
+                req=req,
+                permissions=permissions,
+            )
+            # Clones made by the query optimizer keep the iterable class
+            rows._iterable_class = _total_recording_iterable(sink)
+
+            def total() -> int:
+                if "total" in sink:
+                    return sink["total"]
+                if sink.get("read") and not offset and limit != 0:
+                    return 0
+                return queryset.count()
+
+            return rows, total
+
+        rows = self.fetch_list(
+            queryset, offset=offset, limit=limit, req=req, permissions=permissions
+        )
+        return rows, queryset.count
+
+    def filter_any(self, queryset: QuerySet, conditions: List[Any]) -> QuerySet:
+        """Filter the queryset to rows matching any of the conditions, as one WHERE clause."""
+        if not conditions:
+            return queryset.none()
+        conditions = [c if isinstance(c, Q) else Q(c) for c in conditions]
+        # An empty Q matches every row, but Q() | Q(x) would reduce to Q(x)
+        if any(len(c) == 0 for c in conditions):
+            return queryset
+        return queryset.filter(reduce(or_, conditions))
+
+    def keyset_page(
+        self,
+        queryset: QuerySet,
+        order_by: List[str],
+        limit: Optional[int],
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> KeysetPage:
+        """Return one keyset page of the queryset; see statezero.adaptors.django.keyset."""
+        return KeysetPage(queryset, order_by, limit, after=after, before=before)
+
     def _build_conditions(self, model: Type[models.Model], conditions: dict) -> Q:
         """Build Q conditions from a dictionary."""
         visitor = QueryASTVisitor(model)
@@ -851,23 +949,45 @@ class DjangoORMAdapter(AbstractORMProvider):
         except Exception:
             return False
 
+    def freeze_model_graph(self) -> ModelGraph:
+        """
+        Build the graph for every registered model once and keep it as an
+        immutable ``ModelGraph`` that ``build_model_graph`` hands out.
+        Called from the app's ``ready()`` after the registry is populated.
+        """
+        model_graph = nx.DiGraph()
+        for model in list(registry._models_config.keys()):
+            self.build_model_graph(model, model_graph)
+        self._frozen_graph = ModelGraph.from_digraph(model_graph)
+        self._frozen_model_count = len(registry._models_config)
+        return self._frozen_graph
+
     def build_model_graph(
         self, model: Type[models.Model], model_graph: nx.DiGraph = None
-    ) -> nx.DiGraph:
+    ) -> Union[ModelGraph, nx.DiGraph]:
         """
         Build a directed graph of models and their fields, focusing on direct relationships.
 
+        Without ``model_graph`` this returns the graph frozen at startup, which
+        already contains every model reachable from ``model``. It is only
+        rebuilt if the registry has changed since it was frozen.
+
         Args:
             model: The Django model to build the graph for
-            model_graph: An existing graph to add to (optional)
+            model_graph: An existing networkx graph to add to (optional)
 
         Returns:
-            nx.DiGraph: The model graph
+            ModelGraph, or the populated ``model_graph`` when one is passed in
         """
         from django.db.models.fields.related import RelatedField, ForeignObjectRel
 
         if model_graph is None:
-            model_graph = nx.DiGraph()
+            frozen = self._frozen_graph
+            if frozen is None or self._frozen_model_count != len(registry._models_config):
+                frozen = self.freeze_model_graph()
+            if frozen.has_node(self.get_model_name(model)):
+                return frozen
+            return ModelGraph.from_digraph(self.build_model_graph(model, nx.DiGraph()))
 
         # Use the adapter's get_model_name method.
         model_name = self.get_model_name(model)
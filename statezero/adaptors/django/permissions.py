@@ -4,6 +4,7 @@ from typing import Any, Set, Type
 from django.contrib.auth import get_user_model
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
+from django.db.models import Q
 from django.utils.module_loading import import_string
 from rest_framework.permissions import AllowAny, BasePermission
 
@@ -19,6 +20,12 @@ class AllowAllPermission(AbstractPermission):
     def filter_queryset(self, request: RequestType, queryset: Any) -> Any:
         return queryset
 
+    def filter_condition(self, request: RequestType, model: Type) -> Any:
+        # Subclasses that narrow filter_queryset must describe their own condition
+        if type(self).filter_queryset is not AllowAllPermission.filter_queryset:
+            return None
+        return Q()
+
     def allowed_actions(self, request: RequestType, model: Type[ORMModel]) -> Set[ActionType]:  # type: ignore
         return {
             ActionType.CREATE,
@@ -55,6 +62,12 @@ class AllowAllPermission(AbstractPermission):
             return self._get_user_fields()
         return "__all__"
 
+    def cache_fingerprint(self, request: RequestType, model: Type):
+        # Subclasses may make their answers depend on the request
+        if type(self) is not AllowAllPermission:
+            return None
+        return "allow_all"
+
 class IsAuthenticatedPermission(AbstractPermission):
     """
     Permission class that allows access only to authenticated users.
@@ -66,6 +79,11 @@ class IsAuthenticatedPermission(AbstractPermission):
             return queryset.none()
         return queryset
 
+    def filter_condition(self, request: RequestType, model: Type) -> Any:
+        if type(self).filter_queryset is not IsAuthenticatedPermission.filter_queryset:
+            return None
+        return Q() if request.user.is_authenticated else Q(pk__in=[])
+
     def allowed_actions(
         self, request: RequestType, model: Type[ORMModel]
     ) -> Set[ActionType]:
@@ -116,6 +134,12 @@ class IsAuthenticatedPermission(AbstractPermission):
             return self._get_user_fields()
         return "__all__"
 
+    def cache_fingerprint(self, request: RequestType, model: Type):
+        # Subclasses may make their answers depend on the request
+        if type(self) is not IsAuthenticatedPermission:
+            return None
+        return "authenticated" if request.user.is_authenticated else "anonymous"
+
 
 class IsStaffPermission(AbstractPermission):
     """
@@ -128,6 +152,13 @@ class IsStaffPermission(AbstractPermission):
             return queryset.none()
         return queryset
 
+    def filter_condition(self, request: RequestType, model: Type) -> Any:
+        if type(self).filter_queryset is not IsStaffPermission.filter_queryset:
+            return None
+        if request.user.is_authenticated and request.user.is_staff:
+            return Q()
+        return Q(pk__in=[])
+
     def allowed_actions(
         self, request: RequestType, model: Type[ORMModel]
     ) -> Set[ActionType]:
@@ -178,6 +209,12 @@ class IsStaffPermission(AbstractPermission):
             return self._get_user_fields()
         return "__all__"
 
+    def cache_fingerprint(self, request: RequestType, model: Type):
+        # Subclasses may make their answers depend on the request
+        if type(self) is not IsStaffPermission:
+            return None
+        return "staff" if request.user.is_authenticated and request.user.is_staff else "non_staff"
+
 
 class ORMBridgeViewAccessGate(BasePermission):
     """
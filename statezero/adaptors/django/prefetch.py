@@ -0,0 +1,161 @@
+"""
+Chunked pk-IN prefetching.
+
+Django prefetches each relation with a single ``WHERE fk IN (...)`` holding
+every pk of the level above. On large pages that exceeds SQLite's variable
+limit and gives Postgres very long parameter lists to plan.
+``chunked_prefetch_related_objects`` walks the lookups one relation at a time
+and runs each step with Django's own ``prefetch_related_objects`` on chunks of
+at most ``STATEZERO_PK_IN_BATCH_SIZE`` instances (default 1000), so every
+level fills the normal prefetch caches.
+
+Querysets returned by the query optimizer use it through
+``with_chunked_prefetch``. ``pk_in_batches`` builds the filters for pk batches
+issued directly; with ``STATEZERO_POSTGRES_ANY_ARRAYS = True`` it binds the
+whole list as one array (``= ANY(%s)``) on Postgres instead of chunking.
+"""
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type
+
+from django.conf import settings
+from django.db import connections, models
+from django.db.models import F, Lookup, Prefetch, Q, prefetch_related_objects
+from django.db.models.constants import LOOKUP_SEP
+
+
+def batch_size() -> Optional[int]:
+    return getattr(settings, "STATEZERO_PK_IN_BATCH_SIZE", 1000)
+
+
+def chunks(values: List[Any], size: Optional[int]) -> Iterator[List[Any]]:
+    if not size:
+        yield values
+        return
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+class _AnyArray(Lookup):
+    """``lhs = ANY(%s)`` with the right-hand side bound as a single array."""
+
+    lookup_name = "statezero_any"
+    prepare_rhs = False
+
+    def get_db_prep_lookup(self, value, connection):
+        return "%s", [list(value)]
+
+    def as_sql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs_sql} = ANY({rhs_sql})", (*lhs_params, *rhs_params)
+
+
+def uses_any_arrays(using: str = "default") -> bool:
+    return (
+        getattr(settings, "STATEZERO_POSTGRES_ANY_ARRAYS", False)
+        and connections[using].vendor == "postgresql"
+    )
+
+
+def pk_in_batches(lookup: str, values: List[Any], using: str = "default") -> Iterator[Any]:
+    """
+    Yield filters matching ``lookup`` against ``values``: one ``= ANY`` array
+    filter on Postgres when enabled, otherwise ``__in`` filters of at most
+    ``batch_size()`` values.
+    """
+    if not values:
+        return
+    if uses_any_arrays(using):
+        yield _AnyArray(F(lookup), values)
+        return
+    for chunk in chunks(values, batch_size()):
+        yield Q(**{f"{lookup}__in": chunk})
+
+
+class ChunkedPrefetchMixin:
+    """QuerySet mixin that runs its prefetch lookups with ``chunked_prefetch_related_objects``."""
+
+    def _prefetch_related_objects(self):
+        chunked_prefetch_related_objects(self._result_cache, *self._prefetch_related_lookups)
+        self._prefetch_done = True
+
+
+_chunked_classes: Dict[Type[models.QuerySet], Type[models.QuerySet]] = {}
+
+
+def with_chunked_prefetch(queryset: models.QuerySet) -> models.QuerySet:
+    """Return a clone of ``queryset`` whose prefetches run in pk chunks."""
+    queryset_class = type(queryset)
+    if issubclass(queryset_class, ChunkedPrefetchMixin):
+        return queryset
+    chunked_class = _chunked_classes.get(queryset_class)
+    if chunked_class is None:
+        chunked_class = _chunked_classes[queryset_class] = type(
+            f"Chunked{queryset_class.__name__}", (ChunkedPrefetchMixin, queryset_class), {}
+        )
+    queryset = queryset._chain()
+    queryset.__class__ = chunked_class
+    return queryset
+
+
+def chunked_prefetch_related_objects(instances: Iterable[models.Model], *lookups) -> None:
+    """
+    ``prefetch_related_objects`` that fetches one relation at a time, on
+    chunks of at most ``batch_size()`` instances per query.
+    """
+    instances = list(instances)
+    if not instances or not lookups:
+        return
+    size = batch_size()
+
+    # Group lookups by their first relation; the rest applies to the related objects
+    steps: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    for lookup in lookups:
+        if not isinstance(lookup, Prefetch):
+            lookup = Prefetch(lookup)
+        through, _, rest = lookup.prefetch_through.partition(LOOKUP_SEP)
+        step = steps.setdefault(through, {"own": None, "rest": []})
+        if rest:
+            step["rest"].append(Prefetch(rest, queryset=lookup.queryset, to_attr=lookup.to_attr))
+        else:
+            step["own"] = lookup
+
+    for through, step in steps.items():
+        own = step["own"]
+        nested = list(step["rest"])
+        if own is not None and own.queryset is not None:
+            queryset = own.queryset
+            # Lookups on the prefetched queryset apply to the next level; run them chunked too
+            nested = list(queryset._prefetch_related_lookups) + nested
+            own = Prefetch(through, queryset=queryset.prefetch_related(None), to_attr=own.to_attr)
+        hop = own or through
+
+        for chunk in chunks(instances, size):
+            prefetch_related_objects(chunk, hop)
+
+        if nested:
+            attribute = own.to_attr if own is not None and own.to_attr else through
+            chunked_prefetch_related_objects(_related_objects(instances, attribute), *nested)
+
+
+def _related_objects(instances: List[models.Model], attribute: str) -> List[models.Model]:
+    """The distinct objects reached through ``attribute``, read from the prefetch caches."""
+    related: List[models.Model] = []
+    seen = set()
+    for instance in instances:
+        cache = getattr(instance, "_prefetched_objects_cache", {})
+        if attribute in cache:
+            values = list(cache[attribute])
+        else:
+            try:
+                value = getattr(instance, attribute)
+            except models.ObjectDoesNotExist:
+                continue
+            if value is None:
+                continue
+            values = value if isinstance(value, list) else [value]
+        for value in values:
+            if id(value) not in seen:
+                seen.add(id(value))
+                related.append(value)
+    return related
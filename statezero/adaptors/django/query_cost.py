@@ -0,0 +1,147 @@
+"""
+Cost estimates for loading foreign keys with a JOIN or a separate query.
+
+``select_related`` repeats the related row's columns on every row that
+references it, while a pk-IN prefetch fetches each distinct related row once
+at the price of an extra round trip and the pk list. For a foreign key
+reached by ``rows`` rows, with a related row width ``width`` (including
+everything joined beneath it) and a fan-out ``fanout`` (rows sharing the
+same related row), the optimizer compares::
+
+    join     = rows * width
+    prefetch = ROUNDTRIP + rows / fanout * width + rows * PK_PARAM
+
+Widths come from ``QueryCostHints.row_width`` or the column types; fan-out
+from ``QueryCostHints.fanout``, or from sampling the table when
+``STATEZERO_OPTIMIZER_SAMPLE_SIZE`` is set. Without either, fan-out is 1
+and the JOIN always wins, which is the optimizer's historical behaviour.
+
+Settings:
+    STATEZERO_OPTIMIZER_ESTIMATED_ROWS: rows a read is expected to return (default 100)
+    STATEZERO_OPTIMIZER_ROUNDTRIP_COST: cost of one extra query, in bytes (default 4096)
+    STATEZERO_OPTIMIZER_SAMPLE_SIZE: rows sampled to estimate fan-out (default 0, off)
+"""
+import logging
+from typing import Dict, Iterable, Optional, Tuple, Type
+
+from django.conf import settings
+from django.db import models
+
+logger = logging.getLogger(__name__)
+
+# Bytes per row transferred for each value in the pk-IN list
+_PK_PARAM_COST = 8
+
+_COLUMN_WIDTHS = {
+    "AutoField": 4,
+    "BigAutoField": 8,
+    "SmallAutoField": 2,
+    "IntegerField": 4,
+    "BigIntegerField": 8,
+    "SmallIntegerField": 2,
+    "PositiveIntegerField": 4,
+    "PositiveBigIntegerField": 8,
+    "PositiveSmallIntegerField": 2,
+    "BooleanField": 1,
+    "FloatField": 8,
+    "DecimalField": 8,
+    "DateField": 4,
+    "DateTimeField": 8,
+    "TimeField": 8,
+    "DurationField": 8,
+    "UUIDField": 16,
+    "ForeignKey": 8,
+    "OneToOneField": 8,
+}
+_LARGE_COLUMN_WIDTH = 256
+_DEFAULT_COLUMN_WIDTH = 32
+
+_sampled_fanouts: Dict[Tuple[Type[models.Model], str], float] = {}
+
+
+def estimated_rows() -> int:
+    return getattr(settings, "STATEZERO_OPTIMIZER_ESTIMATED_ROWS", 100)
+
+
+def roundtrip_cost() -> int:
+    return getattr(settings, "STATEZERO_OPTIMIZER_ROUNDTRIP_COST", 4096)
+
+
+def _cost_hints(model: Type[models.Model]):
+    from statezero.adaptors.django.config import registry
+
+    try:
+        return registry.get_config(model).query_cost
+    except ValueError:
+        return None
+
+
+def column_width(field: models.Field) -> int:
+    internal_type = field.get_internal_type()
+    if internal_type in _COLUMN_WIDTHS:
+        return _COLUMN_WIDTHS[internal_type]
+    if internal_type in ("CharField", "SlugField", "EmailField", "URLField", "FileField", "ImageField"):
+        # Assume strings are half full on average
+        return max((field.max_length or _LARGE_COLUMN_WIDTH) // 2, 1)
+    if internal_type in ("TextField", "JSONField", "BinaryField"):
+        return _LARGE_COLUMN_WIDTH
+    return _DEFAULT_COLUMN_WIDTH
+
+
+def row_width(model: Type[models.Model], loaded_fields: Optional[Iterable[str]] = None) -> int:
+    """
+    Estimated bytes per row of ``model`` when loading ``loaded_fields``
+    (all concrete fields if None).
+    """
+    hints = _cost_hints(model)
+    if hints is not None and hints.row_width is not None:
+        return hints.row_width
+    concrete = model._meta.concrete_fields
+    if loaded_fields is not None:
+        loaded = set(loaded_fields) | {model._meta.pk.name}
+        concrete = [field for field in concrete if field.name in loaded]
+    return sum(column_width(field) for field in concrete)
+
+
+def fanout(model: Type[models.Model], field: models.Field) -> Tuple[float, str]:
+    """
+    Average number of ``model`` rows that reference the same row through
+    ``field``, and where the estimate came from.
+    """
+    if field.one_to_one:
+        return 1.0, "one-to-one"
+    hints = _cost_hints(model)
+    if hints is not None and field.name in hints.fanout:
+        return float(hints.fanout[field.name]), "hint"
+
+    sample_size = getattr(settings, "STATEZERO_OPTIMIZER_SAMPLE_SIZE", 0)
+    if sample_size:
+        key = (model, field.name)
+        if key not in _sampled_fanouts:
+            _sampled_fanouts[key] = _sample_fanout(model, field, sample_size)
+        return _sampled_fanouts[key], "sampled"
+    return 1.0, "default"
+
+
+def _sample_fanout(model: Type[models.Model], field: models.Field, sample_size: int) -> float:
+    values = [
+        value
+        for value in model._base_manager.order_by().values_list(field.attname, flat=True)[:sample_size]
+        if value is not None
+    ]
+    if not values:
+        return 1.0
+    estimate = len(values) / len(set(values))
+    logger.debug(f"Sampled fan-out of {model.__name__}.{field.name}: {estimate:.2f}")
+    return estimate
+
+
+def clear_sampled_statistics() -> None:
+    _sampled_fanouts.clear()
+
+
+def compare_join_and_prefetch(rows: float, width: int, estimated_fanout: float) -> Tuple[float, float]:
+    """Return (join cost, prefetch cost) for a foreign key, as described in the module docstring."""
+    join = rows * width
+    prefetch = roundtrip_cost() + rows / max(estimated_fanout, 1.0) * width + rows * _PK_PARAM_COST
+    return join, prefetch
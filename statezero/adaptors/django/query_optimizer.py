@@ -8,9 +8,16 @@ from typing import Optional, Dict, Set, Callable, Type, Any, List, Union
 from django.db.models import Model
 from django.core.exceptions import FieldDoesNotExist, FieldError
 from django.db.models.constants import LOOKUP_SEP
+from collections import OrderedDict
 from contextvars import ContextVar
+import threading
 
+from django.conf import settings
+
+from statezero.adaptors.django import query_cost
+from statezero.adaptors.django.prefetch import with_chunked_prefetch
 from statezero.core.interfaces import AbstractQueryOptimizer
+from statezero.core.telemetry import get_telemetry_context
 
 logger = logging.getLogger(__name__)
 
@@ -316,6 +323,261 @@ def _find_prefetch_split(start_model, path):
         logger.warning(f"Path '{path}' ended up in prefetch logic but contained no prefetch relation.")
         return None, None, None
 
+def _prefetch_only_fields(related_model, fields_map, get_model_name):
+    """Fields to load with .only() on a prefetched queryset of related_model."""
+    related_model_name = get_model_name(related_model)
+    related_fields_to_fetch = set()
+
+    if fields_map and related_model_name in fields_map:
+        # Process each field, checking for custom serializers
+        from statezero.adaptors.django.serializers import get_custom_serializer
+        related_meta = _get_model_meta(related_model)
+        for field_name in fields_map[related_model_name]:
+            try:
+                field_obj = related_meta.get_field(field_name)
+                if not field_obj.is_relation:
+                    # Check if this field has a custom serializer with explicit DB field requirements
+                    custom_serializer = get_custom_serializer(field_obj.__class__)
+                    if custom_serializer and hasattr(custom_serializer, 'get_prefetch_db_fields'):
+                        # Use the explicit list from the custom serializer
+                        db_fields = custom_serializer.get_prefetch_db_fields(field_name)
+                        for db_field in db_fields:
+                            related_fields_to_fetch.add(db_field)
+                        logger.debug(f"Using custom DB fields {db_fields} for field '{field_name}' in {related_model_name}")
+                    else:
+                        # No custom serializer, just add the field itself
+                        related_fields_to_fetch.add(field_name)
+                else:
+                    # Relation field, add as-is
+                    related_fields_to_fetch.add(field_name)
+            except FieldDoesNotExist:
+                # Field doesn't exist, add it anyway (might be computed)
+                related_fields_to_fetch.add(field_name)
+            except Exception as e:
+                logger.error(f"Error checking custom serializer for field '{field_name}' in {related_model_name}: {e}")
+                # On error, add the field anyway to be safe
+                related_fields_to_fetch.add(field_name)
+    else:
+        # If no field restrictions are provided, get all fields
+        all_fields = [f.name for f in related_model._meta.get_fields() if f.concrete]
+        related_fields_to_fetch.update(all_fields)
+        logger.debug(f"No fields_map provided for {related_model_name}.  Fetching all fields.")
+
+    # Always add PK
+    related_fields_to_fetch.add(related_model._meta.pk.name)
+    return related_fields_to_fetch
+
+
+def _fresh_prefetch(prefetch):
+    """
+    Copy a cached Prefetch, with a cloned queryset, for one use.
+
+    Django mutates Prefetch objects and their querysets while prefetching, so
+    the ones held by a cached plan are never handed out directly.
+    """
+    if not isinstance(prefetch, Prefetch):
+        return prefetch
+    queryset = prefetch.queryset
+    if queryset is not None:
+        nested = [_fresh_prefetch(lookup) for lookup in queryset._prefetch_related_lookups]
+        queryset = queryset.all()
+        if nested:
+            queryset = queryset.prefetch_related(None).prefetch_related(*nested)
+    return Prefetch(prefetch.prefetch_through, queryset=queryset, to_attr=prefetch.to_attr)
+
+
+class OptimizationPlan:
+    """
+    The select_related paths, annotations, Prefetch objects and .only() fields
+    computed for one model and field selection. Plans hold no per-request state
+    and can be applied to any queryset of the model.
+    """
+
+    __slots__ = ("select_related", "annotations", "prefetches", "only_fields", "report")
+
+    def __init__(self, select_related=(), annotations=None, prefetches=None, only_fields=None):
+        self.select_related = tuple(select_related)
+        self.annotations = annotations or {}
+        self.prefetches = prefetches or []
+        self.only_fields = only_fields
+        # How each foreign key is loaded and why, reported through telemetry
+        self.report = []
+
+    def apply(self, queryset):
+        if self.report:
+            telemetry_ctx = get_telemetry_context()
+            if telemetry_ctx:
+                telemetry_ctx.record_query_plan(queryset.model.__name__, self.report)
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.annotations:
+            queryset = queryset.annotate(**self.annotations)
+        if self.prefetches:
+            prefetches = [_fresh_prefetch(prefetch) for prefetch in self.prefetches]
+            queryset = with_chunked_prefetch(queryset.prefetch_related(*prefetches))
+        if self.only_fields:
+            queryset = queryset.only(*self.only_fields)
+        return queryset
+
+
+class _RelationPlanner:
+    """
+    Decides how rows reached through foreign keys are loaded: joined with
+    select_related, or fetched with a Prefetch when the related model's repr
+    is computed in SQL or the cost model (see query_cost) finds a separate
+    query cheaper. Every decision is added to ``report``.
+    """
+
+    def __init__(self, fields_map, get_model_name, wants_sql_repr):
+        self.fields_map = fields_map
+        self.get_model_name = get_model_name
+        self.wants_sql_repr = wants_sql_repr
+        self.report = []
+
+    def plan(self, model, select_paths, rows, report_prefix=""):
+        """Plan select_related(select_paths) on model for an estimated number of rows."""
+        from statezero.adaptors.django.helpers import get_repr_annotations
+
+        tree = {}
+        for path in select_paths:
+            node = tree
+            for part in path.split(LOOKUP_SEP):
+                node = node.setdefault(part, {})
+
+        selects, prefetches = [], []
+        self._walk(model, tree, rows, "", report_prefix, selects, prefetches)
+        annotations = get_repr_annotations(model) if self.wants_sql_repr(model) else {}
+        return OptimizationPlan(sorted(remove_redundant_paths(selects)), annotations, prefetches)
+
+    def _walk(self, model, tree, rows, path_prefix, report_prefix, selects, prefetches):
+        for name, subtree in sorted(tree.items()):
+            field = _get_model_meta(model).get_field(name)
+            related_model = field.related_model
+            path = path_prefix + name
+            estimated_fanout = self._choose(model, field, related_model, subtree, rows, report_prefix + path)
+            if estimated_fanout is None:
+                selects.append(path)
+                self._walk(related_model, subtree, rows, path + LOOKUP_SEP, report_prefix, selects, prefetches)
+                continue
+
+            inner_plan = self.plan(
+                related_model,
+                _flatten_tree(subtree),
+                rows / estimated_fanout,
+                report_prefix + path + LOOKUP_SEP,
+            )
+            inner_plan.only_fields = sorted(
+                _prefetch_only_fields(related_model, self.fields_map, self.get_model_name)
+            )
+            logger.info(f"Prepared Prefetch('{path}') for {related_model.__name__}")
+            prefetches.append(Prefetch(path, queryset=inner_plan.apply(related_model._base_manager.all())))
+
+    def _choose(self, model, field, related_model, subtree, rows, report_path):
+        """Return the estimated fan-out if the relation should be prefetched, else None."""
+        estimated_fanout, fanout_source = query_cost.fanout(model, field)
+        estimated_fanout = max(estimated_fanout, 1.0)
+        width = self._joined_width(related_model, subtree)
+        join_cost, prefetch_cost = query_cost.compare_join_and_prefetch(rows, width, estimated_fanout)
+
+        if self.wants_sql_repr(related_model):
+            choice, reason = "prefetch", "repr computed in SQL"
+        elif prefetch_cost < join_cost:
+            choice, reason = "prefetch", "cheaper than joining"
+        else:
+            choice, reason = "select_related", "cheaper than prefetching"
+
+        self.report.append({
+            "path": report_path,
+            "model": self.get_model_name(model),
+            "related_model": self.get_model_name(related_model),
+            "choice": choice,
+            "reason": reason,
+            "rows": round(rows, 2),
+            "row_width": width,
+            "fanout": round(estimated_fanout, 2),
+            "fanout_source": fanout_source,
+            "join_cost": round(join_cost),
+            "prefetch_cost": round(prefetch_cost),
+        })
+        return estimated_fanout if choice == "prefetch" else None
+
+    def _joined_width(self, model, tree):
+        """Width of model's row plus everything joined beneath it."""
+        loaded_fields = None
+        if self.fields_map:
+            loaded_fields = self.fields_map.get(self.get_model_name(model))
+        width = query_cost.row_width(model, loaded_fields)
+        for name, subtree in tree.items():
+            width += self._joined_width(_get_model_meta(model).get_field(name).related_model, subtree)
+        return width
+
+
+def _flatten_tree(tree, prefix=""):
+    paths = []
+    for name, subtree in tree.items():
+        path = prefix + name
+        paths.append(path)
+        paths.extend(_flatten_tree(subtree, path + LOOKUP_SEP))
+    return paths
+
+
+class _OptimizationPlanCache:
+    """
+    Process-wide LRU of optimization plans, keyed by model, requested fields,
+    fields_map, depth and use_only. Plans only depend on model metadata and
+    registry configuration, which are fixed once apps are loaded.
+    """
+
+    def __init__(self):
+        self._entries: "OrderedDict[tuple, OptimizationPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _max_entries() -> int:
+        return getattr(settings, "STATEZERO_QUERY_PLAN_CACHE_SIZE", 1024)
+
+    def get(self, key: tuple) -> Optional[OptimizationPlan]:
+        with self._lock:
+            plan = self._entries.get(key)
+            if plan is not None:
+                self._entries.move_to_end(key)
+            return plan
+
+    def set(self, key: tuple, plan: OptimizationPlan) -> None:
+        max_entries = self._max_entries()
+        if not max_entries:
+            return
+        with self._lock:
+            self._entries[key] = plan
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_optimization_plans = _OptimizationPlanCache()
+
+
+def clear_optimization_plan_cache() -> None:
+    """Drop every cached optimization plan (e.g. after registry configuration changes)."""
+    _optimization_plans.clear()
+    query_cost.clear_sampled_statistics()
+
+
+def _plan_cache_key(model, fields, fields_map, depth, use_only, get_model_name):
+    return (
+        model,
+        frozenset(fields) if fields else None,
+        frozenset((name, frozenset(names)) for name, names in fields_map.items()) if fields_map else None,
+        depth,
+        use_only,
+        get_model_name,
+    )
+
+
 # ================================================================
 # MAIN OPTIMIZATION FUNCTION
 # ================================================================
@@ -343,12 +605,33 @@ def optimize_query(queryset, fields=None, fields_map=None, depth=0, use_only=Tru
         raise TypeError("queryset must be a Django QuerySet instance.")
 
     model = queryset.model
-    _clear_meta_cache()
 
     # Validate get_model_name if fields_map is used or fields is used along with fields_map
     if (fields_map or fields) and not callable(get_model_name):
         raise ValueError("If 'fields_map' or 'fields' with 'fields_map' is provided, 'get_model_name' must be a callable function.")
 
+    if not fields and not fields_map:
+        logger.info("No fields or fields_map specified, returning original queryset.")
+        return queryset
+
+    key = _plan_cache_key(model, fields, fields_map, depth, use_only, get_model_name)
+    plan = _optimization_plans.get(key)
+    if plan is None:
+        plan = build_optimization_plan(model, fields, fields_map, depth, use_only, get_model_name)
+        _optimization_plans.set(key, plan)
+    return plan.apply(queryset)
+
+
+def build_optimization_plan(model, fields=None, fields_map=None, depth=0, use_only=True, get_model_name=None):
+    """
+    Work out the select_related, prefetch_related and .only() calls for
+    optimize_query. See optimize_query for the arguments.
+
+    Returns:
+        OptimizationPlan
+    """
+    _clear_meta_cache()
+
     # 1. Generate paths either from explicit field list or fields_map/depth
     if fields:
         try:
@@ -380,8 +663,8 @@ def optimize_query(queryset, fields=None, fields_map=None, depth=0, use_only=Tru
 
 
     else:
-        logger.info("No fields or fields_map specified, returning original queryset.")
-        return queryset
+        logger.info("No fields or fields_map specified, nothing to optimize.")
+        return OptimizationPlan()
 
     # --- Continue with optimization ---
     try:
@@ -403,12 +686,23 @@ def optimize_query(queryset, fields=None, fields_map=None, depth=0, use_only=Tru
 
         prefetch_data = {} # Dictionary to store Prefetch build info
 
+        # Models whose repr is computed in SQL get it annotated wherever they are loaded
+        from statezero.adaptors.django.helpers import get_repr_annotations
+        sql_repr_models = {}
+
+        def wants_sql_repr(related_model):
+            if related_model not in sql_repr_models:
+                serialized = not fields_map or get_model_name(related_model) in fields_map
+                sql_repr_models[related_model] = serialized and bool(get_repr_annotations(related_model))
+            return sql_repr_models[related_model]
+
         # Apply top-level select_related first
         if final_select_related:
             logger.info(f"Applying select_related({final_select_related})")
-            queryset = queryset.select_related(*final_select_related)
         else:
             logger.info("No select_related paths to apply.")
+        planner = _RelationPlanner(fields_map, get_model_name, wants_sql_repr)
+        plan = planner.plan(model, final_select_related, query_cost.estimated_rows())
 
         # ================================================================
         # Build Prefetch objects
@@ -469,50 +763,16 @@ def optimize_query(queryset, fields=None, fields_map=None, depth=0, use_only=Tru
             final_nested_selects = remove_redundant_paths(pf_info['nested_selects'])
             if final_nested_selects:
                 logger.debug(f"  Applying nested select_related({final_nested_selects}) within Prefetch('{root_pf_path}')")
-                inner_queryset = inner_queryset.select_related(*final_nested_selects)
+            inner_queryset = planner.plan(
+                related_model,
+                final_nested_selects,
+                query_cost.estimated_rows(),
+                root_pf_path + LOOKUP_SEP,
+            ).apply(inner_queryset)
 
             # --- Apply .only() to the INNER queryset (the one *being* prefetched) ---
             related_model_name = get_model_name(related_model)
-
-            related_fields_to_fetch = set()
-
-            if fields_map and related_model_name in fields_map:
-                # Process each field, checking for custom serializers
-                from statezero.adaptors.django.serializers import get_custom_serializer
-                related_meta = _get_model_meta(related_model)
-                for field_name in fields_map[related_model_name]:
-                    try:
-                        field_obj = related_meta.get_field(field_name)
-                        if not field_obj.is_relation:
-                            # Check if this field has a custom serializer with explicit DB field requirements
-                            custom_serializer = get_custom_serializer(field_obj.__class__)
-                            if custom_serializer and hasattr(custom_serializer, 'get_prefetch_db_fields'):
-                                # Use the explicit list from the custom serializer
-                                db_fields = custom_serializer.get_prefetch_db_fields(field_name)
-                                for db_field in db_fields:
-                                    related_fields_to_fetch.add(db_field)
-                                logger.debug(f"Using custom DB fields {db_fields} for field '{field_name}' in {related_model_name}")
-                            else:
-                                # No custom serializer, just add the field itself
-                                related_fields_to_fetch.add(field_name)
-                        else:
-                            # Relation field, add as-is
-                            related_fields_to_fetch.add(field_name)
-                    except FieldDoesNotExist:
-                        # Field doesn't exist, add it anyway (might be computed)
-                        related_fields_to_fetch.add(field_name)
-                    except Exception as e:
-                        logger.error(f"Error checking custom serializer for field '{field_name}' in {related_model_name}: {e}")
-                        # On error, add the field anyway to be safe
-                        related_fields_to_fetch.add(field_name)
-            else:
-                # If no field restrictions are provided, get all fields
-                all_fields = [f.name for f in related_model._meta.get_fields() if f.concrete]
-                related_fields_to_fetch.update(all_fields)
-                logger.debug(f"No fields_map provided for {related_model_name}.  Fetching all fields.")
-
-            # Always add PK
-            related_fields_to_fetch.add(related_model._meta.pk.name)
+            related_fields_to_fetch = _prefetch_only_fields(related_model, fields_map, get_model_name)
 
             if related_fields_to_fetch:
                 logger.debug(f"  Applying .only({related_fields_to_fetch}) to inner queryset for Prefetch('{root_pf_path}')")
@@ -539,7 +799,7 @@ def optimize_query(queryset, fields=None, fields_map=None, depth=0, use_only=Tru
         # Apply prefetch_related with the constructed objects
         if prefetch_objects:
             logger.info(f"Applying prefetch_related with {len(prefetch_objects)} optimized Prefetch objects.")
-            queryset = queryset.prefetch_related(*prefetch_objects) # Apply unique prefetches
+            plan.prefetches.extend(prefetch_objects) # Apply unique prefetches
         else:
              logger.info("No prefetch_related paths requiring optimized Prefetch objects.")
 
@@ -605,11 +865,7 @@ def optimize_query(queryset, fields=None, fields_map=None, depth=0, use_only=Tru
         # Apply .only() based on the apply_only flag (which depends on use_only)
         if apply_only:
             logger.info(f"Applying .only({root_fields_to_fetch}) to root queryset.")
-            try:
-                 queryset = queryset.only(*root_fields_to_fetch)
-            except FieldError as e:
-                 logger.error(f"FieldError applying .only({root_fields_to_fetch}) to {model.__name__}: {e}. Check for conflicts with annotations or ordering.")
-                 raise # Re-raise FieldError as it indicates a real problem
+            plan.only_fields = sorted(root_fields_to_fetch)
         # No 'elif apply_defer' block anymore
         else:
              # This logs if use_only=False OR if use_only=True but no fields were calculated
@@ -630,9 +886,10 @@ def optimize_query(queryset, fields=None, fields_map=None, depth=0, use_only=Tru
         _clear_meta_cache()
         raise e
 
+    plan.report = planner.report
     _clear_meta_cache()
     logger.debug(f"--- Optimization finished for {model.__name__} ---")
-    return queryset
+    return plan
 
 # ================================================================
 # generate_paths Helper (No changes needed from original provided)
@@ -0,0 +1,122 @@
+"""
+Bulk update and delete with an exact affected set.
+
+A bulk update that re-reads the rows afterwards runs a second query, and it
+misses rows whose filtered column the update just changed. On PostgreSQL
+``update_returning`` issues ``UPDATE ... RETURNING`` and builds the updated
+instances from the returned columns, so the write and its result are one
+statement. ``delete_returning`` takes the deleted pks from the deletion
+collector when Django has to load the rows anyway (cascades or delete
+signals), and otherwise issues ``DELETE ... RETURNING pk`` on PostgreSQL.
+
+Other vendors fall back to a pk snapshot taken before the write: the update
+callers reload the rows by pk, and deletes snapshot the pks.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, models, transaction
+from django.db.models.deletion import Collector
+from django.db.models.sql import DeleteQuery, UpdateQuery
+
+
+def supports_returning(using: str) -> bool:
+    return connections[using].vendor == "postgresql"
+
+
+def _returning(using: str, sql: str, params: Any, columns: List[str]) -> List[Tuple[Any, ...]]:
+    connection = connections[using]
+    quoted = ", ".join(connection.ops.quote_name(column) for column in columns)
+    with transaction.mark_for_rollback_on_error(using=using):
+        with connection.cursor() as cursor:
+            cursor.execute(f"{sql} RETURNING {quoted}", params)
+            return cursor.fetchall()
+
+
+def _concrete_fields(model: type, field_names: Iterable[str]) -> Optional[List[models.Field]]:
+    """The concrete fields behind ``field_names`` plus the pk, in model order."""
+    opts = model._meta
+    wanted = {opts.pk.attname}
+    for name in field_names:
+        try:
+            field = opts.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.many_to_many:
+            return None
+        wanted.add(field.attname)
+    return [field for field in opts.concrete_fields if field.attname in wanted]
+
+
+def update_returning(
+    queryset: models.QuerySet, values: Dict[str, Any], field_names: Iterable[str]
+) -> Optional[List[models.Model]]:
+    """
+    Run ``queryset.update(**values)`` as one ``UPDATE ... RETURNING`` and
+    return the updated instances, loaded with ``field_names`` and the pk.
+
+    Returns None without writing when RETURNING cannot be used, so the caller
+    runs a plain update instead.
+    """
+    using = queryset.db
+    model = queryset.model
+    if not supports_returning(using):
+        return None
+    fields = _concrete_fields(model, field_names)
+    if fields is None:
+        return None
+
+    query = queryset.query.chain(UpdateQuery)
+    query.add_update_values(values)
+    # Parent-table (multi-table inheritance) updates are separate statements
+    if query.related_updates:
+        return None
+    query.annotations = {}
+    sql, params = query.get_compiler(using).as_sql()
+    if not sql:
+        return []
+
+    connection = connections[using]
+    columns = [field.get_col(model._meta.db_table) for field in fields]
+    converters = [
+        connection.ops.get_db_converters(column) + column.get_db_converters(connection)
+        for column in columns
+    ]
+    attnames = [field.attname for field in fields]
+
+    instances = []
+    for row in _returning(using, sql, params, [field.column for field in fields]):
+        row = list(row)
+        for index, column in enumerate(columns):
+            for converter in converters[index]:
+                row[index] = converter(row[index], column, connection)
+        instances.append(model.from_db(using, attnames, row))
+    return instances
+
+
+def delete_returning(queryset: models.QuerySet) -> Tuple[int, List[Any]]:
+    """Delete the rows of ``queryset`` and return the deleted count and pks."""
+    model = queryset.model
+    del_query = queryset._chain()
+    del_query._for_write = True
+    del_query.query.select_for_update = False
+    del_query.query.select_related = False
+    del_query.query.clear_ordering(force=True)
+    using = del_query.db
+
+    collector = Collector(using=using, origin=queryset)
+    if not collector.can_fast_delete(del_query):
+        # Cascades or signals: the collector loads the rows itself
+        collector.collect(del_query)
+        pks = sorted(instance.pk for instance in collector.data.get(model, ()))
+        deleted, _ = collector.delete()
+        return deleted, pks
+
+    if supports_returning(using):
+        sql, params = del_query.query.chain(DeleteQuery).get_compiler(using).as_sql()
+        pks = [row[0] for row in _returning(using, sql, params, [model._meta.pk.column])]
+        return len(pks), pks
+
+    pks = list(del_query.values_list("pk", flat=True))
+    deleted, _ = del_query.delete()
+    return deleted, pks
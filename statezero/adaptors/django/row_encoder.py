@@ -0,0 +1,381 @@
+"""
+Compiled row encoders for read responses.
+
+``DRFDynamicSerializer.serialize`` normally runs
+``serializer_class(instances, many=True).data`` for every model type, which
+goes through DRF's field machinery for each attribute of each row. A
+``RowEncoder`` is compiled once per serializer class (i.e. per model and
+allowed field set) from the serializer's own bound fields and turns
+instances straight into the ``{pk: row}`` mapping used in ``included``.
+
+Fields with a known DRF representation (plain scalars, decimals, dates,
+datetimes, FK and M2M primary keys, ``repr``) get specialised converters. Any other
+field keeps its own ``get_attribute`` / ``to_representation`` pair, so custom
+field serializers and computed fields produce exactly what DRF would.
+Serializers that override ``to_representation`` are not compiled and stay on
+the DRF path.
+
+Enabled with ``STATEZERO_FAST_SERIALIZATION = True``.
+"""
+import decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import ManyRelatedField, PKOnlyObject, PrimaryKeyRelatedField
+from rest_framework.settings import ISO_8601, api_settings
+
+from statezero.adaptors.django.helpers import (get_repr_annotations,
+                                               instance_repr, row_repr_reader)
+
+_SKIP = object()
+
+
+def _identity(value):
+    return value
+
+
+# DRF fields whose to_representation is a plain type cast
+_CAST_REPRESENTATIONS = {
+    serializers.CharField.to_representation: str,
+    serializers.IntegerField.to_representation: int,
+    serializers.FloatField.to_representation: float,
+}
+
+
+def _reads_own_attribute(field: serializers.Field, base: type) -> bool:
+    """True if ``field`` reads ``instance.<field_name>`` the way ``base`` does."""
+    return (
+        type(field).get_attribute is base.get_attribute
+        and field.source_attrs == [field.field_name]
+    )
+
+
+def _datetime_converter(field: serializers.DateTimeField, current_timezone) -> Optional[Callable[[Any], Any]]:
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+        return None
+    field_timezone = field.timezone if hasattr(field, "timezone") else current_timezone
+    enforce_timezone = field.enforce_timezone
+
+    def convert(value):
+        if isinstance(value, str):
+            return value
+        if field_timezone is not None and value.utcoffset() is not None:
+            value = value.astimezone(field_timezone)
+        else:
+            # Naive values and overflows go through DRF's own handling
+            value = enforce_timezone(value)
+        value = value.isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return convert
+
+
+def _date_converter(field: serializers.DateField) -> Optional[Callable[[Any], Any]]:
+    output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+        return None
+
+    def convert(value):
+        if isinstance(value, str):
+            return value
+        return value.isoformat()
+
+    return convert
+
+
+def _decimal_converter(field: serializers.DecimalField) -> Optional[Callable[[Any], Any]]:
+    if field.localize or type(field).quantize is not serializers.DecimalField.quantize:
+        return None
+    coerce_to_string = getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+    normalize_output = field.normalize_output
+    exponent = None
+    if field.decimal_places is not None:
+        exponent = decimal.Decimal(".1") ** field.decimal_places
+        context = decimal.getcontext().copy()
+        if field.max_digits is not None:
+            context.prec = field.max_digits
+        rounding = field.rounding
+
+    def convert(value):
+        if not isinstance(value, decimal.Decimal):
+            value = decimal.Decimal(str(value).strip())
+        if exponent is not None:
+            value = value.quantize(exponent, rounding=rounding, context=context)
+        if normalize_output:
+            value = value.normalize()
+        return "{:f}".format(value) if coerce_to_string else value
+
+    return convert
+
+
+def _scalar_converter(field: serializers.Field, current_timezone) -> Optional[Callable[[Any], Any]]:
+    """Return a converter equivalent to ``field.to_representation`` for non-None values."""
+    representation = type(field).to_representation
+    if representation in _CAST_REPRESENTATIONS:
+        return _CAST_REPRESENTATIONS[representation]
+    if representation is serializers.BooleanField.to_representation:
+        return bool
+    if representation is serializers.DateTimeField.to_representation:
+        return _datetime_converter(field, current_timezone)
+    if representation is serializers.DateField.to_representation:
+        return _date_converter(field)
+    if representation is serializers.DecimalField.to_representation:
+        return _decimal_converter(field)
+    if representation is serializers.UUIDField.to_representation and field.uuid_format == "hex_verbose":
+        return str
+    if representation is serializers.JSONField.to_representation and not field.binary:
+        return _identity
+    return None
+
+
+def _has_plain_column_value(model_field: models.Field) -> bool:
+    """
+    True if ``values()`` returns the same value as the instance attribute.
+    File fields and third-party fields may wrap the column in a descriptor.
+    """
+    return (
+        type(model_field).__module__.startswith("django.")
+        and not isinstance(model_field, models.FileField)
+    )
+
+
+def _is_pk_related(field: serializers.Field) -> bool:
+    return (
+        isinstance(field, PrimaryKeyRelatedField)
+        and type(field).to_representation is PrimaryKeyRelatedField.to_representation
+        and field.pk_field is None
+    )
+
+
+class RowEncoder:
+    """
+    Encodes model instances with a compiled plan of per-field encoders.
+
+    Each plan entry is ``(field_name, encode, row_source)``. ``encode`` takes
+    an instance and returns the representation (or ``_SKIP``). ``row_source``
+    says how the same value is read from a ``values()`` row:
+    ``("column", attname, convert)`` for a single concrete column whose
+    ``values()`` value matches the attribute, ``("many", field_name)`` for a
+    to-many pk list supplied by the caller, ``("row", read, annotations)``
+    for a value built from SQL annotations on the row, or None if it cannot be.
+
+    Datetime output depends on the active timezone, so plans are compiled
+    per timezone instead of resolving it for every value.
+    """
+
+    def __init__(self, serializer: serializers.ModelSerializer):
+        model = serializer.Meta.model
+        self.pk_name = model._meta.pk.name
+        self._serializer = serializer
+        self._fields = list(serializer._readable_fields)
+        self._concrete = {field.name: field for field in model._meta.concrete_fields}
+        self._plans: Dict[Any, tuple] = {}
+
+    def _compile(self, current_timezone) -> tuple:
+        entries = [
+            _compile_entry(self._serializer, field, self._concrete, current_timezone)
+            for field in self._fields
+        ]
+        plan = [(name, encode) for name, encode, _ in entries]
+        if all(source is not None for _, _, source in entries):
+            row_plan = [(name, source) for name, _, source in entries]
+        else:
+            row_plan = None
+        return plan, row_plan
+
+    def _current(self) -> tuple:
+        current_timezone = timezone.get_current_timezone() if settings.USE_TZ else None
+        compiled = self._plans.get(current_timezone)
+        if compiled is None:
+            compiled = self._plans[current_timezone] = self._compile(current_timezone)
+        return compiled
+
+    @property
+    def plan(self) -> List[Tuple[str, Callable[[Any], Any]]]:
+        return self._current()[0]
+
+    @property
+    def row_plan(self) -> Optional[List[Tuple[str, tuple]]]:
+        return self._current()[1]
+
+    @property
+    def supports_rows(self) -> bool:
+        return self.row_plan is not None
+
+    @property
+    def columns(self) -> List[str]:
+        """The ``values()`` columns ``encode_rows`` reads."""
+        return [source[1] for _, source in self.row_plan or () if source[0] == "column"]
+
+    @property
+    def annotations(self) -> Dict[str, Any]:
+        """The annotations ``encode_rows`` reads, to be added to the ``values()`` query."""
+        annotations = {}
+        for _, source in self.row_plan or ():
+            if source[0] == "row":
+                annotations.update(source[2])
+        return annotations
+
+    @property
+    def many_fields(self) -> List[str]:
+        """To-many fields whose pk lists ``encode_rows`` expects in each row."""
+        return [source[1] for _, source in self.row_plan or () if source[0] == "many"]
+
+    def encode(self, instances: Iterable[models.Model]) -> Dict[Any, Dict[str, Any]]:
+        """Return ``{pk: row}`` for ``instances``, matching ``serializer(many=True).data``."""
+        plan = self.plan
+        pk_name = self.pk_name
+        encoded = {}
+        for instance in instances:
+            row = {}
+            for name, encode in plan:
+                value = encode(instance)
+                if value is not _SKIP:
+                    row[name] = value
+            encoded[row.get(pk_name)] = row
+        return encoded
+
+    def encode_rows(self, rows: Iterable[Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+        """
+        Encode ``values()`` rows keyed by column attname, with the pk list of
+        every ``many_fields`` entry stored under its field name. Requires
+        ``supports_rows``.
+        """
+        row_plan = self.row_plan
+        if row_plan is None:
+            raise ValueError("This encoder has fields that cannot be read from values() rows.")
+        pk_name = self.pk_name
+        encoded = {}
+        for source in rows:
+            row = {}
+            for name, row_source in row_plan:
+                if row_source[0] == "column":
+                    value = source[row_source[1]]
+                    row[name] = None if value is None else row_source[2](value)
+                elif row_source[0] == "row":
+                    row[name] = row_source[1](source)
+                else:
+                    row[name] = source.get(row_source[1], [])
+            encoded[row.get(pk_name)] = row
+        return encoded
+
+
+def _generic_entry(field: serializers.Field):
+    """The same steps ``Serializer.to_representation`` runs for a single field."""
+    get_attribute = field.get_attribute
+    to_representation = field.to_representation
+
+    def encode(instance):
+        try:
+            attribute = get_attribute(instance)
+        except SkipField:
+            return _SKIP
+        check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+        if check_for_none is None:
+            return None
+        return to_representation(attribute)
+
+    return field.field_name, encode, None
+
+
+def _column_entry(field: serializers.Field, attname: str, convert: Callable[[Any], Any], row_safe: bool):
+    _, fallback, _ = _generic_entry(field)
+
+    def encode(instance):
+        try:
+            value = getattr(instance, attname)
+        except (KeyError, AttributeError):
+            # Let DRF apply its default / allow_null / SkipField handling
+            return fallback(instance)
+        return None if value is None else convert(value)
+
+    return field.field_name, encode, ("column", attname, convert) if row_safe else None
+
+
+def _many_related_entry(name: str):
+    def encode(instance):
+        if instance.pk is None:
+            return []
+        return [related.pk for related in getattr(instance, name).all()]
+
+    return name, encode, ("many", name)
+
+
+def _repr_entry(name: str, model):
+    read = row_repr_reader(model)
+    return name, instance_repr, ("row", read, get_repr_annotations(model)) if read else None
+
+
+def _compile_entry(
+    serializer: serializers.ModelSerializer,
+    field: serializers.Field,
+    concrete: Dict[str, models.Field],
+    current_timezone,
+):
+    from statezero.adaptors.django.serializers import DynamicModelSerializer
+
+    name = field.field_name
+
+    if (
+        isinstance(field, serializers.SerializerMethodField)
+        and field.method_name == "get_repr"
+        and type(serializer).get_repr is DynamicModelSerializer.get_repr
+    ):
+        return _repr_entry(name, serializer.Meta.model)
+
+    if isinstance(field, ManyRelatedField):
+        if _is_pk_related(field.child_relation) and _reads_own_attribute(field, ManyRelatedField):
+            return _many_related_entry(name)
+        return _generic_entry(field)
+
+    model_field = concrete.get(name)
+    if model_field is None:
+        return _generic_entry(field)
+
+    if isinstance(field, PrimaryKeyRelatedField):
+        if (
+            _is_pk_related(field)
+            and _reads_own_attribute(field, PrimaryKeyRelatedField)
+            and field.use_pk_only_optimization()
+            and model_field.is_relation
+        ):
+            # DRF reads the FK column through a PKOnlyObject and returns its value
+            return _column_entry(field, model_field.attname, _identity, row_safe=True)
+        return _generic_entry(field)
+
+    if model_field.is_relation or not _reads_own_attribute(field, serializers.Field):
+        return _generic_entry(field)
+
+    convert = _scalar_converter(field, current_timezone)
+    row_safe = _has_plain_column_value(model_field)
+    if convert is None:
+        # Custom field serializers and other fields keep their own representation
+        convert = field.to_representation
+        row_safe = row_safe and type(field).__module__.startswith("rest_framework.")
+    return _column_entry(field, model_field.attname, convert, row_safe)
+
+
+def compile_row_encoder(serializer_class) -> Optional[RowEncoder]:
+    """
+    Compile a ``RowEncoder`` for a ``DynamicModelSerializer`` class. Must be
+    called inside the ``fields_map_context`` the class was built for. Returns
+    None when the serializer cannot be compiled.
+    """
+    if serializer_class.to_representation is not serializers.Serializer.to_representation:
+        return None
+
+    return RowEncoder(serializer_class())
+
+
+def get_row_encoder(serializer_class) -> Optional[RowEncoder]:
+    """Return the compiled encoder for ``serializer_class``, compiling it on first use."""
+    if "_row_encoder" not in serializer_class.__dict__:
+        serializer_class._row_encoder = compile_row_encoder(serializer_class)
+    return serializer_class.__dict__["_row_encoder"]
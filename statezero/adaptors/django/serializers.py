@@ -1,11 +1,14 @@
-from typing import Any, Dict, List, Optional, Set, Type, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Type, Union
 from django.db import models
 from django.db.models.fields.related import ForeignObjectRel, ManyToOneRel, ManyToManyRel, OneToOneRel
 from django.conf import settings
 from django.utils.module_loading import import_string
 from rest_framework import serializers
 import contextvars
+import copy
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 import logging
 from cytoolz import pluck, keyfilter
 from cytoolz.functoolz import thread_first
@@ -14,7 +17,8 @@ from zen_queries import queries_disabled
 from statezero.adaptors.django.config import config, registry
 from statezero.core.interfaces import AbstractDataSerializer, AbstractQueryOptimizer
 from statezero.core.types import RequestType
-from statezero.adaptors.django.helpers import collect_from_queryset
+from statezero.adaptors.django.helpers import collect_from_queryset, instance_repr
+from statezero.adaptors.django.row_encoder import get_row_encoder
 from statezero.core.hook_checks import _check_pre_hook_result, _check_post_hook_result
 
 logger = logging.getLogger(__name__)
@@ -142,9 +146,10 @@ class DynamicModelSerializer(FExpressionMixin, serializers.ModelSerializer):
         # Allowed fields must exist
         allowed_fields = allowed_fields or set()
 
-        # Always include the primary key and the 'repr' field
+        # Always include the primary key, and the 'repr' field unless disabled
         allowed_fields.add(pk_field)
-        allowed_fields.add("repr")
+        if _include_repr(self.Meta.model):
+            allowed_fields.add("repr")
         
         # Filter the fields based on the result
         if allowed_fields:
@@ -157,13 +162,7 @@ class DynamicModelSerializer(FExpressionMixin, serializers.ModelSerializer):
         """
         Returns a standard Repr of the model displayed in the model summary
         """
-        img_repr = obj.__img__() if hasattr(obj, "__img__") else None
-        str_repr = str(obj)
-
-        return {
-            "str": str_repr,
-            "img": img_repr
-        }
+        return instance_repr(obj)
     
     def create(self, validated_data):
         """
@@ -318,8 +317,40 @@ class DynamicModelSerializer(FExpressionMixin, serializers.ModelSerializer):
             
         return serializer_class
 
+    def get_fields(self):
+        """
+        Classes built by ``for_model`` are cached and reused, so the result of
+        DRF's model introspection is kept on the class and deep-copied for
+        each instance, the same way DRF copies declared fields.
+        """
+        cls = type(self)
+        if not cls.__dict__.get("_cache_fields"):
+            return super().get_fields()
+        template = cls.__dict__.get("_field_template")
+        if template is None:
+            template = super().get_fields()
+            cls._field_template = copy.deepcopy(template)
+            return template
+        return copy.deepcopy(template)
+
     @classmethod
     def for_model(cls, model: Type[models.Model]):
+        """
+        Return the DynamicModelSerializer class for the given model and the
+        fields allowed in the current fields map. Built classes are cached,
+        keyed by the model, the allowed fields and the model's StateZero config.
+        """
+        model_name = config.orm_provider.get_model_name(model)
+        allowed_fields = extract_fields(model_name)
+        return _build_serializer_class(
+            cls,
+            model,
+            frozenset(allowed_fields) if allowed_fields is not None else None,
+            _model_config_signature(model),
+        )
+
+    @classmethod
+    def _build_for_model(cls, model: Type[models.Model], allowed_fields: Optional[Set[str]]):
         """
         Create a DynamicModelSerializer class for the given model.
         This configures all serialization behavior including:
@@ -342,13 +373,9 @@ class DynamicModelSerializer(FExpressionMixin, serializers.ModelSerializer):
         serializer_class = type(
             f"Dynamic{model.__name__}Serializer", 
             (cls,), 
-            {"Meta": Meta}
+            {"Meta": Meta, "_cache_fields": True}
         )
         
-        # Get allowed fields for this model
-        model_name = config.orm_provider.get_model_name(model)
-        allowed_fields = extract_fields(model_name)
-        
         # Only proceed with field setup if we have allowed fields
         if allowed_fields:
             # Register custom serializers for model fields
@@ -363,6 +390,51 @@ class DynamicModelSerializer(FExpressionMixin, serializers.ModelSerializer):
         
         return serializer_class
 
+
+def _include_repr(model: Type[models.Model]) -> bool:
+    try:
+        return registry.get_config(model).include_repr
+    except ValueError:
+        return True
+
+
+def _model_config_signature(model: Type[models.Model]):
+    """The parts of a model's StateZero config that shape its serializer class."""
+    try:
+        model_config = registry.get_config(model)
+    except ValueError:
+        return None
+    exposed = model_config.fields
+    return (
+        exposed if exposed == "__all__" else frozenset(exposed),
+        tuple(
+            (field.name, id(field.field), field.title)
+            for field in model_config.additional_fields
+        ),
+        model_config.include_repr,
+        id(model_config.repr_expression),
+        model_config.repr_image,
+    )
+
+
+def _build_uncached(cls, model, allowed_fields, config_signature):
+    return cls._build_for_model(model, set(allowed_fields) if allowed_fields is not None else None)
+
+
+_serializer_classes = None
+
+
+def _build_serializer_class(cls, model, allowed_fields, config_signature):
+    # The LRU is created on first use, once settings are configured, rather
+    # than at import time; STATEZERO_SERIALIZER_CACHE_SIZE is read then.
+    global _serializer_classes
+    if _serializer_classes is None:
+        _serializer_classes = lru_cache(
+            maxsize=getattr(settings, "STATEZERO_SERIALIZER_CACHE_SIZE", 1024)
+        )(_build_uncached)
+    return _serializer_classes(cls, model, allowed_fields, config_signature)
+
+
 class DRFDynamicSerializer(AbstractDataSerializer):
     """
     Uses collect_from_queryset to gather model instances
@@ -479,6 +551,8 @@ class DRFDynamicSerializer(AbstractDataSerializer):
 
             # Apply zen-queries protection if configured
             query_protection = getattr(settings, 'ZEN_STRICT_SERIALIZATION', False)
+            # Opt-in compiled encoders instead of DRF's per-field machinery
+            fast_serialization = getattr(settings, 'STATEZERO_FAST_SERIALIZATION', False)
 
             # Serialize each group of models
             for model_type, instances in collected_models.items():
@@ -493,6 +567,15 @@ class DRFDynamicSerializer(AbstractDataSerializer):
                     # Create a serializer for this model type
                     serializer_class = DynamicModelSerializer.for_model(model_class)
 
+                    encoder = get_row_encoder(serializer_class) if fast_serialization else None
+                    if encoder is not None:
+                        if query_protection:
+                            with queries_disabled():
+                                result["included"][model_type] = encoder.encode(instances)
+                        else:
+                            result["included"][model_type] = encoder.encode(instances)
+                        continue
+
                     # Apply zen-queries protection if configured
                     if query_protection:
                         with queries_disabled():
@@ -527,6 +610,38 @@ class DRFDynamicSerializer(AbstractDataSerializer):
 
             return result
 
+    def serialize_chunks(
+        self,
+        data: Any,
+        model: Type[models.Model],
+        depth: int,
+        fields_map: Dict[str, Set[str]],
+        chunk_size: int,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Serialize a queryset ``chunk_size`` rows at a time.
+
+        Primary keys are read with ``iterator(chunk_size=...)`` (a server-side
+        cursor where the backend supports one), and each batch is serialized by
+        ``serialize`` from the same queryset restricted to those pks, so only one
+        chunk of instances, prefetches and serialized rows is held at a time.
+        """
+        if not isinstance(data, models.QuerySet):
+            yield from super().serialize_chunks(data, model, depth, fields_map, chunk_size)
+            return
+
+        # The pk stream keeps the slice; each chunk is looked up by pk instead
+        rows = data._chain()
+        rows.query.clear_limits()
+        pks = data.values_list(model._meta.pk.name, flat=True).iterator(chunk_size=chunk_size)
+        while True:
+            chunk = list(islice(pks, chunk_size))
+            if not chunk:
+                return
+            yield self.serialize(
+                rows.filter(pk__in=chunk), model, depth, fields_map, many=True
+            )
+
     def deserialize(
         self,
         model: Type[models.Model],
@@ -0,0 +1,286 @@
+"""
+values()-based read engine.
+
+``ValuesReadSerializer`` is a ``DRFDynamicSerializer`` that serves list reads
+without building model instances or prefetch caches. The top-level queryset
+runs as ``values()``, related models reached through the fields map are
+fetched in pk-IN batches, and every row is encoded with the model's compiled
+``RowEncoder``. The response has the same ``{data, included, model_name}``
+shape as the instance-based path.
+
+A read only takes this path when every model it reaches can be read from
+plain columns: no ``additional_fields`` or ``force_prefetch``, a ``repr`` that
+is either disabled or computed in SQL (``repr_expression``), and no fields that
+need the instance (file fields, custom field serializers, ...). Anything else falls back to ``DRFDynamicSerializer``.
+
+Enabled with ``STATEZERO_VALUES_READS = True``.
+"""
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models.fields.related import ForeignObjectRel
+from django.db.models.query import ModelIterable
+
+from statezero.adaptors.django.config import config, registry
+from statezero.adaptors.django.prefetch import pk_in_batches
+from statezero.adaptors.django.row_encoder import RowEncoder, get_row_encoder
+from statezero.adaptors.django.serializers import (DRFDynamicSerializer,
+                                                   DynamicModelSerializer,
+                                                   fields_map_context)
+from statezero.core.types import RequestType
+
+
+class _ModelReadPlan:
+    """How to read one model from ``values()`` rows."""
+
+    __slots__ = ("model", "model_name", "encoder", "columns", "to_one", "to_many")
+
+    def __init__(self, model, model_name, encoder: RowEncoder):
+        self.model = model
+        self.model_name = model_name
+        self.encoder = encoder
+        self.columns: List[str] = []
+        # (attname, related model name) for FK / O2O columns to follow
+        self.to_one: List[Tuple[str, str]] = []
+        # (field name, related model, lookup back to this model, related model name or None)
+        self.to_many: List[Tuple[str, Type[models.Model], str, Optional[str]]] = []
+
+
+class ValuesReadSerializer(DRFDynamicSerializer):
+    """
+    Serializer that reads list responses with ``values()`` when the models
+    involved allow it, and otherwise behaves exactly like DRFDynamicSerializer.
+    """
+
+    def serialize(
+        self,
+        data: Any,
+        model: Type[models.Model],
+        depth: int,
+        fields_map: Optional[Dict[str, Set[str]]],
+        many: bool = False,
+        request: Optional[RequestType] = None,
+    ) -> Any:
+        assert fields_map is not None, "fields_map is required and cannot be None"
+
+        if (
+            many
+            and isinstance(data, models.QuerySet)
+            and data.model is model
+            and data._iterable_class is ModelIterable
+        ):
+            with fields_map_context(fields_map):
+                plans = self._build_plans(model, fields_map)
+            if plans is not None:
+                return self._serialize_values(data, model, fields_map, plans)
+
+        return super().serialize(
+            data, model, depth, fields_map, many=many, request=request
+        )
+
+    # --- Planning ---
+
+    def _build_plans(
+        self, model: Type[models.Model], fields_map: Dict[str, Set[str]]
+    ) -> Optional[Dict[str, _ModelReadPlan]]:
+        """
+        Plan every model reachable from ``model`` through the fields map.
+        Returns None if any of them needs model instances.
+        """
+        get_model_name = config.orm_provider.get_model_name
+        model_names = {name for name in fields_map if "::" not in name}
+        plans: Dict[str, _ModelReadPlan] = {}
+        pending = [model]
+        while pending:
+            current = pending.pop()
+            model_name = get_model_name(current)
+            if model_name in plans:
+                continue
+            plan = self._plan_model(
+                current, model_name, fields_map.get(model_name) or set(), model_names
+            )
+            if plan is None:
+                return None
+            plans[model_name] = plan
+            for _, related_name in plan.to_one:
+                pending.append(config.orm_provider.get_model_by_name(related_name))
+            for _, related_model, _, related_name in plan.to_many:
+                if related_name is not None:
+                    pending.append(related_model)
+        return plans
+
+    def _plan_model(
+        self,
+        model: Type[models.Model],
+        model_name: str,
+        allowed_fields: Set[str],
+        model_names: Set[str],
+    ) -> Optional[_ModelReadPlan]:
+        try:
+            model_config = registry.get_config(model)
+        except ValueError:
+            return None
+        if model_config.force_prefetch:
+            return None
+        if any(field.name in allowed_fields for field in model_config.additional_fields):
+            return None
+
+        encoder = get_row_encoder(DynamicModelSerializer.for_model(model))
+        if encoder is None or not encoder.supports_rows:
+            return None
+
+        plan = _ModelReadPlan(model, model_name, encoder)
+        plan.columns = encoder.columns
+        get_model_name = config.orm_provider.get_model_name
+
+        for field_name in allowed_fields:
+            try:
+                field = model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                continue
+            if not field.is_relation or field.related_model is None:
+                continue
+            related_model = field.related_model
+            related_name = get_model_name(related_model)
+            followed = related_name if related_name in model_names else None
+
+            if field.many_to_many or field.one_to_many:
+                lookup = self._reverse_lookup(field)
+                if lookup is None:
+                    return None
+                plan.to_many.append((field_name, related_model, lookup, followed))
+            elif isinstance(field, ForeignObjectRel):
+                # Reverse one-to-one needs the related instance
+                return None
+            else:
+                if field.target_field != related_model._meta.pk:
+                    return None
+                if followed is not None:
+                    plan.to_one.append((field.attname, followed))
+
+        # Every to-many field the encoder outputs must be planned
+        planned = {name for name, _, _, _ in plan.to_many}
+        if not set(encoder.many_fields) <= planned:
+            return None
+        return plan
+
+    @staticmethod
+    def _reverse_lookup(field) -> Optional[str]:
+        """The lookup from the related model back to ``field.model``."""
+        if isinstance(field, ForeignObjectRel):
+            return field.field.name
+        if field.remote_field.hidden:
+            return None
+        return field.related_query_name()
+
+    # --- Execution ---
+
+    def _serialize_values(
+        self,
+        queryset: models.QuerySet,
+        model: Type[models.Model],
+        fields_map: Dict[str, Set[str]],
+        plans: Dict[str, _ModelReadPlan],
+    ) -> Dict[str, Any]:
+        model_name = config.orm_provider.get_model_name(model)
+        top_plan = plans[model_name]
+        pk_attname = model._meta.pk.attname
+
+        rows_by_model: Dict[str, Dict[Any, Dict[str, Any]]] = defaultdict(dict)
+        pending: Dict[str, Set[Any]] = defaultdict(set)
+
+        top_rows = list(
+            queryset.prefetch_related(None)
+            .annotate(**top_plan.encoder.annotations)
+            .values(*self._value_columns(top_plan))
+        )
+        data = [row[pk_attname] for row in top_rows]
+        self._absorb(top_plan, top_rows, rows_by_model, pending, queryset.db)
+
+        while pending:
+            related_name, pks = pending.popitem()
+            plan = plans[related_name]
+            fetched = rows_by_model[related_name]
+            pks = [pk for pk in pks if pk not in fetched]
+            if not pks:
+                continue
+            related_pk = plan.model._meta.pk.name
+            columns = self._value_columns(plan)
+            rows = []
+            for pk_filter in pk_in_batches(related_pk, pks, queryset.db):
+                rows.extend(
+                    plan.model._base_manager.using(queryset.db).filter(pk_filter)
+                    .annotate(**plan.encoder.annotations)
+                    .values(*columns)
+                )
+            self._absorb(plan, rows, rows_by_model, pending, queryset.db)
+
+        included = {
+            name: plans[name].encoder.encode_rows(rows.values())
+            for name, rows in rows_by_model.items()
+            if rows and name in fields_map
+        }
+
+        return {"data": data, "included": included, "model_name": model_name}
+
+    @staticmethod
+    def _value_columns(plan: _ModelReadPlan) -> List[str]:
+        pk_attname = plan.model._meta.pk.attname
+        columns = list(plan.columns)
+        columns.extend(plan.encoder.annotations)
+        for attname, _ in plan.to_one:
+            if attname not in columns:
+                columns.append(attname)
+        if pk_attname not in columns:
+            columns.append(pk_attname)
+        return columns
+
+    def _absorb(
+        self,
+        plan: _ModelReadPlan,
+        rows: List[Dict[str, Any]],
+        rows_by_model: Dict[str, Dict[Any, Dict[str, Any]]],
+        pending: Dict[str, Set[Any]],
+        using: str,
+    ) -> None:
+        """Store ``rows`` for ``plan``'s model and queue the related pks they reference."""
+        pk_attname = plan.model._meta.pk.attname
+        stored = rows_by_model[plan.model_name]
+        new_rows = [row for row in rows if row[pk_attname] not in stored]
+        if not new_rows:
+            return
+
+        pks = [row[pk_attname] for row in new_rows]
+        for field_name, related_model, lookup, related_name in plan.to_many:
+            related_pks = self._fetch_related_pks(related_model, lookup, pks, using)
+            for row in new_rows:
+                row[field_name] = related_pks.get(row[pk_attname], [])
+            if related_name is not None:
+                pending[related_name].update(
+                    pk for values in related_pks.values() for pk in values
+                )
+
+        for attname, related_name in plan.to_one:
+            pending[related_name].update(
+                row[attname] for row in new_rows if row[attname] is not None
+            )
+
+        for row in new_rows:
+            stored[row[pk_attname]] = row
+
+    @staticmethod
+    def _fetch_related_pks(
+        related_model: Type[models.Model], lookup: str, pks: List[Any], using: str
+    ) -> Dict[Any, List[Any]]:
+        """``{pk: [related pk, ...]}`` in the related manager's default ordering."""
+        related_pks: Dict[Any, List[Any]] = defaultdict(list)
+        related_pk = related_model._meta.pk.name
+        for pk_filter in pk_in_batches(lookup, pks, using):
+            pairs = related_model._default_manager.using(using).filter(
+                pk_filter
+            ).values_list(lookup, related_pk)
+            for owner, related in pairs:
+                related_pks[owner].append(related)
+        return related_pks
@@ -1,12 +1,16 @@
+import json
 import logging
+from contextlib import contextmanager, nullcontext
 
 from django.conf import settings
-from django.db import transaction
+from django.db import connection, transaction
+from django.http import StreamingHttpResponse
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import serializers
 from rest_framework.parsers import MultiPartParser
+from rest_framework.utils.encoders import JSONEncoder as DRFJSONEncoder
 from django.core.files.storage import storages
 from django.utils.module_loading import import_string
 from datetime import datetime
@@ -26,7 +30,9 @@ from statezero.adaptors.django.actions import DjangoActionSchemaGenerator
 from statezero.adaptors.django.action_serializers import get_or_build_action_serializer
 from statezero.adaptors.django.serializers import DRFDynamicSerializer
 from statezero.core.interfaces import AbstractEventEmitter, AbstractActionPermission
+from statezero.core.permission_resolver import permission_resolution
 from statezero.core.process_request import RequestProcessor
+from statezero.core.streaming import ReadStream
 from statezero.core.actions import action_registry
 from statezero.core.interfaces import AbstractActionPermission
 
@@ -175,46 +181,164 @@ class MeView(APIView):
             return explicit_exception_handler(original_exception)
 
 
+def _run_processor(request, process, atomic=False):
+    """
+    Run ``process(processor)`` the way every query endpoint does: with the
+    request's extra-fields policy, telemetry, the query timeout and query
+    tracking, inside its own transaction when ``atomic`` is set.
+
+    Returns ``(result, telemetry_headers)``. On failure the result is the
+    mapped error response, with the failing ``index`` added for batch entries.
+    """
+    from statezero.core.telemetry import create_telemetry_context, clear_telemetry_context
+    from statezero.adaptors.django.db_telemetry import track_db_queries
+
+    # Set per-request extra_fields policy from header (overrides global config)
+    extra_fields_header = request.headers.get("X-Statezero-Extra-Fields")
+    if extra_fields_header is not None:
+        set_extra_fields_policy(extra_fields_header.lower())
+    else:
+        set_extra_fields_policy(config.extra_fields)
+
+    # Create telemetry context
+    telemetry_ctx = create_telemetry_context(enabled=config.enable_telemetry)
+
+    processor = RequestProcessor(config=config, registry=registry)
+    timeout_ms = getattr(settings, 'STATEZERO_QUERY_TIMEOUT_MS', 1000)
+    try:
+        # The timeout is set per transaction, so the transaction opens first
+        with transaction.atomic() if atomic else nullcontext():
+            with config.context_manager(timeout_ms):
+                with track_db_queries():
+                    result = process(processor)
+
+        # Log telemetry data if enabled
+        telemetry_headers = {}
+        if config.enable_telemetry and telemetry_ctx:
+            telemetry_data = telemetry_ctx.get_telemetry_data()
+            logger.warning(f"[StateZero Telemetry] {json.dumps(telemetry_data)}")
+            telemetry_headers['X-StateZero-Telemetry'] = json.dumps(telemetry_data)
+        return result, telemetry_headers
+
+    except Exception as original_exception:
+        response = explicit_exception_handler(original_exception)
+        batch_index = getattr(original_exception, "batch_index", None)
+        if batch_index is not None:
+            response.data["index"] = batch_index
+        return response, None
+    finally:
+        clear_telemetry_context()
+
+
 class ModelView(APIView):
 
     permission_classes = [permission_class]
 
     @transaction.atomic
     def post(self, request, model_name):
-        from statezero.core.telemetry import create_telemetry_context, clear_telemetry_context
-        from statezero.adaptors.django.db_telemetry import track_db_queries
-        import json
-
-        # Set per-request extra_fields policy from header (overrides global config)
-        extra_fields_header = request.headers.get("X-Statezero-Extra-Fields")
-        if extra_fields_header is not None:
-            set_extra_fields_policy(extra_fields_header.lower())
-        else:
-            set_extra_fields_policy(config.extra_fields)
+        result, telemetry_headers = _run_processor(
+            request, lambda processor: processor.process_request(req=request)
+        )
+        if isinstance(result, Response):
+            return result
+        if isinstance(result, ReadStream):
+            return _streaming_response(result, request, headers=telemetry_headers)
+        return Response(result, status=status.HTTP_200_OK, headers=telemetry_headers)
 
-        # Create telemetry context
-        telemetry_ctx = create_telemetry_context(enabled=config.enable_telemetry)
 
-        processor = RequestProcessor(config=config, registry=registry)
-        timeout_ms = getattr(settings, 'STATEZERO_QUERY_TIMEOUT_MS', 1000)
-        try:
-            with config.context_manager(timeout_ms):
-                with track_db_queries():
-                    result = processor.process_request(req=request)
+_STREAM_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "json-seq": "application/json-seq",
+}
 
-            # Log telemetry data if enabled
-            telemetry_headers = {}
-            if config.enable_telemetry and telemetry_ctx:
-                telemetry_data = telemetry_ctx.get_telemetry_data()
-                logger.warning(f"[StateZero Telemetry] {json.dumps(telemetry_data)}")
-                telemetry_headers['X-StateZero-Telemetry'] = json.dumps(telemetry_data)
 
+@contextmanager
+def _stream_scope(request):
+    """
+    The scope a streamed read is drained in.
+
+    The response body is produced after ModelView.post has returned, outside
+    its transaction, statement timeout, query tracking and permission
+    resolution. The stream reopens them around itself: its own transaction,
+    at REPEATABLE READ on PostgreSQL so every chunk reads the same snapshot as
+    the pk cursor, and a statement timeout of ``STATEZERO_STREAM_TIMEOUT_MS``
+    (default ``STATEZERO_QUERY_TIMEOUT_MS``).
+    """
+    from statezero.adaptors.django.db_telemetry import track_db_queries
+
+    timeout_ms = getattr(
+        settings,
+        "STATEZERO_STREAM_TIMEOUT_MS",
+        getattr(settings, "STATEZERO_QUERY_TIMEOUT_MS", 1000),
+    )
+    outermost = not connection.in_atomic_block
+    with transaction.atomic():
+        if outermost and connection.vendor == "postgresql":
+            # Must run before the transaction's first query
+            with connection.cursor() as cursor:
+                cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+        with config.context_manager(timeout_ms):
+            with track_db_queries():
+                with permission_resolution(registry, request):
+                    yield
+
+
+def _streaming_response(stream: ReadStream, request, headers=None) -> StreamingHttpResponse:
+    """
+    Send a ReadStream as NDJSON lines or RFC 7464 JSON text sequences.
+
+    Rows are read and serialized inside ``_stream_scope`` while the response is
+    sent. An error at that point can no longer change the status code, so it
+    is sent as a final ``{"frame": "error", ...}`` frame instead. Telemetry for
+    the stream is logged once it ends, since its headers have been sent.
+    """
+    from statezero.core.telemetry import create_telemetry_context, clear_telemetry_context
+
+    prefix = "\x1e" if stream.format == "json-seq" else ""
+
+    def encode(frame):
+        return f"{prefix}{json.dumps(frame, cls=DRFJSONEncoder)}\n"
+
+    def content():
+        telemetry_ctx = create_telemetry_context(enabled=config.enable_telemetry)
+        try:
+            with _stream_scope(request):
+                for frame in stream.frames():
+                    yield encode(frame)
         except Exception as original_exception:
-            return explicit_exception_handler(original_exception)
+            error_response = explicit_exception_handler(original_exception)
+            yield encode({"frame": "error", **error_response.data})
         finally:
+            if config.enable_telemetry and telemetry_ctx:
+                telemetry_data = telemetry_ctx.get_telemetry_data()
+                logger.warning(f"[StateZero Telemetry] {json.dumps(telemetry_data)}")
             clear_telemetry_context()
 
-        return Response(result, status=status.HTTP_200_OK, headers=telemetry_headers)
+    response = StreamingHttpResponse(
+        content(), content_type=_STREAM_CONTENT_TYPES[stream.format]
+    )
+    for header, value in (headers or {}).items():
+        response[header] = value
+    return response
+
+class BatchView(APIView):
+    """
+    Runs a list of ``{"model_name": ..., "ast": ...}`` queries in one
+    transaction and one request context, returning the results in order.
+
+    The batch is all-or-nothing: if any entry fails, every write made by the
+    batch is rolled back and the error response carries the failing ``index``.
+    """
+
+    permission_classes = [permission_class]
+
+    def post(self, request):
+        results, telemetry_headers = _run_processor(
+            request, lambda processor: processor.process_batch(req=request), atomic=True
+        )
+        if isinstance(results, Response):
+            return results
+        return Response({"results": results}, status=status.HTTP_200_OK, headers=telemetry_headers)
 
 class SchemaView(APIView):
     permission_classes = [ORMBridgeViewAccessGate]
@@ -62,6 +62,12 @@ def _parse_error(resp):
     raise exc_cls(detail)
 
 
+def _raise_frame_error(frame):
+    """Raise the exception carried by a streaming read's error frame."""
+    exc_cls = _ERROR_MAP.get(frame.get("type", ""), StateZeroError)
+    raise exc_cls(frame.get("detail"))
+
+
 def configure(url=None, token=None, headers=None, transport=None, upload_mode="server"):
     """
     Configure the global transport for all model queries.
@@ -70,7 +76,8 @@ def configure(url=None, token=None, headers=None, transport=None, upload_mode="s
         url: Base URL of the StateZero API (e.g. "https://api.example.com")
         token: Optional auth token (sent as "Token <token>")
         headers: Optional dict of extra headers
-        transport: Optional custom transport object (must implement .post(model_name, body))
+        transport: Optional custom transport object (must implement .post(model_name, body),
+                   and .post_stream(model_name, body) for QuerySet.iterator())
         upload_mode: "server" (direct upload) or "s3" (presigned URL upload). Default "server".
     """
     global _transport, _upload_mode
@@ -101,6 +108,19 @@ class _HTTPTransport:
             _parse_error(resp)
         return resp.json()
 
+    def post_stream(self, model_name, body):
+        """Send a streaming read and yield its NDJSON frames as dicts."""
+        import httpx
+        import json
+        url = f"{self.base_url}/statezero/{model_name}/"
+        with httpx.stream("POST", url, json=body, headers=self.headers, timeout=None) as resp:
+            if resp.status_code >= 400:
+                resp.read()
+                _parse_error(resp)
+            for line in resp.iter_lines():
+                if line:
+                    yield json.loads(line)
+
     def post_action(self, action_name, data):
         import httpx
         url = f"{self.base_url}/statezero/actions/{action_name}/"
@@ -446,6 +466,7 @@ class Manager:
     def first(self, **kw):                  return self._queryset().first(**kw)
     def last(self, **kw):                   return self._queryset().last(**kw)
     def count(self, **kw):                  return self._queryset().count(**kw)
+    def iterator(self, **kw):               return self._queryset().iterator(**kw)
     def exists(self):                       return self._queryset().exists()
     def create(self, **kw):                 return self._queryset().create(**kw)
     def bulk_create(self, data):            return self._queryset().bulk_create(data)
@@ -610,6 +631,19 @@ def _resolve_value(v):
     return v
 
 
+class Page(list):
+    """
+    Result of fetch() with cursor pagination or include_total: the instances,
+    plus the cursors to pass as after=/before= and the total row count.
+    """
+
+    def __init__(self, items, next_cursor=None, prev_cursor=None, total=None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+        self.total = total
+
+
 # ---------------------------------------------------------------------------
 # QuerySet — immutable, cloned on each chain method
 # ---------------------------------------------------------------------------
@@ -756,7 +790,15 @@ class QuerySet:
 
     # -- Terminal methods --
 
-    def fetch(self, limit=None, offset=None, depth=None, fields=None):
+    def fetch(self, limit=None, offset=None, depth=None, fields=None,
+              after=None, before=None, cursor=False, include_total=False):
+        """Fetch a list of instances.
+
+        With cursor=True, or a cursor passed as after=/before=, the server
+        paginates by keyset instead of offset and a Page is returned, whose
+        next_cursor/prev_cursor fetch the neighbouring pages. With
+        include_total=True the Page also carries the total row count.
+        """
         query = {**self._build(), "type": "read"}
         serializer_options = {}
         if limit is not None:
@@ -767,9 +809,59 @@ class QuerySet:
             serializer_options["depth"] = depth
         if fields is not None:
             serializer_options["fields"] = fields
+        keyset = cursor or after is not None or before is not None
+        if keyset:
+            serializer_options["pagination"] = "cursor"
+        if after is not None:
+            serializer_options["after"] = after
+        if before is not None:
+            serializer_options["before"] = before
+        if include_total:
+            serializer_options["include_total"] = True
         if serializer_options:
             query["serializerOptions"] = serializer_options
-        return self._unwrap_list(self._execute(query))
+        response = self._execute(query)
+        if not keyset and not include_total:
+            return self._unwrap_list(response)
+        metadata = response.get("metadata", {})
+        return Page(
+            self._unwrap_list(response),
+            next_cursor=metadata.get("next_cursor"),
+            prev_cursor=metadata.get("prev_cursor"),
+            total=metadata.get("total"),
+        )
+
+    def iterator(self, chunk_size=None, limit=None, offset=None, depth=None, fields=None):
+        """Stream the rows as model instances, fetched and parsed one chunk at a time.
+
+        Unlike fetch(), the server's default limit does not apply, so this
+        iterates over the whole queryset unless a limit is given.
+        """
+        if _transport is None:
+            raise RuntimeError("Client not configured. Call configure() first.")
+        serializer_options = {"stream": "ndjson"}
+        if chunk_size is not None:
+            serializer_options["chunk_size"] = chunk_size
+        if limit is not None:
+            serializer_options["limit"] = limit
+        if offset is not None:
+            serializer_options["offset"] = offset
+        if depth is not None:
+            serializer_options["depth"] = depth
+        if fields is not None:
+            serializer_options["fields"] = fields
+        body = {
+            "ast": {
+                "query": {**self._build(), "type": "read"},
+                "serializerOptions": serializer_options,
+            }
+        }
+        for frame in _transport.post_stream(self._model_name, body):
+            kind = frame.get("frame")
+            if kind == "chunk":
+                yield from self._unwrap_list(frame)
+            elif kind == "error":
+                _raise_frame_error(frame)
 
     def get(self, depth=None, fields=None, **conditions):
         qs = self.filter(**conditions) if conditions else self
@@ -40,6 +40,33 @@ class DjangoTestTransport:
 
         return response.data
 
+    def post_stream(self, model_name, body):
+        import json
+        from rest_framework.test import APIRequestFactory, force_authenticate
+        from statezero.adaptors.django.views import ModelView
+
+        factory = APIRequestFactory()
+        request = factory.post(
+            f"/statezero/{model_name}/",
+            data=body,
+            format="json",
+        )
+        force_authenticate(request, user=self.user)
+
+        response = ModelView.as_view()(request, model_name=model_name)
+
+        if not response.streaming:
+            response.render()
+            if response.status_code >= 400:
+                self._raise_error(response)
+            raise ValueError("Expected a streaming response for a streaming read.")
+
+        # Each piece of the streamed content is one complete frame
+        for part in response.streaming_content:
+            for line in part.splitlines():
+                if line:
+                    yield json.loads(line)
+
     def post_action(self, action_name, data):
         from rest_framework.test import APIRequestFactory, force_authenticate
         from statezero.adaptors.django.views import ActionView
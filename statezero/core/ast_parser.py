@@ -1,13 +1,19 @@
 from enum import Enum
 import hashlib
 import json
+import threading
 from typing import Any, Callable, Dict, List, Optional, Set, Type, Union, Tuple, Literal
-from collections import deque
-import networkx as nx
+from collections import OrderedDict, deque
 
+from django.conf import settings
 
+
+from statezero.core.classes import CacheScope
 from statezero.core.config import AppConfig, Registry, EXTRA_FIELDS_ERROR
 from statezero.core.exceptions import PermissionDenied, ValidationError
+from statezero.core.model_graph import ModelGraph
+from statezero.core.permission_resolver import get_permission_resolver
+from statezero.core.streaming import STREAM_FORMATS, ReadStream
 from statezero.core.interfaces import (
     AbstractDataSerializer,
     AbstractPermission,
@@ -25,6 +31,70 @@ class ResponseType(Enum):
     NONE = "none"
 
 
+class _SharedFieldMapCache:
+    """
+    Process-wide LRU of computed field maps, shared between requests.
+
+    Entries are keyed like the per-request cache (root model, operation,
+    depth, requested fields, ...). Each key holds a few variants, one per
+    distinct permission signature: the models whose permissions were
+    consulted while building the map, and their permission fingerprints at
+    that time. A variant is reused only if the current request fingerprints
+    those same models identically, which guarantees the same result.
+    """
+
+    MAX_VARIANTS = 16
+
+    def __init__(self):
+        self._entries: "OrderedDict[tuple, List[tuple]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _max_entries() -> int:
+        return getattr(settings, "STATEZERO_FIELD_MAP_CACHE_SIZE", 1024)
+
+    def get(self, key: tuple, signature_for: Callable[[tuple], Optional[tuple]]):
+        if not self._max_entries():
+            return None
+        with self._lock:
+            variants = self._entries.get(key)
+            if not variants:
+                return None
+            self._entries.move_to_end(key)
+            variants = list(variants)
+        for models, signature, fields_map in variants:
+            if signature_for(models) == signature:
+                return fields_map
+        return None
+
+    def set(self, key: tuple, models: tuple, signature: tuple, fields_map: Dict[str, Any]) -> None:
+        max_entries = self._max_entries()
+        if not max_entries:
+            return
+        with self._lock:
+            variants = [
+                variant for variant in self._entries.get(key, [])
+                if (variant[0], variant[1]) != (models, signature)
+            ]
+            variants.append((models, signature, fields_map))
+            self._entries[key] = variants[-self.MAX_VARIANTS:]
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_shared_field_maps = _SharedFieldMapCache()
+
+
+def clear_field_map_cache() -> None:
+    """Drop every field map shared between requests (e.g. after permission changes)."""
+    _shared_field_maps.clear()
+
+
 class ASTParser:
     """
     Parses an abstract syntax tree (AST) representing an ORM operation.
@@ -42,6 +112,8 @@ class ASTParser:
         base_queryset: Any,  # ADD: Base queryset to manage state
         serializer_options: Optional[Dict[str, Any]] = None,
         request: Optional[RequestType] = None,
+        field_map_cache: Optional[Dict[Any, Any]] = None,
+        use_query_cache: bool = True,
     ):
         self.engine = engine
         self.serializer = serializer
@@ -51,6 +123,12 @@ class ASTParser:
         self.current_queryset = base_queryset  # ADD: Track current queryset state
         self.serializer_options = serializer_options or {}
         self.request = request
+        # Shared between parsers built for the same request (e.g. a batch) so
+        # permission and field-map work is only done once per model.
+        self.field_map_cache = field_map_cache if field_map_cache is not None else {}
+        # Off for reads that can see uncommitted writes, which must not be
+        # cached in case the transaction rolls back (e.g. later batch entries).
+        self.use_query_cache = use_query_cache
 
         # Process field selection if present
         requested_fields = self.serializer_options.get("fields", [])
@@ -64,54 +142,19 @@ class ASTParser:
                 max((field.count("__") for field in requested_fields), default=0) + 1
             )
 
-        # Get the raw field map
+        self._requested_fields = requested_fields
+        self._consulted_models: Optional[Set[Type]] = None
+        self._write_fields_maps: Dict[str, Dict[str, Set[str]]] = {}
+
+        # Get the raw field map. Create/update maps are only built when a
+        # handler needs them (see create_fields_map / update_fields_map).
         self.read_fields_map = self._get_operation_field_map(
             requested_fields=requested_fields, depth=self.depth, operation_type="read"
         )
-
-        # Create/update operations should use depth 0 for performance
-        self.create_fields_map = self._get_operation_field_map(
-            requested_fields=requested_fields,
-            depth=0,  # Nested writes are not supported
-            operation_type="create",
-        )
-
-        self.update_fields_map = self._get_operation_field_map(
-            requested_fields=requested_fields,
-            depth=0,  # Nested writes are not supported
-            operation_type="update",
-        )
-
-        # Record permission-validated fields in telemetry
-        telemetry_ctx = get_telemetry_context()
-        if telemetry_ctx:
-            model_name = self.engine.get_model_name(self.model)
-            # Record read fields
-            if self.read_fields_map:
-                telemetry_ctx.record_permission_fields(
-                    model_name,
-                    "read",
-                    list(self.read_fields_map.get(model_name, set()))
-                )
-            # Record create fields
-            if self.create_fields_map:
-                telemetry_ctx.record_permission_fields(
-                    model_name,
-                    "create",
-                    list(self.create_fields_map.get(model_name, set()))
-                )
-            # Record update fields
-            if self.update_fields_map:
-                telemetry_ctx.record_permission_fields(
-                    model_name,
-                    "update",
-                    list(self.update_fields_map.get(model_name, set()))
-                )
+        self._record_permission_fields("read", self.read_fields_map)
 
         # Add field maps to serializer options
         self.serializer_options["read_fields_map"] = self.read_fields_map
-        self.serializer_options["create_fields_map"] = self.create_fields_map
-        self.serializer_options["update_fields_map"] = self.update_fields_map
 
         # Lookup table mapping AST op types to handler methods.
         self.handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
@@ -136,6 +179,36 @@ class ASTParser:
         }
         self.default_handler = self._handle_read
 
+    @property
+    def create_fields_map(self) -> Dict[str, Set[str]]:
+        return self._get_write_fields_map("create")
+
+    @property
+    def update_fields_map(self) -> Dict[str, Set[str]]:
+        return self._get_write_fields_map("update")
+
+    def _get_write_fields_map(self, operation_type: Literal["create", "update"]) -> Dict[str, Set[str]]:
+        """Build the create/update fields map on first use."""
+        if operation_type not in self._write_fields_maps:
+            fields_map = self._get_operation_field_map(
+                requested_fields=self._requested_fields,
+                depth=0,  # Nested writes are not supported
+                operation_type=operation_type,
+            )
+            self._write_fields_maps[operation_type] = fields_map
+            self._record_permission_fields(operation_type, fields_map)
+            self.serializer_options[f"{operation_type}_fields_map"] = fields_map
+        return self._write_fields_maps[operation_type]
+
+    def _record_permission_fields(self, operation_type: str, fields_map: Dict[str, Set[str]]) -> None:
+        """Record permission-validated fields in telemetry."""
+        telemetry_ctx = get_telemetry_context()
+        if telemetry_ctx and fields_map:
+            model_name = self.engine.get_model_name(self.model)
+            telemetry_ctx.record_permission_fields(
+                model_name, operation_type, list(fields_map.get(model_name, set()))
+            )
+
     def _process_nested_field_strings(
         self, orm_provider: AbstractORMProvider, field_strings, available_fields_map,
         operation_type: Literal["read", "create", "update"] = "read",
@@ -158,7 +231,7 @@ class ASTParser:
             Dict[str, Set[str]]: Dictionary mapping model names to sets of field names
         """
         fields_map = {}
-        model_graph: nx.DiGraph = orm_provider.build_model_graph(self.model)
+        model_graph: ModelGraph = orm_provider.build_model_graph(self.model)
 
         # Start with the root model
         root_model_name = orm_provider.get_model_name(self.model)
@@ -190,17 +263,9 @@ class ASTParser:
                 # If this is the last part, we might need to include all fields if it's a relation
                 if i == len(parts) - 1:
                     # Find the field node in the graph to check if it's a relation
-                    field_nodes = [
-                        node
-                        for node in model_graph.successors(current_model_name)
-                        if model_graph.nodes[node].get("data")
-                        and model_graph.nodes[node].get("data").field_name == part
-                    ]
-
-                    if field_nodes:
-                        field_node = field_nodes[0]
-                        field_data = model_graph.nodes[field_node].get("data")
+                    field_data = model_graph.field(current_model_name, part)
 
+                    if field_data:
                         # If this is a relation field, include all available fields of the related model
                         if (
                             field_data
@@ -238,14 +303,9 @@ class ASTParser:
                     break
 
                 # Find the field node in the graph
-                field_nodes = [
-                    node
-                    for node in model_graph.successors(current_model_name)
-                    if model_graph.nodes[node].get("data")
-                    and model_graph.nodes[node].get("data").field_name == part
-                ]
-
-                if not field_nodes:
+                field_data = model_graph.field(current_model_name, part)
+
+                if not field_data:
                     if self.config.effective_extra_fields == EXTRA_FIELDS_ERROR:
                         raise ValidationError(
                             f"Field '{part}' does not exist on model '{current_model_name}'."
@@ -253,9 +313,6 @@ class ASTParser:
                     # Field not found, skip to next field string
                     break
 
-                field_node = field_nodes[0]
-                field_data = model_graph.nodes[field_node].get("data")
-
                 # If this is a relation field, move to the related model
                 if field_data and field_data.is_relation and field_data.related_model:
                     related_model = orm_provider.get_model_by_name(
@@ -286,6 +343,77 @@ class ASTParser:
         Returns:
             Dict[str, Set[str]]: Fields map with model names as keys and sets of field names as values
         """
+        filter_fields = self.serializer_options.get("_filter_fields", set())
+        cache_key = (
+            "fields_map",
+            self.model,
+            operation_type,
+            depth,
+            frozenset(requested_fields or ()),
+            frozenset(filter_fields or ()),
+            self.config.effective_extra_fields,
+        )
+        cached = self.field_map_cache.get(cache_key)
+        if cached is None:
+            cached = _shared_field_maps.get(cache_key, self._permission_signature)
+            if cached is not None:
+                self.field_map_cache[cache_key] = cached
+        if cached is not None:
+            return {name: set(fields) for name, fields in cached.items()}
+
+        # Track which models' permissions the computation depends on, so the
+        # result can be shared with requests whose permissions fingerprint the same
+        self._consulted_models = set()
+        try:
+            fields_map = self._build_operation_field_map(
+                requested_fields, depth, operation_type, filter_fields
+            )
+            consulted_models = tuple(
+                sorted(self._consulted_models, key=self.engine.get_model_name)
+            )
+        finally:
+            self._consulted_models = None
+
+        snapshot = {name: frozenset(fields) for name, fields in fields_map.items()}
+        self.field_map_cache[cache_key] = snapshot
+        signature = self._permission_signature(consulted_models)
+        if signature is not None:
+            _shared_field_maps.set(cache_key, consulted_models, signature, snapshot)
+        return fields_map
+
+    def _permission_signature(self, models: Tuple[Type, ...]) -> Optional[tuple]:
+        """
+        Fingerprint the permissions of ``models`` for the current request, or
+        None if any of their permission classes doesn't provide a fingerprint.
+        """
+        resolver = get_permission_resolver(self.registry, self.request)
+        signature = []
+        for model in models:
+            try:
+                fingerprint = resolver.permission_fingerprint(model)
+                model_config = self.registry.get_config(model)
+            except ValueError:
+                # Unregistered model: it never contributes any fields
+                signature.append(None)
+                continue
+            if fingerprint is None:
+                return None
+            # The exposed fields are part of the result too and can be changed at runtime
+            exposed = model_config.fields
+            signature.append((
+                fingerprint,
+                exposed if exposed == "__all__" else frozenset(exposed),
+                tuple(field.name for field in model_config.additional_fields),
+            ))
+        return tuple(signature)
+
+    def _build_operation_field_map(
+        self,
+        requested_fields: Optional[Set[str]],
+        depth: int,
+        operation_type: Literal["read", "create", "update"],
+        filter_fields: Set[str],
+    ) -> Dict[str, Set[str]]:
         # Build a fields map specific to this operation type
         fields_map = self._get_depth_based_fields(
             orm_provider=self.engine, depth=depth, operation_type=operation_type
@@ -293,7 +421,6 @@ class ASTParser:
 
         # Merge filter fields into requested_fields so they go through permission validation
         # This must happen AFTER _get_depth_based_fields resolves __all__ to actual field names
-        filter_fields = self.serializer_options.get("_filter_fields", set())
         if filter_fields and requested_fields:
             requested_fields = set(requested_fields) | filter_fields
 
@@ -318,14 +445,13 @@ class ASTParser:
         Returns:
             Boolean indicating if permission is granted for the operation
         """
+        if self._consulted_models is not None:
+            self._consulted_models.add(model)
         try:
-            model_config = self.registry.get_config(model)
-            allowed_actions = set()
-
             # Collect all allowed actions from all permissions
-            for permission_cls in model_config.permissions:
-                permission: AbstractPermission = permission_cls()
-                allowed_actions.update(permission.allowed_actions(self.request, model))
+            allowed_actions = get_permission_resolver(
+                self.registry, self.request
+            ).model_allowed_actions(model)
 
             # Map operation types to ActionType enum values
             operation_to_action = {
@@ -358,7 +484,7 @@ class ASTParser:
         """
         fields_map = {}
         visited = set()
-        model_graph: nx.DiGraph = orm_provider.build_model_graph(self.model)
+        model_graph: ModelGraph = orm_provider.build_model_graph(self.model)
 
         # Start BFS from the root model
         queue = deque([(self.model, 0)])
@@ -385,23 +511,18 @@ class ASTParser:
             fields_map.setdefault(model_name, set())
 
             # Collect all directly accessible fields from the model
-            for node in model_graph.successors(model_name):
-                # Each successor of the model node is a field node
-                field_data = model_graph.nodes[node].get("data")
-                if field_data:
-                    field_name = field_data.field_name
-                    # Add this field to the fields map if it's in allowed_fields
-                    if field_name in allowed_fields:
-                        fields_map[model_name].add(field_name)
+            for field_data in model_graph.fields(model_name):
+                # Add this field to the fields map if it's in allowed_fields
+                if field_data.field_name in allowed_fields:
+                    fields_map[model_name].add(field_data.field_name)
 
             # Stop traversing if we've reached max depth
             if current_depth >= depth:
                 continue
 
             # Now, traverse relation fields to add related models
-            for node in model_graph.successors(model_name):
-                field_data = model_graph.nodes[node].get("data")
-                if field_data and field_data.is_relation and field_data.related_model:
+            for field_data in model_graph.fields(model_name):
+                if field_data.is_relation and field_data.related_model:
                     field_name = field_data.field_name
                     # Only traverse relations we have permission to access
                     if field_name in allowed_fields:
@@ -426,6 +547,8 @@ class ASTParser:
         Returns:
             Set of field names allowed for the operation
         """
+        if self._consulted_models is not None:
+            self._consulted_models.add(model)
         try:
             model_config = self.registry.get_config(model)
             all_fields = self.engine.get_fields(model)
@@ -441,25 +564,27 @@ class ASTParser:
             }
             required_action = operation_to_action.get(operation_type)
 
-            for permission_cls in model_config.permissions:
-                permission: AbstractPermission = permission_cls()
-
+            resolver = get_permission_resolver(self.registry, self.request)
+            permission_classes = model_config.permissions
+            for permission_cls, permission in zip(
+                permission_classes, resolver.instances_for(permission_classes)
+            ):
                 # Only include fields if this permission allows the required action
-                if required_action and required_action not in permission.allowed_actions(self.request, model):
+                if required_action and required_action not in resolver.allowed_actions(permission, model):
                     continue
 
                 # Get the appropriate field set based on operation
                 if operation_type == "read":
                     fields: Union[Set[str], Literal["__all__"]] = (
-                        permission.visible_fields(self.request, model)
+                        resolver.visible_fields(permission, model)
                     )
                 elif operation_type == "create":
                     fields: Union[Set[str], Literal["__all__"]] = (
-                        permission.create_fields(self.request, model)
+                        resolver.create_fields(permission, model)
                     )
                 elif operation_type == "update":
                     fields: Union[Set[str], Literal["__all__"]] = (
-                        permission.editable_fields(self.request, model)
+                        resolver.editable_fields(permission, model)
                     )
                 else:
                     fields = set()  # Default to no fields for unknown operations
@@ -939,7 +1064,6 @@ class ASTParser:
 
     def _handle_aggregate(self, ast: Dict[str, Any]) -> Dict[str, Any]:
         """ Pass current queryset to all aggregate methods."""
-        from statezero.core.query_cache import get_cached_query_result, cache_query_result
 
         op_type = ast.get("type")
 
@@ -958,21 +1082,17 @@ class ASTParser:
             # Create operation context from all aggregates
             operation_context = f"aggregate:{','.join(f'{f}:{fld}' for f, fld in aggs.items())}"
 
-            # Try cache with operation context
-            cached_result = get_cached_query_result(self.current_queryset, operation_context)
-            if cached_result is not None:
-                return cached_result
-
-            result_data = self.engine.aggregate(self.current_queryset, agg_list)
-            result = {
-                "data": result_data,
-                "metadata": {
-                    "aggregate": True,
-                    "response_type": ResponseType.NUMBER.value,
-                },
-            }
-            cache_query_result(self.current_queryset, result, operation_context)
-            return result
+            def execute() -> Dict[str, Any]:
+                result_data = self.engine.aggregate(self.current_queryset, agg_list)
+                return {
+                    "data": result_data,
+                    "metadata": {
+                        "aggregate": True,
+                        "response_type": ResponseType.NUMBER.value,
+                    },
+                }
+
+            return self._execute_cached(self.current_queryset, operation_context, execute)
         else:
             field = ast.get("field")
             if not field:
@@ -980,73 +1100,42 @@ class ASTParser:
 
             self._validate_aggregate_field(field)
 
+            engine_methods = {
+                "count": self.engine.count,
+                "sum": self.engine.sum,
+                "avg": self.engine.avg,
+                "min": self.engine.min,
+                "max": self.engine.max,
+            }
+            engine_method = engine_methods.get(op_type)
+            if engine_method is None:
+                return None
+
             # Create operation context: "operation_type:field"
             operation_context = f"{op_type}:{field}"
 
-            # Try cache with operation context
-            cached_result = get_cached_query_result(self.current_queryset, operation_context)
-            if cached_result is not None:
-                return cached_result
-
-            if op_type == "count":
-                result_val = self.engine.count(self.current_queryset, field)
-                result = {
+            def execute() -> Dict[str, Any]:
+                result_val = engine_method(self.current_queryset, field)
+                return {
                     "data": result_val,
                     "metadata": {
-                        "count": True,
+                        op_type: True,
                         "response_type": ResponseType.NUMBER.value,
                     },
                 }
-                cache_query_result(self.current_queryset, result, operation_context)
-                return result
-            elif op_type == "sum":
-                result_val = self.engine.sum(self.current_queryset, field)
-                result = {
-                    "data": result_val,
-                    "metadata": {
-                        "sum": True,
-                        "response_type": ResponseType.NUMBER.value,
-                    },
-                }
-                cache_query_result(self.current_queryset, result, operation_context)
-                return result
-            elif op_type == "avg":
-                result_val = self.engine.avg(self.current_queryset, field)
-                result = {
-                    "data": result_val,
-                    "metadata": {
-                        "avg": True,
-                        "response_type": ResponseType.NUMBER.value,
-                    },
-                }
-                cache_query_result(self.current_queryset, result, operation_context)
-                return result
-            elif op_type == "min":
-                result_val = self.engine.min(self.current_queryset, field)
-                result = {
-                    "data": result_val,
-                    "metadata": {
-                        "min": True,
-                        "response_type": ResponseType.NUMBER.value,
-                    },
-                }
-                cache_query_result(self.current_queryset, result, operation_context)
-                return result
-            elif op_type == "max":
-                result_val = self.engine.max(self.current_queryset, field)
-                result = {
-                    "data": result_val,
-                    "metadata": {
-                        "max": True,
-                        "response_type": ResponseType.NUMBER.value,
-                    },
-                }
-                cache_query_result(self.current_queryset, result, operation_context)
-                return result
+
+            return self._execute_cached(self.current_queryset, operation_context, execute)
 
     def _handle_read(self, ast: Dict[str, Any]) -> Dict[str, Any]:
         """ Pass current queryset to fetch_list method."""
-        from statezero.core.query_cache import get_cached_query_result, cache_query_result
+        if self.serializer_options.get("stream"):
+            return self._handle_read_stream()
+        if (
+            self.serializer_options.get("pagination") == "cursor"
+            or self.serializer_options.get("after") is not None
+            or self.serializer_options.get("before") is not None
+        ):
+            return self._handle_read_keyset(ast)
 
         offset_raw = self.serializer_options.get("offset", 0)
         limit_raw = self.serializer_options.get("limit", self.config.default_limit)
@@ -1067,49 +1156,235 @@ class ASTParser:
         # Create operation context that includes a stable visible_fields fingerprint.
         # This isolates cached read responses by response shape.
         operation_context = f"read:fields_hash={self._visible_fields_fingerprint()}"
+        include_total = bool(self.serializer_options.get("include_total"))
+        if include_total:
+            # The total is cached with the page under the same fingerprint
+            operation_context = f"{operation_context}:total"
+
+        def execute() -> Dict[str, Any]:
+            # Execute query with permission checks
+            # Pass UNSLICED queryset so permission checks can filter it,
+            # but with offset/limit so fetch_list can apply pagination after permission checks
+            metadata = {"read": True, "response_type": ResponseType.QUERYSET.value}
+            if include_total:
+                rows, total = self.engine.fetch_list_with_total(
+                    self.current_queryset,
+                    offset=offset,
+                    limit=limit_val,
+                    req=self.request,
+                    permissions=permissions,
+                )
+            else:
+                rows = self.engine.fetch_list(
+                    self.current_queryset,
+                    offset=offset,
+                    limit=limit_val,
+                    req=self.request,
+                    permissions=permissions,
+                )
+
+            # Serialize
+            serialized = self.serializer.serialize(
+                rows,
+                self.model,
+                many=True,
+                depth=self.depth,
+                fields_map=self.read_fields_map,
+            )
+            if include_total:
+                # Read after serializing: the page may carry the total itself
+                metadata["total"] = total()
+
+            return {"data": serialized, "metadata": metadata}
+
+        # Cached responses are returned directly; concurrent identical reads are
+        # coalesced so only one request executes and serializes the query.
+        return self._execute_cached(paginated_qs, operation_context, execute)
+
+    def _handle_read_keyset(self, ast: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Read one keyset page, positioned by the opaque ``after``/``before``
+        cursors returned in the metadata of the neighbouring pages.
+        """
+        if self.serializer_options.get("offset"):
+            raise ValidationError("offset cannot be combined with cursor pagination.")
+        limit_raw = self.serializer_options.get("limit", self.config.default_limit)
+        limit_val = int(limit_raw) if limit_raw is not None else None
+        self._validate_cursor_ordering(ast.get("orderBy", []))
+
+        page = self.engine.keyset_page(
+            self.current_queryset,
+            ast.get("orderBy", []),
+            limit_val,
+            after=self.serializer_options.get("after"),
+            before=self.serializer_options.get("before"),
+        )
+        if page is None:
+            raise ValidationError("Cursor pagination is not supported for this model.")
+
+        # The seek predicate carries the cursor values, so each cursor position
+        # gets its own cache entry
+        operation_context = f"read:keyset:fields_hash={self._visible_fields_fingerprint()}"
+        include_total = bool(self.serializer_options.get("include_total"))
+        if include_total:
+            operation_context = f"{operation_context}:total"
+
+        def execute() -> Dict[str, Any]:
+            rows, cursors = page.fetch()
+            metadata = {"read": True, "response_type": ResponseType.QUERYSET.value, **cursors}
+            if include_total:
+                metadata["total"] = self.engine.count(self.current_queryset, "pk")
+            serialized = self.serializer.serialize(
+                rows,
+                self.model,
+                many=True,
+                depth=self.depth,
+                fields_map=self.read_fields_map,
+            )
+            return {"data": serialized, "metadata": metadata}
+
+        return self._execute_cached(page.queryset, operation_context, execute)
+
+    def _handle_read_stream(self) -> ReadStream:
+        """
+        Return the read as a ReadStream that serializes it chunk by chunk.
+
+        Streaming reads bypass the query cache, and the default limit does not
+        apply to them: they exist to export whole querysets without holding
+        the response in memory.
+        """
+        stream_format = self.serializer_options.get("stream")
+        if stream_format is True:
+            stream_format = "ndjson"
+        if stream_format not in STREAM_FORMATS:
+            raise ValidationError(
+                f"Unsupported stream format {stream_format!r}; "
+                f"expected one of {', '.join(sorted(STREAM_FORMATS))}."
+            )
+
+        offset_raw = self.serializer_options.get("offset", 0)
+        limit_raw = self.serializer_options.get("limit")
+        max_chunk_size = getattr(settings, "STATEZERO_STREAM_CHUNK_SIZE", 1000)
+        chunk_size_raw = self.serializer_options.get("chunk_size", max_chunk_size)
+        try:
+            offset = int(offset_raw) if offset_raw is not None else 0
+            limit = int(limit_raw) if limit_raw is not None else None
+            chunk_size = min(int(chunk_size_raw), max_chunk_size)
+        except (TypeError, ValueError):
+            raise ValidationError("offset, limit and chunk_size must be integers.")
+        if chunk_size < 1:
+            raise ValidationError("chunk_size must be at least 1.")
 
-        # Try cache with the paginated queryset and operation context
-        # This also handles waiting for other requests processing the same query (request coalescing)
-        cached_result = get_cached_query_result(paginated_qs, operation_context)
-        if cached_result is not None:
-            return cached_result
-
-        # Cache miss - try to acquire lock for request coalescing
-        # If we can't acquire lock, another request is processing this query
-        # and get_cached_query_result already waited for it. If we're still here,
-        # either we got the lock or the wait timed out, so execute the query.
-        from statezero.core.query_cache import acquire_query_lock
-        acquire_query_lock(paginated_qs, operation_context)
-
-        # Execute query with permission checks
-        # Pass UNSLICED queryset so permission checks can filter it,
-        # but with offset/limit so fetch_list can apply pagination after permission checks
         rows = self.engine.fetch_list(
             self.current_queryset,
             offset=offset,
-            limit=limit_val,
+            limit=limit,
             req=self.request,
-            permissions=permissions,
+            permissions=self.registry.get_config(self.model).permissions,
         )
-
-        # Serialize
-        serialized = self.serializer.serialize(
+        chunks = self.serializer.serialize_chunks(
             rows,
             self.model,
-            many=True,
             depth=self.depth,
             fields_map=self.read_fields_map,
+            chunk_size=chunk_size,
+        )
+        return ReadStream(
+            chunks,
+            metadata={
+                "read": True,
+                "response_type": ResponseType.QUERYSET.value,
+                "stream": stream_format,
+                "chunk_size": chunk_size,
+            },
+            format=stream_format,
         )
 
-        result = {
-            "data": serialized,
-            "metadata": {"read": True, "response_type": ResponseType.QUERYSET.value},
-        }
+    def _validate_cursor_ordering(self, order_by: List[str]) -> None:
+        """
+        Cursors carry the value of every ordering field, so each segment of an
+        ordering path must be readable on the model it reaches, not just the
+        first one that _apply_ordering checks.
+        """
+        model_graph: ModelGraph = self.engine.build_model_graph(self.model)
+        for entry in order_by:
+            path = entry.lstrip("-")
+            current_model = self.model
+            current_model_name = self.engine.get_model_name(self.model)
+            for part in path.split("__"):
+                if part == "pk":
+                    break
+                allowed = self.read_fields_map.get(current_model_name)
+                if allowed is None:
+                    # Beyond the read depth: resolve the model's permissions now
+                    allowed = (
+                        self._get_operation_fields(current_model, "read")
+                        if self._has_operation_permission(current_model, "read")
+                        else set()
+                    )
+                if part not in allowed:
+                    raise PermissionDenied(
+                        f"You do not have permission to order by field '{path}'."
+                    )
+                field_data = model_graph.field(current_model_name, part)
+                if not (field_data and field_data.is_relation and field_data.related_model):
+                    break
+                current_model_name = field_data.related_model
+                current_model = self.engine.get_model_by_name(current_model_name)
 
-        # Cache the result with operation context
-        cache_query_result(paginated_qs, result, operation_context)
+    def _execute_cached(
+        self, queryset: Any, operation_context: str, execute: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Run execute() through the query cache, honouring the model's cache policy.
+        """
+        from statezero.core.query_cache import get_or_execute_query, get_query_fingerprint
 
-        return result
+        policy = self.registry.get_config(self.model).cache_policy
+        if not policy.cacheable or not self.use_query_cache:
+            return execute()
+
+        if policy.scope == CacheScope.PERMISSION:
+            operation_context = f"{operation_context}:perm={self._permission_fingerprint()}"
+
+        # Compile the SQL and derive the cache key once for the whole cache path
+        fingerprint = get_query_fingerprint(
+            queryset, operation_context, models=self.read_fields_map.keys()
+        )
+        return get_or_execute_query(
+            queryset,
+            execute,
+            operation_context,
+            fingerprint=fingerprint,
+            ttl=policy.ttl,
+            max_payload_bytes=policy.max_payload_bytes,
+            stale_while_revalidate=policy.stale_while_revalidate,
+        )
+
+    def _permission_fingerprint(self) -> str:
+        """
+        Return a stable hash of the permissions that apply to this request,
+        for caches scoped per permission fingerprint.
+
+        Each permission contributes its ``cache_fingerprint`` (e.g. a role), so
+        requests with the same permission set share entries. A permission
+        without one contributes the user's pk instead.
+        """
+        user = getattr(self.request, "user", None)
+        permission_classes = self.registry.get_config(self.model).permissions
+        permissions = get_permission_resolver(self.registry, self.request).instances_for(
+            permission_classes
+        )
+        parts = []
+        for permission_cls, permission in zip(permission_classes, permissions):
+            fingerprint = permission.cache_fingerprint(self.request, self.model)
+            parts.append([
+                f"{permission_cls.__module__}.{permission_cls.__qualname__}",
+                "user" if fingerprint is None else "fingerprint",
+                str(getattr(user, "pk", None) if fingerprint is None else fingerprint),
+            ])
+        payload = json.dumps(sorted(parts), sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
     def _visible_fields_fingerprint(self) -> str:
         """
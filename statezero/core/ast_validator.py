@@ -6,6 +6,7 @@ import networkx as nx
 from statezero.core.config import Registry
 from statezero.core.exceptions import PermissionDenied, ValidationError
 from statezero.core.interfaces import AbstractPermission
+from statezero.core.permission_resolver import get_permission_resolver
 from statezero.core.types import ActionType, ORMModel, RequestType
 
 # Lookup operators and date/time transforms that are not real model fields
@@ -51,9 +52,8 @@ class ASTValidator:
         Given a model, return a list of permission instances as specified in its ModelConfig.
         (You might cache these or use a more sophisticated composition in a real app.)
         """
-        config = self.registry.get_config(model)
-        # Instantiate each permission class (assuming no extra init parameters).
-        return [perm_class() for perm_class in config.permissions]
+        # Instances are shared for the whole request by the permission resolver.
+        return get_permission_resolver(self.registry, self.request).get_permissions(model)
 
     def _allowed_fields_for_model(self, model: Type) -> Set[str]:
         """
@@ -61,12 +61,13 @@ class ASTValidator:
         Only includes fields from permissions that grant READ access.
         """
         allowed_fields: Set[str] = set()
+        resolver = get_permission_resolver(self.registry, self.request)
         for perm in self._aggregate_permission_instances(model):
             # Only include fields from permissions that allow READ action
-            if ActionType.READ not in perm.allowed_actions(self.request, model):
+            if ActionType.READ not in resolver.allowed_actions(perm, model):
                 continue
 
-            fields = perm.visible_fields(self.request, model)
+            fields = resolver.visible_fields(perm, model)
             if fields == "__all__":
                 # If any permission allows all fields, return all available fields
                 from statezero.adaptors.django.config import config
@@ -79,10 +80,9 @@ class ASTValidator:
         """
         Checks if any of the permission instances for the model allow the READ action.
         """
-        for perm in self._aggregate_permission_instances(model):
-            if ActionType.READ in perm.allowed_actions(self.request, model):
-                return True
-        return False
+        return ActionType.READ in get_permission_resolver(
+            self.registry, self.request
+        ).model_allowed_actions(model)
 
     def _is_additional_field(self, model: Type, field_name: str) -> bool:
         """
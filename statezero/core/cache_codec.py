@@ -0,0 +1,161 @@
+"""
+Binary codecs for query cache values.
+
+Encoded payloads start with a version byte and a format byte, so entries
+written by an older or differently configured codec decode as a cache miss
+instead of returning garbage:
+
+    [version][serializer id | compressor id << 4][body]
+
+msgpack, zstandard and lz4 are optional. When they are not installed the
+codec falls back to pickle and zlib.
+"""
+import logging
+import pickle
+import zlib
+from typing import Any, Optional
+
+from statezero.core.interfaces import AbstractCacheCodec
+
+logger = logging.getLogger(__name__)
+
+CODEC_VERSION = 1
+
+# Serializer ids
+PICKLE = 0
+MSGPACK = 1
+
+# Compressor ids
+NONE = 0
+ZLIB = 1
+ZSTD = 2
+LZ4 = 3
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
+
+
+def _best_compressor() -> int:
+    if zstandard is not None:
+        return ZSTD
+    if lz4_frame is not None:
+        return LZ4
+    return ZLIB
+
+
+class BinaryCacheCodec(AbstractCacheCodec):
+    """
+    Serialize with msgpack (falling back to pickle for values msgpack can't
+    represent) and compress payloads above a size threshold.
+
+    Args:
+        serializer: "auto", "msgpack" or "pickle". "auto" uses msgpack when installed.
+        compressor: "auto", "zstd", "lz4", "zlib" or "none". "auto" picks the best installed.
+        threshold: Payloads smaller than this many bytes are stored uncompressed.
+        level: Compression level passed to the compressor (None for its default).
+    """
+
+    _COMPRESSORS = {"none": NONE, "zlib": ZLIB, "zstd": ZSTD, "lz4": LZ4}
+
+    def __init__(
+        self,
+        serializer: str = "auto",
+        compressor: str = "auto",
+        threshold: int = 1024,
+        level: Optional[int] = None,
+    ):
+        if serializer == "auto":
+            serializer = "msgpack" if msgpack is not None else "pickle"
+        if serializer == "msgpack" and msgpack is None:
+            raise ImportError("msgpack is required for the msgpack cache serializer")
+        self.serializer = MSGPACK if serializer == "msgpack" else PICKLE
+
+        self.compressor = (
+            _best_compressor() if compressor == "auto" else self._COMPRESSORS[compressor]
+        )
+        if self.compressor == ZSTD and zstandard is None:
+            raise ImportError("zstandard is required for zstd cache compression")
+        if self.compressor == LZ4 and lz4_frame is None:
+            raise ImportError("lz4 is required for lz4 cache compression")
+
+        self.threshold = threshold
+        self.level = level
+
+    def encode(self, value: Any) -> bytes:
+        serializer, body = self._serialize(value)
+        compressor = NONE
+        if self.compressor != NONE and len(body) >= self.threshold:
+            compressor = self.compressor
+            body = self._compress(compressor, body)
+        return bytes([CODEC_VERSION, serializer | (compressor << 4)]) + body
+
+    def decode(self, data: bytes) -> Optional[Any]:
+        if not isinstance(data, (bytes, bytearray)) or len(data) < 2:
+            return None
+        if data[0] != CODEC_VERSION:
+            return None
+        serializer, compressor = data[1] & 0x0F, data[1] >> 4
+        try:
+            body = self._decompress(compressor, bytes(data[2:]))
+            if serializer == MSGPACK:
+                return msgpack.unpackb(body, raw=False, strict_map_key=False)
+            return pickle.loads(body)
+        except Exception as e:
+            logger.warning(f"Could not decode cached value: {e}")
+            return None
+
+    def _serialize(self, value: Any):
+        if self.serializer == MSGPACK:
+            try:
+                return MSGPACK, msgpack.packb(value, use_bin_type=True)
+            except (TypeError, ValueError, OverflowError):
+                # Decimal, UUID, datetime... keep exact types via pickle
+                pass
+        return PICKLE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _compress(self, compressor: int, body: bytes) -> bytes:
+        if compressor == ZSTD:
+            level = self.level if self.level is not None else 3
+            return zstandard.ZstdCompressor(level=level).compress(body)
+        if compressor == LZ4:
+            level = self.level if self.level is not None else 0
+            return lz4_frame.compress(body, compression_level=level)
+        level = self.level if self.level is not None else 6
+        return zlib.compress(body, level)
+
+    def _decompress(self, compressor: int, body: bytes) -> bytes:
+        if compressor == NONE:
+            return body
+        if compressor == ZSTD:
+            return zstandard.ZstdDecompressor().decompress(body)
+        if compressor == LZ4:
+            return lz4_frame.decompress(body)
+        return zlib.decompress(body)
+
+
+class PickleCacheCodec(AbstractCacheCodec):
+    """Plain pickle with no compression - matches the cache backend's own behaviour."""
+
+    def encode(self, value: Any) -> bytes:
+        return bytes([CODEC_VERSION, PICKLE]) + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, data: bytes) -> Optional[Any]:
+        if not isinstance(data, (bytes, bytearray)) or data[:2] != bytes([CODEC_VERSION, PICKLE]):
+            return None
+        try:
+            return pickle.loads(data[2:])
+        except Exception as e:
+            logger.warning(f"Could not decode cached value: {e}")
+            return None
@@ -142,6 +142,53 @@ class ModelSchemaMetadata(BaseModel):
     # Display customization
     display: Optional[Dict[str, Any]] = None
 
+class CacheScope(str, Enum):
+    """Who may share a cached query response."""
+
+    # Keyed by SQL + visible fields only; permission filters are already in the SQL
+    SHARED = "shared"
+    # Additionally keyed by the requester's permission fingerprint
+    PERMISSION = "permission"
+
+
+@dataclass
+class CachePolicy:
+    """
+    Query cache behaviour for reads and aggregates on a model.
+
+    Attributes:
+        cacheable: Set to False to bypass the query cache entirely (e.g. large append-only tables)
+        ttl: Seconds a cached response is kept
+        max_payload_bytes: Responses larger than this (as encoded for the cache) are not cached
+        scope: Share responses across users, or scope them per permission fingerprint
+        stale_while_revalidate: On a miss, return the previous response for the same query
+            (flagged with metadata.stale) and refresh it in the background
+    """
+
+    cacheable: bool = True
+    ttl: int = 3600
+    max_payload_bytes: Optional[int] = None
+    scope: CacheScope = CacheScope.SHARED
+    stale_while_revalidate: bool = False
+
+
+@dataclass
+class QueryCostHints:
+    """
+    Estimates the query optimizer uses to choose between a JOIN (select_related)
+    and a separate pk-IN query (prefetch) when loading foreign keys.
+
+    Attributes:
+        row_width: Estimated bytes per row of this model. Defaults to an estimate
+            from the column types of the fields being loaded
+        fanout: Per foreign key / one-to-one field on this model, the average number
+            of rows of this model that reference the same related row
+    """
+
+    row_width: Optional[int] = None
+    fanout: Dict[str, float] = field(default_factory=dict)
+
+
 @dataclass
 class ModelSummaryRepresentation:
     pk: Any
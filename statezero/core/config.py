@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from contextvars import ContextVar
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional, Set, Type, Union, Literal
 import networkx as nx
 import warnings
 
 from pydantic import ConfigDict, TypeAdapter, ValidationError
 
-from statezero.core.classes import AdditionalField
+from statezero.core.classes import AdditionalField, CachePolicy, QueryCostHints
 from statezero.core.event_bus import EventBus
 from statezero.core.interfaces import (AbstractCustomQueryset,
                                        AbstractDataSerializer,
@@ -45,11 +46,20 @@ class ValidatedPermission:
     This catches common implementation errors like returning None instead of a set or queryset.
     """
 
+    # (permission class, method) pairs that have already returned a valid
+    # result. Outside of DEBUG, each pair is only validated on its first call.
+    _validated: Set[tuple] = set()
+
     def __init__(self, permission: AbstractPermission, cls_name: str):
         self._perm = permission
         self._cls_name = cls_name
 
     def _validate(self, validator: TypeAdapter, result: Any, method: str, hint: str):
+        from django.conf import settings
+
+        key = (type(self._perm), method)
+        if key in ValidatedPermission._validated and not settings.DEBUG:
+            return
         try:
             validator.validate_python(result)
         except ValidationError as e:
@@ -57,6 +67,7 @@ class ValidatedPermission:
                 f"{self._cls_name}.{method}() returned invalid type. {hint}\n"
                 f"Validation error: {e.errors()[0]['msg']}"
             )
+        ValidatedPermission._validated.add(key)
 
     def filter_queryset(self, request, queryset):
         result = self._perm.filter_queryset(request, queryset)
@@ -66,6 +77,11 @@ class ValidatedPermission:
         )
         return result
 
+    def filter_condition(self, request, model):
+        # Permissions that don't subclass AbstractPermission may not define it
+        condition = getattr(self._perm, "filter_condition", None)
+        return condition(request, model) if condition else None
+
     def exclude_from_queryset(self, request, queryset):
         result = self._perm.exclude_from_queryset(request, queryset)
         self._validate(
@@ -117,7 +133,13 @@ class ValidatedPermission:
     def bulk_operation_allowed(self, request, items, action_type, model):
         return self._perm.bulk_operation_allowed(request, items, action_type, model)
 
+    def cache_fingerprint(self, request, model):
+        # Permissions that don't subclass AbstractPermission may not define it
+        fingerprint = getattr(self._perm, "cache_fingerprint", None)
+        return fingerprint(request, model) if fingerprint else None
 
+
+@lru_cache(maxsize=None)
 def _make_validated_permission_class(perm_class: Type[AbstractPermission]) -> Type:
     """
     Creates a wrapper class that returns ValidatedPermission instances when instantiated.
@@ -299,6 +321,17 @@ class ModelConfig:
         Display metadata for frontend customization (DisplayMetadata instance)
     force_prefetch: Optional[List[str]], optional
         Field paths that should always be prefetched for this model (e.g., for __str__ or __img__ methods)
+    cache_policy: Optional[CachePolicy], optional
+        Query cache behaviour for reads and aggregates (cacheability, TTL, max payload size, scope)
+    include_repr: bool, default=True
+        Include the ``repr`` field (built from ``__str__`` and ``__img__``) in serialized rows
+    repr_expression: Optional[Any], optional
+        Expression (or field name) computed in SQL for ``repr.str`` instead of calling ``__str__``,
+        e.g. ``Concat("first_name", Value(" "), "last_name")``
+    repr_image: Optional[str], optional
+        Field path read in SQL for ``repr.img`` instead of calling ``__img__``
+    query_cost: Optional[QueryCostHints], optional
+        Row width and foreign key fan-out estimates used to choose between JOINs and prefetches
     DEBUG: bool, default=False
         Enable debug mode for this model
     """
@@ -316,6 +349,11 @@ class ModelConfig:
         fields: Optional[Union[Set[str], Literal["__all__"]]] = None,
         display: Optional[Any] = None,
         force_prefetch: Optional[List[str]] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        include_repr: bool = True,
+        repr_expression: Optional[Any] = None,
+        repr_image: Optional[str] = None,
+        query_cost: Optional[QueryCostHints] = None,
         DEBUG: bool = False,
     ):
         self.model = model
@@ -329,6 +367,11 @@ class ModelConfig:
         self.fields = fields or "__all__"
         self.display = display
         self.force_prefetch = force_prefetch or []
+        self.cache_policy = cache_policy or CachePolicy()
+        self.include_repr = include_repr
+        self.repr_expression = repr_expression
+        self.repr_image = repr_image
+        self.query_cost = query_cost or QueryCostHints()
         self.DEBUG = DEBUG or False
 
         # Warn about additional fields that won't be included when fields is not __all__
@@ -348,6 +391,12 @@ class ModelConfig:
     @property
     def permissions(self):
         """Resolve permission class strings to actual classes and wrap with validation"""
+        # Resolution is cached until _permissions is reassigned or modified
+        source = tuple(self._permissions)
+        cached = getattr(self, "_resolved_permissions", None)
+        if cached is not None and cached[0] == source:
+            return list(cached[1])
+
         resolved = []
         for perm in self._permissions:
             if isinstance(perm, str):
@@ -360,7 +409,8 @@ class ModelConfig:
                 perm_class = perm
             # Wrap with validation
             resolved.append(_make_validated_permission_class(perm_class))
-        return resolved
+        self._resolved_permissions = (source, resolved)
+        return list(resolved)
 
 
 class Registry:
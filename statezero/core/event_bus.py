@@ -51,6 +51,8 @@ class EventBus:
         if action_type in (ActionType.PRE_DELETE, ActionType.PRE_UPDATE):
             return
 
+        self._bump_cache_generation(instance.__class__)
+
         if not self.broadcast_emitter or not self.orm_provider:
             return
 
@@ -139,6 +141,8 @@ class EventBus:
         # Dispatch Django-style signal for receivers
         self._dispatch_bulk_signal(action_type, model_class, instances)
 
+        self._bump_cache_generation(model_class)
+
         if not self.broadcast_emitter or not self.orm_provider:
             return
 
@@ -192,6 +196,26 @@ class EventBus:
                 e,
             )
 
+    def _bump_cache_generation(self, model_class: Type) -> None:
+        """
+        Invalidate generation-keyed query cache entries that depend on this model.
+
+        Parameters:
+        -----------
+        model_class: Type
+            The model class whose data changed
+        """
+        try:
+            from statezero.core.query_cache import bump_model_generations
+
+            bump_model_generations([model_class._meta.label_lower])
+        except Exception as e:
+            logger.exception(
+                "Error bumping cache generation for %s: %s",
+                model_class,
+                e,
+            )
+
     def _dispatch_bulk_signal(
         self, action_type: ActionType, model_class: Type, instances: List[Any]
     ) -> None:
@@ -112,6 +112,17 @@ class ASTValidationError(StateZeroError):
         super().__init__(detail, self.default_code)
 
 
+class QueryTimeout(StateZeroError):
+    """Error raised when a coalesced query did not complete in time. Corresponds to HTTP 503."""
+
+    status_code = 503
+    default_detail = "Query timed out."
+    default_code = "query_timeout"
+
+    def __init__(self, detail: Optional[str] = None):
+        super().__init__(detail, self.default_code)
+
+
 class ConfigError(Exception):
     """Error raised for configuration issues."""
     pass
@@ -5,6 +5,8 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -170,6 +172,57 @@ class AbstractORMProvider(ABC):
         """
         pass
 
+    def fetch_list_with_total(
+        self,
+        queryset: ORMQuerySet,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        req: Optional[RequestType] = None,
+        permissions: Optional[List[Type]] = None,
+    ) -> Tuple[ORMQuerySet, Callable[[], int]]:
+        """
+        Return the page from ``fetch_list`` together with a callable giving the
+        total number of rows in the unsliced queryset. Call it only after the
+        page has been consumed.
+
+        By default the total is a separate count of the same queryset. Override
+        this where the backend can return both from one query.
+        """
+        rows = self.fetch_list(
+            queryset, offset=offset, limit=limit, req=req, permissions=permissions
+        )
+        return rows, lambda: self.count(queryset, "pk")
+
+    def filter_any(self, queryset: ORMQuerySet, conditions: List[Any]) -> Optional[ORMQuerySet]:
+        """
+        Return the queryset restricted to rows matching any of ``conditions``
+        (from ``AbstractPermission.filter_condition``) in a single filter.
+
+        Return None (the default) if the provider cannot combine conditions;
+        each permission's ``filter_queryset`` is then applied instead.
+        """
+        return None
+
+    def keyset_page(
+        self,
+        queryset: ORMQuerySet,
+        order_by: List[str],
+        limit: Optional[int],
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> Optional[Any]:
+        """
+        Return one keyset (cursor) page of the queryset, positioned after or
+        before an opaque cursor from a previous page.
+
+        The page exposes ``queryset``, the query that identifies it (used for
+        cache keys), and ``fetch()``, which returns the page rows in display order
+        and ``{"next_cursor": ..., "prev_cursor": ...}``. Return None (the
+        default) if the provider does not support cursor pagination; such reads
+        are rejected as invalid.
+        """
+        return None
+
     # === Aggregate Methods ===
 
     @abstractmethod
@@ -402,6 +455,9 @@ class AbstractORMProvider(ABC):
     def build_model_graph(self, model: ORMModel) -> Any:  # type:ignore
         """
         Construct a graph representation of model relationships.
+
+        Implementations should return a ``statezero.core.model_graph.ModelGraph``
+        (ideally one built once at startup) rather than rebuilding it per request.
         """
         pass
 
@@ -443,6 +499,23 @@ class AbstractDataSerializer(ABC):
         """
         pass
 
+    def serialize_chunks(
+        self,
+        data: Any,
+        model: ORMModel,  # type:ignore
+        depth: int,
+        fields_map: Dict[str, Set[str]],
+        chunk_size: int,
+    ) -> Iterator[dict]:
+        """
+        Serialize a list of rows as a sequence of ``serialize(..., many=True)``
+        results covering at most ``chunk_size`` top-level rows each.
+
+        By default the whole list is serialized as a single chunk. Override this
+        to keep memory bounded for streaming reads.
+        """
+        yield self.serialize(data, model, depth, fields_map, many=True)
+
     @abstractmethod
     def deserialize(
         self,
@@ -575,6 +648,19 @@ class AbstractPermission(ABC):
         """
         return queryset
 
+    def filter_condition(self, request: RequestType, model: ORMModel) -> Optional[Any]:
+        """
+        Optionally return the rows ``filter_queryset`` keeps as a filter condition
+        (for Django, a ``Q`` object or a boolean expression such as ``Exists``)
+        instead of a queryset.
+
+        Conditions from every permission that provides one are merged into a single
+        WHERE clause, rather than ORing separately filtered querysets together,
+        which keeps the SQL small and index friendly. ``filter_queryset`` is still
+        used for permissions that return None, which is the default.
+        """
+        return None
+
     @abstractmethod
     def allowed_actions(
         self, request: RequestType, model: ORMModel
@@ -638,6 +724,20 @@ class AbstractPermission(ABC):
         """
         pass
 
+    def cache_fingerprint(self, request: RequestType, model: ORMModel) -> Optional[Hashable]:
+        """
+        Optionally return a hashable value (e.g. a role or tenant id) such that any two
+        requests with the same fingerprint get identical results from allowed_actions,
+        visible_fields, editable_fields and create_fields for this model.
+
+        Providing it lets StateZero reuse computed field maps across requests.
+        Query caches with ``CacheScope.PERMISSION`` also share responses between
+        requests with the same fingerprints, so it must cover filter_queryset
+        for such models too. By default None is returned, which disables that
+        reuse for the model.
+        """
+        return None
+
 class AbstractSearchProvider(ABC):
     """Base class for search providers in StateZero."""
 
@@ -725,3 +825,38 @@ class AbstractQueryOptimizer(ABC):
                         for generation) are missing.
         """
         raise NotImplementedError
+
+
+class AbstractCacheCodec(ABC):
+    """
+    Encodes query cache values before they are written to the shared cache.
+
+    Configure with STATEZERO_QUERY_CACHE_CODEC (dotted path to a subclass).
+    """
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """
+        Encode a cached response.
+
+        Args:
+            value: The serialized response dict
+
+        Returns:
+            bytes: The encoded payload stored in the cache
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Optional[Any]:
+        """
+        Decode a payload produced by encode().
+
+        Args:
+            data: The stored payload
+
+        Returns:
+            The original value, or None if the payload cannot be decoded
+            (e.g. written by an incompatible codec version) - treated as a cache miss.
+        """
+        pass
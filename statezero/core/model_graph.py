@@ -0,0 +1,106 @@
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+import networkx as nx
+
+from statezero.core.classes import FieldNode, ModelNode
+
+GraphNode = Union[ModelNode, FieldNode]
+
+
+class _NodeView:
+    """
+    Read-only stand-in for ``networkx.DiGraph.nodes`` so that code written
+    against ``graph.nodes[node].get("data")`` keeps working.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping[str, GraphNode]):
+        self._data = data
+
+    def __getitem__(self, node: str) -> Dict[str, GraphNode]:
+        return {"data": self._data[node]}
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ModelGraph:
+    """
+    Immutable model graph backed by plain dicts of tuples.
+
+    Nodes are the same ``ModelNode`` / ``FieldNode`` objects and ids
+    (``"app.Model"`` and ``"app.Model::field"``) that the networkx graph used,
+    and the read-only part of the ``DiGraph`` API used across StateZero
+    (``has_node``, ``nodes``, ``successors``, ``out_edges``) is supported.
+    ``field`` and ``fields`` give direct access to a model's field nodes
+    without scanning successors.
+
+    A graph is built once for every registered model at startup and then
+    shared between requests, so it must never be mutated.
+    """
+
+    __slots__ = ("_data", "_successors", "_fields", "nodes")
+
+    def __init__(
+        self,
+        data: Mapping[str, GraphNode],
+        successors: Mapping[str, Tuple[str, ...]],
+    ):
+        self._data = MappingProxyType(dict(data))
+        self._successors = MappingProxyType(
+            {node: tuple(targets) for node, targets in successors.items()}
+        )
+        fields: Dict[str, Dict[str, FieldNode]] = {}
+        for node, targets in self._successors.items():
+            if not isinstance(self._data.get(node), ModelNode):
+                continue
+            fields[node] = MappingProxyType(
+                {
+                    self._data[target].field_name: self._data[target]
+                    for target in targets
+                    if isinstance(self._data.get(target), FieldNode)
+                }
+            )
+        self._fields = MappingProxyType(fields)
+        self.nodes = _NodeView(self._data)
+
+    @classmethod
+    def from_digraph(cls, graph: nx.DiGraph) -> "ModelGraph":
+        """Freeze a networkx graph built by ``build_model_graph``."""
+        data = {}
+        successors = {}
+        for node, attrs in graph.nodes(data=True):
+            data[node] = attrs.get("data")
+            successors[node] = tuple(graph.successors(node))
+        return cls(data, successors)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def has_node(self, node: str) -> bool:
+        return node in self._data
+
+    def successors(self, node: str) -> Iterator[str]:
+        return iter(self._successors.get(node, ()))
+
+    def out_edges(self, node: str) -> List[Tuple[str, str]]:
+        return [(node, target) for target in self._successors.get(node, ())]
+
+    def field(self, model_name: str, field_name: str) -> Optional[FieldNode]:
+        """Return the field node for ``model_name.field_name``, if it exists."""
+        return self._fields.get(model_name, {}).get(field_name)
+
+    def fields(self, model_name: str) -> Tuple[FieldNode, ...]:
+        """Return every field node of ``model_name`` in declaration order."""
+        return tuple(self._fields.get(model_name, {}).values())
@@ -0,0 +1,125 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Literal, Optional, Sequence, Set, Type, Union
+
+from statezero.core.interfaces import AbstractPermission
+from statezero.core.types import ActionType, RequestType
+
+FieldSet = Union[Set[str], Literal["__all__"]]
+
+_resolver_var: ContextVar[Optional["PermissionResolver"]] = ContextVar(
+    "permission_resolver", default=None
+)
+
+
+class PermissionResolver:
+    """
+    Request-scoped cache for permission lookups.
+
+    Permission classes are instantiated once per request and the answers to
+    ``allowed_actions``, ``visible_fields``, ``editable_fields`` and
+    ``create_fields`` are memoized per (permission, model). Those methods only
+    depend on the request and the model, so every caller within the request
+    sees the same result without re-running user permission code.
+
+    Field sets are returned as copies because callers narrow them in place.
+    """
+
+    def __init__(self, registry: Any, request: RequestType):
+        self.registry = registry
+        self.request = request
+        self._instances: Dict[Type, AbstractPermission] = {}
+        self._results: Dict[tuple, Any] = {}
+
+    def instances_for(self, permission_classes: Sequence[Type]) -> List[AbstractPermission]:
+        """Instantiate each permission class once for this request."""
+        instances = []
+        for permission_cls in permission_classes:
+            instance = self._instances.get(permission_cls)
+            if instance is None:
+                instance = self._instances[permission_cls] = permission_cls()
+            instances.append(instance)
+        return instances
+
+    def get_permissions(self, model: Type) -> List[AbstractPermission]:
+        """Return the permission instances configured for ``model``."""
+        return self.instances_for(self.registry.get_config(model).permissions)
+
+    def _memoized(self, permission: AbstractPermission, method: str, model: Type) -> Any:
+        key = (id(permission), method, model)
+        if key not in self._results:
+            self._results[key] = getattr(permission, method)(self.request, model)
+        return self._results[key]
+
+    def allowed_actions(self, permission: AbstractPermission, model: Type) -> Set[ActionType]:
+        return set(self._memoized(permission, "allowed_actions", model))
+
+    def visible_fields(self, permission: AbstractPermission, model: Type) -> FieldSet:
+        return self._copy_fields(self._memoized(permission, "visible_fields", model))
+
+    def editable_fields(self, permission: AbstractPermission, model: Type) -> FieldSet:
+        return self._copy_fields(self._memoized(permission, "editable_fields", model))
+
+    def create_fields(self, permission: AbstractPermission, model: Type) -> FieldSet:
+        return self._copy_fields(self._memoized(permission, "create_fields", model))
+
+    def model_allowed_actions(self, model: Type) -> Set[ActionType]:
+        """Union of ``allowed_actions`` across every permission on ``model``."""
+        key = ("model_allowed_actions", model)
+        if key not in self._results:
+            allowed: Set[ActionType] = set()
+            for permission in self.get_permissions(model):
+                allowed |= self.allowed_actions(permission, model)
+            self._results[key] = allowed
+        return set(self._results[key])
+
+    def permission_fingerprint(self, model: Type) -> Optional[tuple]:
+        """
+        Combine the ``cache_fingerprint`` of every permission on ``model``.
+        Returns None if any of them does not provide one.
+        """
+        key = ("permission_fingerprint", model)
+        if key not in self._results:
+            permission_classes = self.registry.get_config(model).permissions
+            parts = []
+            for permission_cls, permission in zip(
+                permission_classes, self.instances_for(permission_classes)
+            ):
+                fingerprint = permission.cache_fingerprint(self.request, model)
+                if fingerprint is None:
+                    parts = None
+                    break
+                parts.append((permission_cls, fingerprint))
+            self._results[key] = tuple(parts) if parts is not None else None
+        return self._results[key]
+
+    @staticmethod
+    def _copy_fields(fields: FieldSet) -> FieldSet:
+        return fields if fields == "__all__" else set(fields)
+
+
+def get_permission_resolver(registry: Any, request: RequestType) -> PermissionResolver:
+    """
+    Return the resolver active for ``request``, or a fresh uncached one when
+    called outside a request scope (e.g. from tests or management commands).
+    """
+    resolver = _resolver_var.get()
+    if resolver is not None and resolver.request is request:
+        return resolver
+    return PermissionResolver(registry, request)
+
+
+@contextmanager
+def permission_resolution(registry: Any, request: RequestType) -> Iterator[PermissionResolver]:
+    """Make a single ``PermissionResolver`` available for the duration of a request."""
+    resolver = _resolver_var.get()
+    if resolver is not None and resolver.request is request:
+        # Nested scope for the same request (e.g. batch entries): reuse it
+        yield resolver
+        return
+    resolver = PermissionResolver(registry, request)
+    token = _resolver_var.set(resolver)
+    try:
+        yield resolver
+    finally:
+        _resolver_var.reset(token)
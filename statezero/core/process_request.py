@@ -1,5 +1,8 @@
+import json
 import logging
-from typing import Any, Dict, Optional, Set, Type
+from typing import Any, Dict, List, Optional, Set, Type
+
+from django.conf import settings
 
 from fastapi.encoders import jsonable_encoder
 
@@ -11,6 +14,9 @@ from statezero.core.exceptions import PermissionDenied, ValidationError
 from statezero.core.interfaces import (AbstractDataSerializer,
                                        AbstractORMProvider,
                                        AbstractSchemaGenerator)
+from statezero.core.permission_resolver import (get_permission_resolver,
+                                                permission_resolution)
+from statezero.core.streaming import ReadStream
 from statezero.core.types import ActionType
 from statezero.core.telemetry import create_telemetry_context, clear_telemetry_context
 
@@ -114,17 +120,16 @@ def _filter_writable_data(
     # Determine which action we're checking for
     required_action = ActionType.CREATE if create else ActionType.UPDATE
 
-    for permission_cls in model_config.permissions:
-        perm = permission_cls()
-
+    resolver = get_permission_resolver(Registry, req)
+    for perm in resolver.instances_for(model_config.permissions):
         # Only include fields if this permission allows the required action
-        if required_action not in perm.allowed_actions(req, model):
+        if required_action not in resolver.allowed_actions(perm, model):
             continue
 
         if create:
-            permission_fields = perm.create_fields(req, model)
+            permission_fields = resolver.create_fields(perm, model)
         else:
-            permission_fields = perm.editable_fields(req, model)
+            permission_fields = resolver.editable_fields(perm, model)
         # handle the __all__ shorthand
         if permission_fields == "__all__":
             permission_fields = all_fields
@@ -188,22 +193,68 @@ class RequestProcessor:
             raise ValidationError(str(e))
 
     def process_request(self, req: Any) -> Dict[str, Any]:
-        # Get telemetry context (created by adaptor before calling this)
-        from statezero.core.telemetry import get_telemetry_context
-        telemetry_ctx = get_telemetry_context()
-
         body: Dict[str, Any] = req.data or {}
-        ast_body: Dict[str, Any] = body.get("ast", {})
-        initial_query_ast: Dict[str, Any] = ast_body.get("initial_query", {})
-        final_query_ast: Dict[str, Any] = ast_body.get("query", {})
+        model_name: str = req.parser_context.get("kwargs", {}).get("model_name")
+        with permission_resolution(self.registry, req):
+            return self._process_query(req, model_name, body.get("ast", {}))
+
+    def process_batch(self, req: Any) -> List[Dict[str, Any]]:
+        """
+        Run a list of ``{"model_name": ..., "ast": ...}`` entries against the
+        same request and return their results in order.
+
+        Work that only depends on the request and the model (the permission
+        filtered base queryset, global action checks, the model graph, the
+        AST validator and the parser's field maps) is computed once per batch
+        and shared by every entry that targets the same model. The adaptor is
+        responsible for running the whole batch in a single transaction.
+        """
+        body: Dict[str, Any] = req.data or {}
+        entries = body.get("queries")
+        if not isinstance(entries, list):
+            raise ValidationError("Batch requests must provide a 'queries' list.")
 
-        # Record the query AST in telemetry
-        if telemetry_ctx:
-            telemetry_ctx.set_query_ast(final_query_ast)
+        max_queries = getattr(settings, "STATEZERO_BATCH_MAX_QUERIES", 50)
+        if max_queries and len(entries) > max_queries:
+            raise ValidationError(
+                f"Batch contains {len(entries)} queries; the maximum is {max_queries}."
+            )
 
-        model_name: str = req.parser_context.get("kwargs", {}).get("model_name")
-        model = self.orm_provider.get_model_by_name(model_name)
-        model_config: ModelConfig = self.registry.get_config(model)
+        memo: Dict[Any, Any] = {}
+        results = []
+        with permission_resolution(self.registry, req):
+            for index, entry in enumerate(entries):
+                try:
+                    if not isinstance(entry, dict) or not isinstance(
+                        entry.get("model_name"), str
+                    ):
+                        raise ValidationError(
+                            "Each batch entry must be an object with a 'model_name' string."
+                        )
+                    result = self._process_query(
+                        req, entry["model_name"], entry.get("ast") or {}, memo=memo
+                    )
+                    if isinstance(result, ReadStream):
+                        raise ValidationError(
+                            "Streaming reads cannot be part of a batch."
+                        )
+                    results.append(result)
+                except Exception as e:
+                    # Let the adaptor report which entry failed the batch
+                    e.batch_index = index
+                    raise
+        return results
+
+    def _get_permitted_queryset(
+        self,
+        req: Any,
+        model: Type,
+        model_config: ModelConfig,
+        initial_query_ast: Dict[str, Any],
+    ) -> Any:
+        """Build the base queryset for a model with all registered permissions applied."""
+        from statezero.core.telemetry import get_telemetry_context
+        telemetry_ctx = get_telemetry_context()
 
         base_queryset = self.orm_provider.get_queryset(
             req=req,
@@ -212,20 +263,32 @@ class RequestProcessor:
             registered_permissions=model_config.permissions,
         )
 
+        resolver = get_permission_resolver(self.registry, req)
+        permission_classes = model_config.permissions
+        permissions = resolver.instances_for(permission_classes)
+
         # Step 1: Apply filter_queryset with OR logic (additive permissions)
-        # Collect all filtered querysets from each permission
+        # Permissions that describe their rows as a filter condition are merged
+        # into one WHERE clause; the rest contribute a filtered queryset each.
         filtered_querysets = []
-        for permission_cls in model_config.permissions:
-            perm = permission_cls()
-
+        conditions = []
+        for permission_cls, perm in zip(permission_classes, permissions):
             # Record permission class being applied
             if telemetry_ctx:
                 permission_class_name = f"{permission_cls.__module__}.{permission_cls.__name__}"
                 telemetry_ctx.record_permission_class_applied(permission_class_name)
 
-            # Apply permission filter to a fresh base queryset
-            filtered_qs = perm.filter_queryset(req, base_queryset)
-            filtered_querysets.append(filtered_qs)
+            condition = perm.filter_condition(req, model)
+            if condition is not None:
+                conditions.append((perm, condition))
+                if telemetry_ctx:
+                    filtered_qs = self.orm_provider.filter_any(base_queryset, [condition])
+                    if filtered_qs is None:
+                        filtered_qs = perm.filter_queryset(req, base_queryset)
+            else:
+                # Apply permission filter to a fresh base queryset
+                filtered_qs = perm.filter_queryset(req, base_queryset)
+                filtered_querysets.append(filtered_qs)
 
             # Record SQL after applying this permission
             if telemetry_ctx:
@@ -238,6 +301,18 @@ class RequestProcessor:
                 except Exception:
                     pass  # Don't fail if we can't get SQL
 
+        if conditions:
+            merged = self.orm_provider.filter_any(
+                base_queryset, [condition for _, condition in conditions]
+            )
+            if merged is None:
+                # The provider cannot merge conditions: filter per permission
+                filtered_querysets[:0] = [
+                    perm.filter_queryset(req, base_queryset) for perm, _ in conditions
+                ]
+            else:
+                filtered_querysets.insert(0, merged)
+
         # Combine all filtered querysets with OR
         if filtered_querysets:
             combined_queryset = filtered_querysets[0]
@@ -246,18 +321,67 @@ class RequestProcessor:
             base_queryset = combined_queryset
 
         # Step 2: Apply exclude_from_queryset with AND logic (restrictive permissions)
-        for permission_cls in model_config.permissions:
-            perm = permission_cls()
+        for perm in permissions:
             base_queryset = perm.exclude_from_queryset(req, base_queryset)
 
+        return base_queryset
+
+    def _process_query(
+        self,
+        req: Any,
+        model_name: str,
+        ast_body: Dict[str, Any],
+        memo: Optional[Dict[Any, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Validate and execute a single query AST against ``model_name``.
+
+        ``memo`` is shared between the entries of a batch so that per-model work
+        is only done once per request. When omitted, everything is computed fresh.
+        """
+        # Get telemetry context (created by adaptor before calling this)
+        from statezero.core.telemetry import get_telemetry_context
+        telemetry_ctx = get_telemetry_context()
+
+        memo = {} if memo is None else memo
+
+        initial_query_ast: Dict[str, Any] = ast_body.get("initial_query", {})
+        final_query_ast: Dict[str, Any] = ast_body.get("query", {})
+
+        # Record the query AST in telemetry
+        if telemetry_ctx:
+            telemetry_ctx.set_query_ast(final_query_ast)
+
+        model = self.orm_provider.get_model_by_name(model_name)
+        model_config: ModelConfig = self.registry.get_config(model)
+
+        queryset_key = (
+            "queryset",
+            model_name,
+            json.dumps(initial_query_ast, sort_keys=True, default=str),
+        )
+        if queryset_key not in memo:
+            memo[queryset_key] = self._get_permitted_queryset(
+                req, model, model_config, initial_query_ast
+            )
+        # Each entry works on its own clone, so rows one entry loads are never
+        # seen by the next. filter() rather than all(): managers such as
+        # django-money patch methods onto the queryset and re-apply them there.
+        base_queryset = memo[queryset_key].filter()
+
         # ---- PERMISSION CHECKS: Global Level (Write operations remain here) ----
         requested_actions: Set[ActionType] = ASTParser.get_requested_action_types(
             final_query_ast
         )
-
-        allowed_global_actions: Set[ActionType] = set()
-        for permission_cls in model_config.permissions:
-            allowed_global_actions |= permission_cls().allowed_actions(req, model)
+        # Once a batch has written, later entries read uncommitted rows that a
+        # rollback would discard, so they bypass the shared query cache
+        use_query_cache = not memo.get("wrote", False)
+        if requested_actions - {ActionType.READ}:
+            memo["wrote"] = True
+
+        allowed_global_actions: Set[ActionType] = get_permission_resolver(
+            self.registry, req
+        ).model_allowed_actions(model)
         if "__all__" not in allowed_global_actions:
             if not requested_actions.issubset(allowed_global_actions):
                 missing = requested_actions - allowed_global_actions
@@ -270,15 +394,18 @@ class RequestProcessor:
         serializer_options = ast_body.get("serializerOptions", {})
 
         # Invoke the ASTValidator to check read field permissions.
-        model_graph = self.orm_provider.build_model_graph(model)
-        validator = ASTValidator(
-            model_graph=model_graph,
-            get_model_name=self.orm_provider.get_model_name,
-            registry=self.registry,
-            request=req,
-            get_model_by_name=self.orm_provider.get_model_by_name,
-            is_nested_path_field=self.orm_provider.is_nested_path_field,
-        )
+        validator_key = ("validator", model_name)
+        if validator_key not in memo:
+            model_graph = self.orm_provider.build_model_graph(model)
+            memo[validator_key] = ASTValidator(
+                model_graph=model_graph,
+                get_model_name=self.orm_provider.get_model_name,
+                registry=self.registry,
+                request=req,
+                get_model_by_name=self.orm_provider.get_model_by_name,
+                is_nested_path_field=self.orm_provider.is_nested_path_field,
+            )
+        validator: ASTValidator = memo[validator_key]
         extra_fields = self.config.effective_extra_fields
         error_on_extra = extra_fields == EXTRA_FIELDS_ERROR
         validator.validate_ast(final_query_ast, model, error_on_extra=error_on_extra)
@@ -339,6 +466,8 @@ class RequestProcessor:
             base_queryset=base_queryset,  # Pass the queryset here
             serializer_options=serializer_options or {},
             request=req,
+            field_map_cache=memo.setdefault("field_maps", {}),
+            use_query_cache=use_query_cache,
         )
         result: Dict[str, Any] = parser.parse(final_query_ast)
 
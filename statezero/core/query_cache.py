@@ -11,18 +11,59 @@ This provides:
 2. Zero invalidation logic - new transaction ID = new cache namespace
 3. Caches the complete response - skip execution AND serialization on cache hit
 4. Works for both reads and aggregates
+
+Without a canonical_id, and when STATEZERO_QUERY_CACHE_GENERATIONS is enabled,
+the transaction ID is replaced by per-model generation counters: every model
+the query touches (root, joined/subquery tables in the SQL, models in the
+read fields map) contributes its generation, and the EventBus bumps a model's
+generation whenever it changes. A write therefore moves every dependent query
+to a fresh key - invalidation stays automatic.
+
+Results are encoded by a pluggable codec (STATEZERO_QUERY_CACHE_CODEC, see
+cache_codec.py) and stored in the shared Django cache (L2) and, when
+STATEZERO_QUERY_CACHE_L1_MAX_BYTES is set, in a bounded per-process LRU (L1)
+in front of it. Keys are namespaced by canonical_id, so an L1 entry can never
+be stale for its key - it only needs a size bound and a TTL.
+
+Concurrent requests for the same key are coalesced (single-flight): one leader
+executes the query, every follower - in this process or another - receives the
+leader's result, error or timeout. Followers never execute the query themselves.
+
+With stale-while-revalidate, a miss is answered immediately with the newest
+response for the same SQL and operation context under an older canonical_id or
+generation (flagged with metadata.stale), while one background revalidation
+refreshes the current key.
 """
+import contextvars
 import hashlib
 import logging
-from typing import Any, Dict, Optional, Tuple
-
+import pickle
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from django.apps import apps
+from django.conf import settings
 from django.core.cache import cache
+from django.db import connections, transaction
+from django.utils.module_loading import import_string
 
+from statezero.core import exceptions
 from statezero.core.context_storage import current_canonical_id
-from statezero.core.telemetry import get_telemetry_context
+from statezero.core.interfaces import AbstractCacheCodec
+from statezero.core.telemetry import get_telemetry_context, set_telemetry_context
 
 logger = logging.getLogger(__name__)
 
+# Default lifetime of a cached response; ModelConfig.cache_policy can override it
+DEFAULT_TTL = 3600
+DEFAULT_CODEC = "statezero.core.cache_codec.BinaryCacheCodec"
+
 
 def _get_sql_from_queryset(queryset) -> Optional[Tuple[str, tuple]]:
     """
@@ -68,118 +109,401 @@ def _get_cache_key(sql: str, params: tuple, txn_id: str, operation_context: Opti
     return f"statezero:query:{hash_digest}"
 
 
-def get_cached_query_result(queryset, operation_context: Optional[str] = None) -> Optional[Dict[str, Any]]:
+@dataclass(frozen=True)
+class QueryFingerprint:
+    """
+    Everything the cache needs to identify a query, compiled once per request.
+
+    Build it with get_query_fingerprint() and pass it to the cache functions so
+    the SQL is not recompiled and the key not rehashed on every cache call.
+
+    txn_id is the canonical_id, or "gen:..." when the key is scoped by model
+    generations instead (see generations).
     """
-    Try to get cached result for a queryset with request coalescing.
 
-    When multiple requests for the same query arrive simultaneously (e.g., after a websocket event),
-    only the first request executes the query. Other requests wait for the result.
+    sql: str
+    params: tuple
+    txn_id: str
+    operation_context: Optional[str]
+    key: str
+    compile_ms: float = 0.0
+    generations: Tuple[Tuple[str, int], ...] = ()
+    generation_ms: float = 0.0
+
+    @cached_property
+    def latest_key(self) -> str:
+        """
+        Key of the pointer to the newest cached response for this SQL and
+        operation context under any canonical_id or generation.
+        """
+        digest = _get_cache_key(self.sql, self.params, "latest", self.operation_context).rsplit(":", 1)[-1]
+        return f"statezero:query:latest:{digest}"
+
+
+_GENERATION_KEY_PREFIX = "statezero:gen:"
+_QUOTED_IDENTIFIER = re.compile(r'["`\[]([^"`\]]+)["`\]]')
+_table_models: Optional[Dict[str, str]] = None
+
+
+def _get_table_models() -> Dict[str, str]:
+    """Map db table names to model names. Auto-created M2M tables map to their owning model."""
+    global _table_models
+    if _table_models is None:
+        table_models = {}
+        for model in apps.get_models(include_auto_created=True):
+            owner = model._meta.auto_created or model
+            table_models[model._meta.db_table] = owner._meta.label_lower
+        _table_models = table_models
+    return _table_models
+
+
+def _get_models_in_sql(sql: str) -> set:
+    """Find the models whose tables appear in compiled SQL, including joins and subqueries."""
+    table_models = _get_table_models()
+    return {
+        table_models[identifier]
+        for identifier in _QUOTED_IDENTIFIER.findall(sql)
+        if identifier in table_models
+    }
+
+
+def _generation_seed() -> int:
+    """
+    Starting value for a missing generation counter. Counters can be evicted
+    despite timeout=None; starting from the clock (in microseconds) rather than
+    0 keeps a recreated counter from repeating values it already had, which
+    would match entries cached under those old generations.
+    """
+    return time.time_ns() // 1000
+
+
+def get_model_generations(model_names: Iterable[str]) -> Tuple[Tuple[str, int], ...]:
+    """Fetch the current generation of each model, seeding missing counters."""
+    names = sorted(set(model_names))
+    keys = {f"{_GENERATION_KEY_PREFIX}{name}": name for name in names}
+    found = cache.get_many(list(keys))
+    missing = [key for key in keys if key not in found]
+    if missing:
+        seed = _generation_seed()
+        for key in missing:
+            cache.add(key, seed, timeout=None)
+        # Re-read: a concurrent request may have seeded the counter first
+        found.update(cache.get_many(missing))
+        return tuple((name, found.get(key, seed)) for key, name in keys.items())
+    return tuple((name, found[key]) for key, name in keys.items())
+
+
+def _bump_generations_now(model_names: Iterable[str]) -> None:
+    for name in set(model_names):
+        key = f"{_GENERATION_KEY_PREFIX}{name}"
+        try:
+            if not cache.add(key, _generation_seed(), timeout=None):
+                cache.incr(key)
+        except ValueError:
+            # Key expired/evicted between add and incr
+            cache.add(key, _generation_seed(), timeout=None)
+        except Exception as e:
+            logger.warning(f"Could not bump generation for {name}: {e}")
+
+
+def bump_model_generations(model_names: Iterable[str]) -> None:
+    """
+    Invalidate generation-keyed cache entries for the given models.
+
+    The bump runs after the surrounding transaction commits, so a reader that
+    sees the new generation also sees the new data.
+    """
+    if not getattr(settings, 'STATEZERO_QUERY_CACHE_GENERATIONS', False):
+        return
+    names = list(model_names)
+    if names:
+        transaction.on_commit(lambda: _bump_generations_now(names))
+
+
+def get_query_fingerprint(
+    queryset,
+    operation_context: Optional[str] = None,
+    models: Optional[Iterable[str]] = None,
+) -> Optional[QueryFingerprint]:
+    """
+    Compile a queryset and derive its cache key.
 
     Args:
-        queryset: Django QuerySet to check cache for
+        queryset: Django QuerySet to fingerprint
         operation_context: Optional context string (e.g., "min:value", "max:value")
-                          Used to differentiate aggregate operations on same queryset
+        models: Extra model names whose data shapes the response (e.g. the read
+                fields map). Only used for generation-scoped keys.
 
     Returns:
-        Cached result dict or None if not cached/being processed
+        QueryFingerprint, or None if there is no cache scope or the SQL cannot be compiled
     """
-    import time
-
-    # Check for transaction ID
     txn_id = current_canonical_id.get()
-
-    # No transaction context = no caching
-    if txn_id is None:
+    use_generations = txn_id is None and getattr(settings, 'STATEZERO_QUERY_CACHE_GENERATIONS', False)
+    if txn_id is None and not use_generations:
         logger.debug("No canonical_id - skipping cache")
         return None
 
-    # Get SQL
+    started = time.perf_counter()
     sql_data = _get_sql_from_queryset(queryset)
     if sql_data is None:
         return None
-
     sql, params = sql_data
-
-    # Generate cache key
+    compile_seconds = time.perf_counter() - started
+
+    # The generation lookup is a cache round trip, timed apart from compilation
+    generations: Tuple[Tuple[str, int], ...] = ()
+    generation_ms = 0.0
+    if use_generations:
+        touched = _get_models_in_sql(sql)
+        touched.add(queryset.model._meta.label_lower)
+        touched.update(models or ())
+        lookup_started = time.perf_counter()
+        generations = get_model_generations(touched)
+        generation_ms = (time.perf_counter() - lookup_started) * 1000
+        txn_id = "gen:" + ",".join(f"{name}={gen}" for name, gen in generations)
+
+    hash_started = time.perf_counter()
     cache_key = _get_cache_key(sql, params, txn_id, operation_context)
+    compile_ms = (compile_seconds + time.perf_counter() - hash_started) * 1000
 
-    # Try cache first
-    cached_result = cache.get(cache_key)
-
-    # Record telemetry
     telemetry_ctx = get_telemetry_context()
+    if telemetry_ctx:
+        telemetry_ctx.record_query_compile(cache_key, operation_context, compile_ms, generation_ms)
 
-    if cached_result is not None:
-        context_info = f" | Context: {operation_context}" if operation_context else ""
-        logger.info(f"Query cache HIT for txn {txn_id[:8]}...{context_info} | SQL: {sql[:100]}...")
+    return QueryFingerprint(
+        sql, params, txn_id, operation_context, cache_key, compile_ms, generations, generation_ms
+    )
 
-        # Record cache hit in telemetry
-        if telemetry_ctx:
-            telemetry_ctx.record_cache_hit(cache_key, operation_context, sql)
 
-        return cached_result
+def _resolve_fingerprint(
+    queryset, operation_context: Optional[str], fingerprint: Optional[QueryFingerprint]
+) -> Optional[QueryFingerprint]:
+    """Use the caller's fingerprint when given, otherwise compile the queryset."""
+    if fingerprint is not None:
+        return fingerprint
+    return get_query_fingerprint(queryset, operation_context)
+
+
+def _payload_size(value: Any) -> Optional[int]:
+    """Pickled size of a cache value - what the shared cache would store."""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception as e:
+        logger.debug(f"Could not size cache value: {e}")
+        return None
+
+
+class _LocalCache:
+    """
+    Per-process LRU bounded by the encoded size of its entries.
+
+    Values are stored as-is (not pickled), so hits skip deserialization.
+    Cached responses are shared between requests and must be treated as read-only.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, size, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.size -= size
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, size: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        if size is None:
+            size = _payload_size(value)
+            if size is None:
+                return
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+            expires_in = self.ttl if ttl is None else min(self.ttl, ttl)
+            self._entries[key] = (value, size, time.monotonic() + expires_in)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+_local_cache: Optional[_LocalCache] = None
+_stats_lock = threading.Lock()
+_tier_stats: Dict[str, Dict[str, int]] = {
+    "l1": {"hits": 0, "misses": 0},
+    "l2": {"hits": 0, "misses": 0},
+}
+
+
+def _get_local_cache() -> Optional[_LocalCache]:
+    """Return the L1 tier, or None when STATEZERO_QUERY_CACHE_L1_MAX_BYTES is unset."""
+    global _local_cache
+    max_bytes = getattr(settings, 'STATEZERO_QUERY_CACHE_L1_MAX_BYTES', 0)
+    if not max_bytes:
+        return None
+    ttl = getattr(settings, 'STATEZERO_QUERY_CACHE_L1_TTL', 60)
+    if _local_cache is None or (_local_cache.max_bytes, _local_cache.ttl) != (max_bytes, ttl):
+        _local_cache = _LocalCache(max_bytes, ttl)
+    return _local_cache
+
 
-    # Cache miss - check if someone else is processing this query
-    # This handles the thundering herd problem when websocket events cause
-    # multiple clients to request the same query simultaneously
-    lock_key = f"{cache_key}:lock"
-    result_key = f"{cache_key}:pending"
-
-    # Check if another request is processing this
-    if cache.get(lock_key):
-        # Someone else is processing, wait for their result
-        logger.debug(f"Query being processed by another request, waiting... | txn {txn_id[:8]}...")
-
-        # TODO: FIX DESIGN (needs to be done, I didn't have time yet): if the leader
-        # query exceeds the wait timeout, followers will stop waiting and execute the
-        # same query themselves (automatic fan-out). Replace with hard single-flight
-        # (no fan-out) and propagate the leader's error/timeout to all followers
-        # (cache error responses).
-
-        # Calculate wait timeout based on Django's query timeout setting
-        # Wait for query_timeout + 1 second to allow the first request to complete
-        from django.conf import settings
-        query_timeout_ms = getattr(settings, 'STATEZERO_QUERY_TIMEOUT_MS', 1000)
-        wait_timeout_seconds = (query_timeout_ms / 1000.0) + 1.0
-
-        # Poll every 100ms
-        poll_interval = 0.1
-        max_iterations = int(wait_timeout_seconds / poll_interval)
-
-        for i in range(max_iterations):
-            time.sleep(poll_interval)
-
-            # Check if result is ready in main cache
-            result = cache.get(cache_key)
-            if result:
-                logger.info(f"Query cache HIT (after wait) for txn {txn_id[:8]}...")
-                if telemetry_ctx:
-                    telemetry_ctx.record_cache_hit(cache_key, operation_context, sql)
-                return result
-
-            # Check if result is in pending cache
-            result = cache.get(result_key)
-            if result:
-                logger.info(f"Query result ready (pending) for txn {txn_id[:8]}...")
-                if telemetry_ctx:
-                    telemetry_ctx.record_cache_hit(cache_key, operation_context, sql)
-                return result
-
-        # Timeout - fall through to execute ourselves
-        logger.warning(f"Timeout waiting for query result (waited {wait_timeout_seconds}s), executing ourselves | txn {txn_id[:8]}...")
-
-    # No cache, no one processing - this request should execute
-    context_info = f" | Context: {operation_context}" if operation_context else ""
-    logger.debug(f"Query cache MISS for txn {txn_id[:8]}...{context_info} | SQL: {sql[:100]}...")
-
-    # Record cache miss in telemetry
+def _count(tier: str, outcome: str) -> None:
+    with _stats_lock:
+        _tier_stats[tier][outcome] += 1
+
+
+def get_query_cache_stats() -> Dict[str, Any]:
+    """Return per-tier hit/miss counters and the current L1 size for this process."""
+    with _stats_lock:
+        stats = {tier: dict(counts) for tier, counts in _tier_stats.items()}
+    local = _get_local_cache()
+    stats["l1"]["bytes"] = local.size if local else 0
+    return stats
+
+
+def reset_query_cache_stats() -> None:
+    """Zero the per-tier counters and empty the L1 tier."""
+    with _stats_lock:
+        for counts in _tier_stats.values():
+            counts["hits"] = counts["misses"] = 0
+    if _local_cache is not None:
+        _local_cache.clear()
+
+
+_codec_path: Optional[str] = None
+_codec: Optional[AbstractCacheCodec] = None
+
+
+def _get_codec() -> Optional[AbstractCacheCodec]:
+    """
+    Return the codec for L2 values (STATEZERO_QUERY_CACHE_CODEC), or None to
+    store raw objects and let the cache backend pickle them.
+    """
+    global _codec_path, _codec
+    path = getattr(settings, 'STATEZERO_QUERY_CACHE_CODEC', DEFAULT_CODEC)
+    if path != _codec_path:
+        _codec = import_string(path)() if path else None
+        _codec_path = path
+    return _codec
+
+
+def _l2_read(cache_key: str) -> Tuple[Optional[Any], Optional[int]]:
+    """
+    Read and decode a result from the shared cache. Returns (result, size),
+    where size is the length of the encoded value, or None without a codec.
+    """
+    stored = cache.get(cache_key)
+    if stored is None:
+        return None, None
+    codec = _get_codec()
+    if codec is None:
+        return stored, None
+    size = len(stored) if isinstance(stored, (bytes, bytearray)) else None
+    return codec.decode(stored), size
+
+
+def _l2_get(cache_key: str) -> Optional[Any]:
+    """Read and decode a result from the shared cache."""
+    return _l2_read(cache_key)[0]
+
+
+def _tiered_get(cache_key: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Look up a result in L1 then L2. Returns (result, tier) - tier is None on a miss."""
+    local = _get_local_cache()
+    if local is not None:
+        result = local.get(cache_key)
+        if result is not None:
+            _count("l1", "hits")
+            return result, "l1"
+        _count("l1", "misses")
+
+    result, size = _l2_read(cache_key)
+    if result is None:
+        _count("l2", "misses")
+        return None, None
+    _count("l2", "hits")
+    if local is not None:
+        # Sized from the bytes just read rather than by re-encoding the result
+        local.set(cache_key, result, size=size)
+    return result, "l2"
+
+
+def _record_hit(fingerprint: QueryFingerprint, tier: Optional[str] = None) -> None:
+    context_info = f" | Context: {fingerprint.operation_context}" if fingerprint.operation_context else ""
+    tier_info = f" ({tier.upper()})" if tier else ""
+    logger.info(f"Query cache HIT{tier_info} for txn {fingerprint.txn_id[:8]}...{context_info} | SQL: {fingerprint.sql[:100]}...")
+    telemetry_ctx = get_telemetry_context()
+    if telemetry_ctx:
+        telemetry_ctx.record_cache_hit(fingerprint.key, fingerprint.operation_context, fingerprint.sql, tier=tier)
+
+
+def _record_miss(fingerprint: QueryFingerprint) -> None:
+    context_info = f" | Context: {fingerprint.operation_context}" if fingerprint.operation_context else ""
+    logger.debug(f"Query cache MISS for txn {fingerprint.txn_id[:8]}...{context_info} | SQL: {fingerprint.sql[:100]}...")
+    telemetry_ctx = get_telemetry_context()
     if telemetry_ctx:
-        telemetry_ctx.record_cache_miss(cache_key, operation_context, sql)
+        telemetry_ctx.record_cache_miss(fingerprint.key, fingerprint.operation_context, fingerprint.sql)
 
+
+def get_cached_query_result(
+    queryset,
+    operation_context: Optional[str] = None,
+    fingerprint: Optional[QueryFingerprint] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Try to get cached result for a queryset.
+
+    This is a plain lookup - it never waits for another request. Request
+    coalescing lives in get_or_execute_query().
+
+    Args:
+        queryset: Django QuerySet to check cache for
+        operation_context: Optional context string (e.g., "min:value", "max:value")
+                          Used to differentiate aggregate operations on same queryset
+        fingerprint: Precomputed QueryFingerprint; skips SQL compilation when given
+
+    Returns:
+        Cached result dict or None if not cached
+    """
+    fingerprint = _resolve_fingerprint(queryset, operation_context, fingerprint)
+    if fingerprint is None:
+        return None
+
+    cached_result, tier = _tiered_get(fingerprint.key)
+    if cached_result is not None:
+        _record_hit(fingerprint, tier)
+        return cached_result
+
+    _record_miss(fingerprint)
     return None
 
 
-def cache_query_result(queryset, result: Dict[str, Any], operation_context: Optional[str] = None) -> None:
+def cache_query_result(
+    queryset,
+    result: Dict[str, Any],
+    operation_context: Optional[str] = None,
+    fingerprint: Optional[QueryFingerprint] = None,
+    ttl: int = DEFAULT_TTL,
+    max_payload_bytes: Optional[int] = None,
+) -> None:
     """
     Cache a query result and release any locks/pending results for coalescing.
 
@@ -188,77 +512,451 @@ def cache_query_result(queryset, result: Dict[str, Any], operation_context: Opti
         result: The final serialized result to cache
         operation_context: Optional context string (e.g., "min:value", "max:value")
                           Used to differentiate aggregate operations on same queryset
+        fingerprint: Precomputed QueryFingerprint; skips SQL compilation when given
+        ttl: Seconds to keep the cached response
+        max_payload_bytes: Don't cache responses larger than this (as encoded for the cache)
     """
-    # Check for transaction ID
-    txn_id = current_canonical_id.get()
-
-    # No transaction context = no caching
-    if txn_id is None:
+    fingerprint = _resolve_fingerprint(queryset, operation_context, fingerprint)
+    if fingerprint is None:
         return
 
-    # Get SQL
-    sql_data = _get_sql_from_queryset(queryset)
-    if sql_data is None:
-        return
+    if _store_result(fingerprint.key, result, ttl, max_payload_bytes):
+        context_info = f" | Context: {fingerprint.operation_context}" if fingerprint.operation_context else ""
+        logger.info(f"Cached query result for txn {fingerprint.txn_id[:8]}...{context_info} | SQL: {fingerprint.sql[:100]}...")
 
-    sql, params = sql_data
 
-    # Generate cache key
-    cache_key = _get_cache_key(sql, params, txn_id, operation_context)
+def acquire_query_lock(
+    queryset,
+    operation_context: Optional[str] = None,
+    fingerprint: Optional[QueryFingerprint] = None,
+) -> bool:
+    """
+    Try to acquire a lock to execute a query (for request coalescing).
 
-    # Cache the result for 1 hour
-    try:
-        cache.set(cache_key, result, timeout=3600)
+    Returns:
+        bool: True if lock acquired (this request should execute), False if someone else has it
+    """
+    fingerprint = _resolve_fingerprint(queryset, operation_context, fingerprint)
+    if fingerprint is None:
+        return True  # No coalescing without canonical_id or SQL
 
-        # Also set pending result for waiting requests (short TTL)
-        result_key = f"{cache_key}:pending"
-        cache.set(result_key, result, timeout=10)
+    # Try to acquire lock (add is atomic - only succeeds if key doesn't exist)
+    acquired = cache.add(f"{fingerprint.key}:lock", "processing", timeout=_get_lock_timeout_seconds())
+
+    if acquired:
+        logger.debug(f"Acquired query lock for txn {fingerprint.txn_id[:8]}...")
+    else:
+        logger.debug(f"Query lock already held by another request for txn {fingerprint.txn_id[:8]}...")
+
+    return acquired
+
+
+# ---------------------------------------------------------------------------
+# Single-flight request coalescing
+# ---------------------------------------------------------------------------
 
-        # Remove lock to signal completion
-        lock_key = f"{cache_key}:lock"
-        cache.delete(lock_key)
 
-        context_info = f" | Context: {operation_context}" if operation_context else ""
-        logger.info(f"Cached query result for txn {txn_id[:8]}...{context_info} | SQL: {sql[:100]}...")
+def _get_wait_timeout_seconds() -> float:
+    """How long a follower waits for the leader: the query timeout plus one second."""
+    query_timeout_ms = getattr(settings, 'STATEZERO_QUERY_TIMEOUT_MS', 1000)
+    return (query_timeout_ms / 1000.0) + 1.0
+
+
+def _get_lock_timeout_seconds() -> int:
+    """The cross-process lock outlives the wait timeout so a crashed leader cannot deadlock followers."""
+    query_timeout_ms = getattr(settings, 'STATEZERO_QUERY_TIMEOUT_MS', 1000)
+    return int((query_timeout_ms / 1000.0) + 2.0)
+
+
+def _store_result(
+    cache_key: str,
+    result: Dict[str, Any],
+    ttl: int = DEFAULT_TTL,
+    max_payload_bytes: Optional[int] = None,
+    latest_key: Optional[str] = None,
+) -> bool:
+    """
+    Cache a leader's result, release the lock and wake up followers.
+
+    When latest_key is given, it is pointed at this result so later misses can
+    serve it stale (see stale-while-revalidate in get_or_execute_query).
+
+    Results over max_payload_bytes are not cached. They are handed to
+    followers in other processes under a key that only lives as long as the
+    wait window, so the query still runs once; should the cache refuse even
+    that, a marker tells followers to execute the query themselves.
+    """
+    try:
+        local = _get_local_cache()
+        codec = _get_codec()
+        stored = codec.encode(result) if codec is not None else result
+        if isinstance(stored, (bytes, bytearray)):
+            size = len(stored)
+        else:
+            size = _payload_size(result) if (local is not None or max_payload_bytes) else None
+
+        if max_payload_bytes and size is not None and size > max_payload_bytes:
+            logger.debug(f"Result of {size} bytes exceeds cache policy limit of {max_payload_bytes}, not caching")
+            handoff_timeout = max(1, int(_get_wait_timeout_seconds()))
+            cache.set(f"{cache_key}:handoff", stored, timeout=handoff_timeout)
+            cache.set(f"{cache_key}:uncached", True, timeout=handoff_timeout)
+            cache.delete(f"{cache_key}:lock")
+            return False
+
+        cache.set(cache_key, stored, timeout=ttl)
+        if local is not None:
+            local.set(cache_key, result, size=size, ttl=ttl)
+
+        # Point waiting requests at the main key (short TTL) instead of storing a second copy
+        cache.set(f"{cache_key}:pending", cache_key, timeout=min(10, ttl))
+
+        if latest_key:
+            cache.set(latest_key, cache_key, timeout=ttl)
+
+        # Remove lock to signal completion
+        cache.delete(f"{cache_key}:lock")
     except Exception as e:
         logger.warning(f"Could not cache result: {e}")
+        return False
+    finally:
+        _get_notifier().notify(cache_key)
+    return True
 
 
-def acquire_query_lock(queryset, operation_context: Optional[str] = None) -> bool:
+def _store_error(cache_key: str, error: Exception) -> None:
     """
-    Try to acquire a lock to execute a query (for request coalescing).
+    Publish a leader's error so cross-process followers raise it instead of
+    executing the query. The error entry lives only as long as the wait window.
+    """
+    try:
+        detail = getattr(error, "detail", None)
+        cache.set(
+            f"{cache_key}:error",
+            {
+                "type": error.__class__.__name__,
+                "status_code": getattr(error, "status_code", 500),
+                "detail": str(detail) if detail is not None else str(error),
+            },
+            timeout=max(1, int(_get_wait_timeout_seconds())),
+        )
+        cache.delete(f"{cache_key}:lock")
+    except Exception as e:
+        logger.warning(f"Could not publish query error: {e}")
+    finally:
+        _get_notifier().notify(cache_key)
 
-    Returns:
-        bool: True if lock acquired (this request should execute), False if someone else has it
+
+def _rebuild_error(payload: Dict[str, Any]) -> Exception:
+    """Turn a cached error payload back into a StateZero exception."""
+    error_cls = getattr(exceptions, payload.get("type", ""), None)
+    if isinstance(error_cls, type) and issubclass(error_cls, exceptions.StateZeroError):
+        return error_cls(payload.get("detail"))
+    error = exceptions.StateZeroError(payload.get("detail"))
+    error.status_code = payload.get("status_code", 500)
+    return error
+
+
+def _read_outcome(cache_key: str) -> Tuple[Optional[Any], Optional[Exception]]:
+    """
+    Return (result, error) published by a leader, or (None, None) if neither is ready.
+    result is _UNCACHED when the leader's response was too large to cache and
+    could not be handed off either.
+    """
+    result = _l2_get(cache_key)
+    if result is None:
+        pointer = cache.get(f"{cache_key}:pending")
+        if pointer is not None:
+            result = _l2_get(pointer)
+    if result is None:
+        result = _l2_get(f"{cache_key}:handoff")
+    if result is not None:
+        return result, None
+    if cache.get(f"{cache_key}:uncached"):
+        return _UNCACHED, None
+    error_payload = cache.get(f"{cache_key}:error")
+    if error_payload is not None:
+        return None, _rebuild_error(error_payload)
+    return None, None
+
+
+class _PollingNotifier:
+    """
+    Fallback notifier for cache backends without pub/sub (LocMem, Memcached, DB).
+    Followers re-check the cache with exponential backoff until the leader
+    publishes an outcome or the wait window closes.
     """
-    # Check for transaction ID
-    txn_id = current_canonical_id.get()
-    if txn_id is None:
-        return True  # No coalescing without canonical_id
 
-    # Get SQL
-    sql_data = _get_sql_from_queryset(queryset)
-    if sql_data is None:
-        return True
+    def notify(self, cache_key: str) -> None:
+        pass
 
-    sql, params = sql_data
+    def wait(self, cache_key: str, timeout: float) -> None:
+        deadline = time.monotonic() + timeout
+        interval = 0.01
+        while True:
+            if _read_outcome(cache_key) != (None, None):
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, 0.2)
 
-    # Generate cache key
-    cache_key = _get_cache_key(sql, params, txn_id, operation_context)
-    lock_key = f"{cache_key}:lock"
 
-    # Calculate lock timeout based on Django's query timeout setting
-    # Lock should expire slightly after the wait timeout to prevent deadlocks
-    from django.conf import settings
-    query_timeout_ms = getattr(settings, 'STATEZERO_QUERY_TIMEOUT_MS', 1000)
-    lock_timeout_seconds = int((query_timeout_ms / 1000.0) + 2.0)
+class _RedisNotifier:
+    """
+    Cross-process notifier built on Redis pub/sub. The leader publishes on a
+    per-key channel once its outcome is cached; followers block on the channel
+    instead of polling.
+    """
 
-    # Try to acquire lock (add is atomic - only succeeds if key doesn't exist)
-    acquired = cache.add(lock_key, "processing", timeout=lock_timeout_seconds)
+    def __init__(self, connection):
+        self.connection = connection
+
+    def _channel(self, cache_key: str) -> str:
+        return f"{cache_key}:done"
+
+    def notify(self, cache_key: str) -> None:
+        try:
+            self.connection.publish(self._channel(cache_key), b"1")
+        except Exception as e:
+            logger.warning(f"Could not publish query completion: {e}")
+
+    def wait(self, cache_key: str, timeout: float) -> None:
+        deadline = time.monotonic() + timeout
+        pubsub = self.connection.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(self._channel(cache_key))
+            # Re-check after subscribing so a completion published in between is not missed
+            while _read_outcome(cache_key) == (None, None):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                pubsub.get_message(timeout=remaining)
+        except Exception as e:
+            logger.warning(f"Redis wait failed, falling back to polling: {e}")
+            _PollingNotifier().wait(cache_key, max(0.0, deadline - time.monotonic()))
+        finally:
+            try:
+                pubsub.close()
+            except Exception:
+                pass
+
+
+_notifier = None
+
+
+def _get_notifier():
+    """Pick pub/sub notification for Redis-backed caches, polling otherwise."""
+    global _notifier
+    if _notifier is None:
+        connection = None
+        try:
+            module = cache.__class__.__module__
+            if module.startswith("django_redis"):
+                from django_redis import get_redis_connection
+
+                connection = get_redis_connection("default")
+            elif module == "django.core.cache.backends.redis":
+                connection = cache._cache.get_client(write=True)
+        except Exception as e:
+            logger.debug(f"Redis notifier unavailable: {e}")
+        _notifier = _RedisNotifier(connection) if connection is not None else _PollingNotifier()
+    return _notifier
+
+
+class _Flight:
+    """An in-flight query shared by every request for the same key in this process."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[Exception] = None
+
+
+_flights: Dict[str, _Flight] = {}
+_UNCACHED = object()
+_flights_lock = threading.Lock()
+
+
+def _timeout_error(wait_timeout: float) -> exceptions.QueryTimeout:
+    return exceptions.QueryTimeout(
+        f"Timed out after {wait_timeout:.1f}s waiting for an identical in-flight query."
+    )
+
+
+def _lead(
+    cache_key: str,
+    compute: Callable[[], Dict[str, Any]],
+    wait_timeout: float,
+    ttl: int,
+    max_payload_bytes: Optional[int],
+    latest_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run as this process's leader: execute, or follow a leader in another process."""
+    if cache.add(f"{cache_key}:lock", "processing", timeout=_get_lock_timeout_seconds()):
+        # Drop any outcome left by a previous leader so new followers don't pick it up
+        cache.delete_many([f"{cache_key}:error", f"{cache_key}:uncached", f"{cache_key}:handoff"])
+        try:
+            result = compute()
+        except Exception as e:
+            _store_error(cache_key, e)
+            raise
+        _store_result(cache_key, result, ttl, max_payload_bytes, latest_key)
+        return result
+
+    # Another process is executing this query - wait for its outcome
+    _get_notifier().wait(cache_key, wait_timeout)
+    result, error = _read_outcome(cache_key)
+    if error is not None:
+        raise error
+    if result is None:
+        raise _timeout_error(wait_timeout)
+    if result is _UNCACHED:
+        return compute()
+    return result
+
+
+_revalidation_executor: Optional[ThreadPoolExecutor] = None
+_revalidation_executor_lock = threading.Lock()
+
+
+def _get_revalidation_executor() -> ThreadPoolExecutor:
+    global _revalidation_executor
+    with _revalidation_executor_lock:
+        if _revalidation_executor is None:
+            workers = getattr(settings, 'STATEZERO_QUERY_CACHE_REVALIDATE_WORKERS', 2)
+            _revalidation_executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="statezero-revalidate"
+            )
+        return _revalidation_executor
+
+
+def _get_stale_result(fingerprint: QueryFingerprint) -> Optional[Dict[str, Any]]:
+    """Return the newest cached response for this query under another canonical_id/generation."""
+    stale_key = cache.get(fingerprint.latest_key)
+    if stale_key is None or stale_key == fingerprint.key:
+        return None
+    return _l2_get(stale_key)
 
-    if acquired:
-        logger.debug(f"Acquired query lock for txn {txn_id[:8]}...")
-    else:
-        logger.debug(f"Query lock already held by another request for txn {txn_id[:8]}...")
 
-    return acquired
+def _mark_stale(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached response with metadata.stale set - cached objects are shared and read-only."""
+    if not isinstance(result, dict):
+        return result
+    return {**result, "metadata": {**(result.get("metadata") or {}), "stale": True}}
+
+
+def _revalidate_in_background(
+    fingerprint: QueryFingerprint,
+    compute: Callable[[], Dict[str, Any]],
+    ttl: int,
+    max_payload_bytes: Optional[int],
+) -> bool:
+    """
+    Refresh the current key off the request path. The cache lock ensures a
+    single revalidation across processes; returns False if one is already running.
+    """
+    cache_key = fingerprint.key
+    if not cache.add(f"{cache_key}:lock", "processing", timeout=_get_lock_timeout_seconds()):
+        return False
+    cache.delete_many([f"{cache_key}:error", f"{cache_key}:uncached", f"{cache_key}:handoff"])
+
+    def revalidate():
+        # The request's telemetry is already finished by the time this runs
+        set_telemetry_context(None)
+        try:
+            result = compute()
+            _store_result(cache_key, result, ttl, max_payload_bytes, fingerprint.latest_key)
+        except Exception as e:
+            logger.warning(f"Background revalidation failed for txn {fingerprint.txn_id[:8]}...: {e}")
+            _store_error(cache_key, e)
+        finally:
+            # Connections opened by this worker thread are not managed by a request
+            connections.close_all()
+
+    _get_revalidation_executor().submit(contextvars.copy_context().run, revalidate)
+    return True
+
+
+def get_or_execute_query(
+    queryset,
+    compute: Callable[[], Dict[str, Any]],
+    operation_context: Optional[str] = None,
+    fingerprint: Optional[QueryFingerprint] = None,
+    ttl: int = DEFAULT_TTL,
+    max_payload_bytes: Optional[int] = None,
+    stale_while_revalidate: bool = False,
+) -> Dict[str, Any]:
+    """
+    Return the cached result for a queryset, or execute it exactly once.
+
+    Within a process, the first request for a key becomes the leader and other
+    requests wait on its in-memory future. Across processes, the cache lock
+    elects a single leader and followers are woken by a notification (Redis
+    pub/sub, or backoff polling on other backends). The leader's result, error
+    or timeout is delivered to every follower - followers never fall back to
+    executing the query.
+
+    Args:
+        queryset: Django QuerySet whose SQL identifies the query
+        compute: Zero-argument callable producing the final response
+        operation_context: Optional context string (e.g., "min:value", "max:value")
+        fingerprint: Precomputed QueryFingerprint; skips SQL compilation when given
+        ttl: Seconds to keep the cached response
+        max_payload_bytes: Don't cache responses larger than this (as encoded for the cache)
+        stale_while_revalidate: On a miss, serve the newest response for the same
+                                query under an older canonical_id/generation
+                                (metadata.stale = True) and refresh in the background
+
+    Returns:
+        The response produced by compute(), possibly from another request
+    """
+    fingerprint = _resolve_fingerprint(queryset, operation_context, fingerprint)
+    if fingerprint is None:
+        return compute()
+
+    cache_key = fingerprint.key
+    cached_result, tier = _tiered_get(cache_key)
+    if cached_result is not None:
+        _record_hit(fingerprint, tier)
+        return cached_result
+
+    latest_key = fingerprint.latest_key if stale_while_revalidate else None
+    if stale_while_revalidate:
+        stale_result = _get_stale_result(fingerprint)
+        if stale_result is not None:
+            _revalidate_in_background(fingerprint, compute, ttl, max_payload_bytes)
+            _record_hit(fingerprint, "stale")
+            return _mark_stale(stale_result)
+
+    with _flights_lock:
+        flight = _flights.get(cache_key)
+        is_leader = flight is None
+        if is_leader:
+            flight = _flights[cache_key] = _Flight()
+
+    wait_timeout = _get_wait_timeout_seconds()
+
+    if not is_leader:
+        logger.debug(f"Query being processed in this process, waiting... | txn {fingerprint.txn_id[:8]}...")
+        if not flight.done.wait(wait_timeout):
+            raise _timeout_error(wait_timeout)
+        if flight.error is not None:
+            raise flight.error
+        _record_hit(fingerprint)
+        return flight.result
+
+    _record_miss(fingerprint)
+
+    try:
+        flight.result = _lead(cache_key, compute, wait_timeout, ttl, max_payload_bytes, latest_key)
+        return flight.result
+    except Exception as e:
+        flight.error = e
+        raise
+    finally:
+        with _flights_lock:
+            _flights.pop(cache_key, None)
+        flight.done.set()
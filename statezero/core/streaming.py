@@ -0,0 +1,44 @@
+"""
+Streaming read results.
+
+A read with ``serializerOptions.stream`` set is not serialized up front.
+The AST parser returns a ``ReadStream`` instead, which the adaptor sends as
+one JSON document per frame (NDJSON, or RFC 7464 JSON text sequences):
+
+    {"frame": "metadata", "metadata": {...}}
+    {"frame": "chunk", "data": {"data": [pks], "included": {...}, "model_name": ...}}
+    ...
+    {"frame": "end", "count": <rows streamed>}
+
+Each chunk frame has the same shape as the ``data`` of a normal read
+response, so related objects are included per chunk rather than once.
+
+Frames are produced while the response is sent, after the request handler
+has returned, so the adaptor drains ``frames()`` inside its own transaction,
+statement timeout and ``permission_resolution`` scope.
+"""
+from typing import Any, Dict, Iterable, Iterator
+
+STREAM_FORMATS = {"ndjson", "json-seq"}
+
+
+class ReadStream:
+    """Lazily serialized read result, consumed by the adaptor as frames."""
+
+    def __init__(
+        self,
+        chunks: Iterable[Dict[str, Any]],
+        metadata: Dict[str, Any],
+        format: str = "ndjson",
+    ):
+        self.chunks = chunks
+        self.metadata = metadata
+        self.format = format
+
+    def frames(self) -> Iterator[Dict[str, Any]]:
+        yield {"frame": "metadata", "metadata": self.metadata}
+        count = 0
+        for chunk in self.chunks:
+            count += len(chunk.get("data", []))
+            yield {"frame": "chunk", "data": chunk}
+        yield {"frame": "end", "count": count}
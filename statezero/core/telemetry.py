@@ -3,6 +3,8 @@ Telemetry collection for debugging and performance analysis.
 
 When enabled via config.enable_telemetry, this module tracks:
 - Cache hits/misses with cache keys
+- Query fingerprint (SQL compile + cache key) time
+- Query optimizer JOIN vs prefetch decisions
 - Database queries executed (count and SQL)
 - Hook execution and data transformations
 - Permission-validated fields
@@ -26,6 +28,8 @@ class TelemetryContext:
         self.start_time = time.time()
         self.cache_hits: List[Dict[str, Any]] = []
         self.cache_misses: List[Dict[str, Any]] = []
+        self.query_compiles: List[Dict[str, Any]] = []
+        self.query_plans: List[Dict[str, Any]] = []
         self.db_queries: List[Dict[str, Any]] = []
         self.hooks_executed: List[Dict[str, Any]] = []
         self.permission_fields: Dict[str, Any] = {}
@@ -35,14 +39,15 @@ class TelemetryContext:
         self.events: List[Dict[str, Any]] = []
         self.query_ast: Optional[Dict[str, Any]] = None
 
-    def record_cache_hit(self, cache_key: str, operation_context: Optional[str] = None, sql: Optional[str] = None):
-        """Record a cache hit."""
+    def record_cache_hit(self, cache_key: str, operation_context: Optional[str] = None, sql: Optional[str] = None, tier: Optional[str] = None):
+        """Record a cache hit, optionally with the tier (l1/l2) that served it."""
         if not self.enabled:
             return
         self.cache_hits.append({
             'cache_key': cache_key,
             'operation_context': operation_context,
             'sql_preview': sql[:200] if sql else None,
+            'tier': tier,
             'timestamp': time.time() - self.start_time
         })
 
@@ -57,6 +62,37 @@ class TelemetryContext:
             'timestamp': time.time() - self.start_time
         })
 
+    def record_query_compile(
+        self,
+        cache_key: str,
+        operation_context: Optional[str],
+        duration_ms: float,
+        generation_ms: float = 0.0,
+    ):
+        """
+        Record the time spent compiling SQL and hashing the cache key, and
+        separately the model generation lookup, if the key needed one.
+        """
+        if not self.enabled:
+            return
+        self.query_compiles.append({
+            'cache_key': cache_key,
+            'operation_context': operation_context,
+            'duration_ms': duration_ms,
+            'generation_ms': generation_ms,
+            'timestamp': time.time() - self.start_time
+        })
+
+    def record_query_plan(self, model_name: str, relations: List[Dict[str, Any]]):
+        """Record how the query optimizer chose to load each foreign key of a queryset."""
+        if not self.enabled:
+            return
+        self.query_plans.append({
+            'model': model_name,
+            'relations': relations,
+            'timestamp': time.time() - self.start_time
+        })
+
     def record_db_query(self, sql: str, params: Optional[tuple] = None, duration: Optional[float] = None):
         """Record a database query."""
         if not self.enabled:
@@ -167,10 +203,14 @@ class TelemetryContext:
                 'misses': len(self.cache_misses),
                 'hit_details': self.cache_hits,
                 'miss_details': self.cache_misses,
+                'compile_ms': sum(c['duration_ms'] for c in self.query_compiles),
+                'generation_ms': sum(c['generation_ms'] for c in self.query_compiles),
+                'compile_details': self.query_compiles,
             },
             'database': {
                 'query_count': len(self.db_queries),
                 'queries': self.db_queries,
+                'query_plans': self.query_plans,
             },
             'hooks': {
                 'count': len(self.hooks_executed),
@@ -0,0 +1,163 @@
+"""
+Tests for the batch endpoint, which runs several model queries in one
+transaction and one request context.
+"""
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from statezero.adaptors.django.config import registry
+from statezero.adaptors.django.permissions import AllowAllPermission
+from statezero.core.types import RequestType
+from tests.django_app.models import DummyModel, DummyRelatedModel
+
+
+class CountingPermission(AllowAllPermission):
+    """AllowAllPermission that counts how often the queryset is filtered."""
+
+    filter_calls = 0
+
+    def filter_queryset(self, request: RequestType, queryset: Any) -> Any:
+        type(self).filter_calls += 1
+        return super().filter_queryset(request, queryset)
+
+
+class BatchViewTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="batch", password="password")
+        self.client.force_authenticate(user=self.user)
+        self.related = DummyRelatedModel.objects.create(name="Related")
+        self.first = DummyModel.objects.create(name="First", value=10, related=self.related)
+        self.second = DummyModel.objects.create(name="Second", value=20, related=self.related)
+        self.url = reverse("statezero:batch")
+
+    def _query(self, model_name, query):
+        return {"model_name": model_name, "ast": {"query": query}}
+
+    def test_results_are_returned_in_order(self):
+        entries = [
+            self._query("django_app.DummyModel", {"type": "count", "field": "id"}),
+            self._query("django_app.DummyRelatedModel", {"type": "read"}),
+            self._query(
+                "django_app.DummyModel",
+                {"type": "read", "filter": {"type": "filter", "conditions": {"value": 20}}},
+            ),
+        ]
+        response = self.client.post(self.url, data={"queries": entries}, format="json")
+        self.assertEqual(response.status_code, 200, response.data)
+
+        results = response.data["results"]
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]["data"], 2)
+        self.assertEqual(results[1]["data"]["data"], [self.related.pk])
+        self.assertEqual(results[2]["data"]["data"], [self.second.pk])
+
+        # Each entry matches what the single-query endpoint returns
+        for entry, result in zip(entries, results):
+            single = self.client.post(
+                reverse("statezero:model_view", args=[entry["model_name"]]),
+                data={"ast": entry["ast"]},
+                format="json",
+            )
+            self.assertEqual(single.status_code, 200, single.data)
+            self.assertEqual(single.data, result)
+
+    def test_writes_are_visible_to_later_entries(self):
+        entries = [
+            self._query("django_app.DummyModel", {"type": "read"}),
+            self._query(
+                "django_app.DummyModel",
+                {"type": "create", "data": {"name": "Third", "value": 30}},
+            ),
+            self._query("django_app.DummyModel", {"type": "read"}),
+            self._query("django_app.DummyModel", {"type": "count", "field": "id"}),
+        ]
+        response = self.client.post(self.url, data={"queries": entries}, format="json")
+        self.assertEqual(response.status_code, 200, response.data)
+        results = response.data["results"]
+        self.assertEqual(len(results[0]["data"]["data"]), 2)
+        self.assertEqual(len(results[2]["data"]["data"]), 3)
+        self.assertEqual(results[3]["data"], 3)
+
+    def test_failing_entry_rolls_back_the_batch(self):
+        entries = [
+            self._query(
+                "django_app.DummyModel",
+                {"type": "create", "data": {"name": "Rolled back", "value": 30}},
+            ),
+            self._query(
+                "django_app.DummyModel",
+                {"type": "get", "filter": {"type": "filter", "conditions": {"value": 999}}},
+            ),
+        ]
+        response = self.client.post(self.url, data={"queries": entries}, format="json")
+        self.assertEqual(response.status_code, 404, response.data)
+        self.assertEqual(response.data["index"], 1)
+        self.assertFalse(DummyModel.objects.filter(name="Rolled back").exists())
+
+    def test_rolled_back_reads_are_not_cached(self):
+        cache.clear()
+        read = self._query("django_app.DummyModel", {"type": "read"})
+        entries = [
+            self._query(
+                "django_app.DummyModel",
+                {"type": "create", "data": {"name": "Ghost", "value": 30}},
+            ),
+            read,
+            self._query(
+                "django_app.DummyModel",
+                {"type": "create", "data": {"name": "Invalid", "value": "notanint"}},
+            ),
+        ]
+        response = self.client.post(
+            self.url, data={"queries": entries}, format="json", HTTP_X_CANONICAL_ID="batch-rollback"
+        )
+        self.assertEqual(response.status_code, 400, response.data)
+        self.assertFalse(DummyModel.objects.filter(name="Ghost").exists())
+
+        with CaptureQueriesContext(connection) as queries:
+            single = self.client.post(
+                reverse("statezero:model_view", args=["django_app.DummyModel"]),
+                data={"ast": read["ast"]},
+                format="json",
+                HTTP_X_CANONICAL_ID="batch-rollback",
+            )
+        self.assertEqual(single.status_code, 200, single.data)
+        self.assertEqual(
+            sorted(single.data["data"]["data"]), sorted([self.first.pk, self.second.pk])
+        )
+        self.assertTrue(queries.captured_queries)
+
+    def test_rejects_malformed_batches(self):
+        response = self.client.post(self.url, data={"queries": {}}, format="json")
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post(
+            self.url, data={"queries": [{"ast": {}}]}, format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["index"], 0)
+
+    def test_permission_work_is_shared_across_entries(self):
+        model_config = registry.get_config(DummyModel)
+        original_permissions = model_config._permissions
+        model_config._permissions = [CountingPermission]
+        CountingPermission.filter_calls = 0
+        try:
+            entries = [
+                self._query("django_app.DummyModel", {"type": "read"}),
+                self._query("django_app.DummyModel", {"type": "count", "field": "id"}),
+                self._query("django_app.DummyModel", {"type": "exists"}),
+            ]
+            response = self.client.post(
+                self.url, data={"queries": entries}, format="json"
+            )
+            self.assertEqual(response.status_code, 200, response.data)
+            self.assertEqual(CountingPermission.filter_calls, 1)
+        finally:
+            model_config._permissions = original_permissions
@@ -0,0 +1,100 @@
+"""
+Tests for set-based ManyToMany writes in bulk updates.
+"""
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models.signals import m2m_changed
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from statezero.adaptors.django.bulk_m2m import set_many_to_many
+from tests.django_app.models import Book, Tag
+
+
+class BulkM2MUpdateTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            username="bulk_m2m", password="password", email="bulk_m2m@test.com"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.books = [Book.objects.create(title=f"Book {i}") for i in range(3)]
+        self.url = reverse("statezero:model_view", args=["django_app.Tag"])
+
+    def _tags(self, count, priority=1):
+        tags = [Tag.objects.create(name=f"Tag {priority}-{i}", priority=priority) for i in range(count)]
+        for tag in tags:
+            tag.books.set(self.books[:2])
+        return tags
+
+    def _update(self, data, conditions):
+        response = self.client.post(
+            self.url,
+            data={
+                "ast": {
+                    "query": {
+                        "type": "update",
+                        "filter": {"type": "filter", "conditions": conditions},
+                        "data": data,
+                    }
+                }
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def _book_pks(self, tag):
+        return sorted(tag.books.values_list("pk", flat=True))
+
+    def test_links_are_replaced_on_every_matched_row(self):
+        tags = self._tags(3)
+        untouched = self._tags(1, priority=9)[0]
+        target = [self.books[1].pk, self.books[2].pk]
+
+        result = self._update({"books": target}, {"priority": 1})
+
+        self.assertEqual(result["metadata"]["updated_count"], 3)
+        for tag in tags:
+            self.assertEqual(self._book_pks(tag), target)
+        self.assertEqual(self._book_pks(untouched), [self.books[0].pk, self.books[1].pk])
+
+        self._update({"books": []}, {"priority": 1})
+        for tag in tags:
+            self.assertEqual(self._book_pks(tag), [])
+
+    def test_query_count_does_not_grow_with_rows(self):
+        counts = []
+        for priority, count in ((1, 2), (2, 8)):
+            pks = [tag.pk for tag in self._tags(count, priority=priority)]
+            with CaptureQueriesContext(connection) as queries:
+                set_many_to_many(Tag, pks, {"books": [self.books[2].pk]})
+            counts.append(len(queries.captured_queries))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_rows_moved_out_of_the_filter_still_get_links(self):
+        tags = self._tags(2)
+        self._update({"priority": 5, "books": [self.books[2].pk]}, {"priority": 1})
+        for tag in tags:
+            tag.refresh_from_db()
+            self.assertEqual(tag.priority, 5)
+            self.assertEqual(self._book_pks(tag), [self.books[2].pk])
+
+    def test_signals_flag_keeps_per_row_set(self):
+        self._tags(2)
+        received = []
+
+        def handler(sender, instance, action, **kwargs):
+            if action == "post_add":
+                received.append(instance.pk)
+
+        m2m_changed.connect(handler, sender=Tag.books.through)
+        try:
+            self._update({"books": [self.books[2].pk]}, {"priority": 1})
+            self.assertEqual(received, [])
+            with override_settings(STATEZERO_BULK_M2M_SIGNALS=True):
+                self._update({"books": [self.books[0].pk]}, {"priority": 1})
+            self.assertEqual(len(received), 2)
+        finally:
+            m2m_changed.disconnect(handler, sender=Tag.books.through)
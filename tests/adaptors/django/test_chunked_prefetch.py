@@ -0,0 +1,70 @@
+from unittest import mock
+
+from django.db import connection
+from django.db.models import Prefetch
+from django.test import TestCase, override_settings
+
+from statezero.adaptors.django.prefetch import (chunked_prefetch_related_objects,
+                                                pk_in_batches)
+from statezero.adaptors.django.query_optimizer import (
+    DjangoQueryOptimizer, clear_optimization_plan_cache)
+from tests.django_app.models import Order, OrderItem, Product, ProductCategory
+
+
+@override_settings(STATEZERO_PK_IN_BATCH_SIZE=2)
+class ChunkedPrefetchTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        order = Order.objects.create(
+            order_number="O-1", customer_name="C", customer_email="c@example.com", total=1
+        )
+        for i in range(5):
+            category = ProductCategory.objects.create(name=f"Category {i}")
+            for j in range(2):
+                product = Product.objects.create(
+                    name=f"Product {i}-{j}", description="", price=1, category=category
+                )
+                OrderItem.objects.create(order=order, product=product, quantity=1, price=1)
+
+    def setUp(self):
+        clear_optimization_plan_cache()
+
+    def tearDown(self):
+        clear_optimization_plan_cache()
+
+    def test_each_level_is_fetched_in_chunks(self):
+        categories = list(ProductCategory.objects.order_by("id"))
+        lookup = Prefetch(
+            "products", queryset=Product.objects.order_by("id").prefetch_related("orderitem_set")
+        )
+        # 5 categories in chunks of 2, then 10 products in chunks of 2
+        with self.assertNumQueries(3 + 5):
+            chunked_prefetch_related_objects(categories, lookup)
+
+        with self.assertNumQueries(0):
+            products = [product for category in categories for product in category.products.all()]
+            items = [item for product in products for item in product.orderitem_set.all()]
+        self.assertEqual([product.name for product in products[:2]], ["Product 0-0", "Product 0-1"])
+        self.assertEqual(len(items), 10)
+        self.assertEqual({item.product_id for item in items}, {product.pk for product in products})
+
+    def test_optimized_querysets_prefetch_in_chunks(self):
+        optimizer = DjangoQueryOptimizer(get_model_name_func=lambda model: model.__name__)
+        queryset = optimizer.optimize(
+            ProductCategory.objects.order_by("id"), fields=["name", "products__name"]
+        )
+        with self.assertNumQueries(1 + 3):
+            categories = list(queryset)
+        with self.assertNumQueries(0):
+            counts = [len(category.products.all()) for category in categories]
+        self.assertEqual(counts, [2] * 5)
+
+    @override_settings(STATEZERO_POSTGRES_ANY_ARRAYS=True)
+    def test_postgres_binds_one_array(self):
+        with mock.patch.object(connection, "vendor", "postgresql"):
+            filters = list(pk_in_batches("id", [1, 2, 3]))
+        self.assertEqual(len(filters), 1)
+        self.assertIn("= ANY(", str(Product.objects.filter(filters[0]).query))
+
+        # Other backends keep chunked IN lists
+        self.assertEqual(len(list(pk_in_batches("id", [1, 2, 3]))), 2)
@@ -0,0 +1,114 @@
+"""
+Tests for serializerOptions.include_total, which returns the total row count
+with a list read.
+"""
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from statezero.client.runtime_template import Manager, configure
+from statezero.client.testing import DjangoTestTransport
+from tests.django_app.models import DummyModel
+
+# A bare manager: declaring another Model subclass for django_app.dummymodel
+# would replace the client class other test modules registered for it
+dummy_models = Manager("django_app.dummymodel")
+
+
+class IncludeTotalTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            username="total", password="password", email="total@test.com"
+        )
+        self.client.force_authenticate(user=self.user)
+        for value in range(7):
+            DummyModel.objects.create(name=f"Row {value}", value=value)
+        self.url = reverse("statezero:model_view", args=["django_app.DummyModel"])
+
+    def _read(self, query=None, **serializer_options):
+        response = self.client.post(
+            self.url,
+            data={
+                "ast": {
+                    "query": {"type": "read", "orderBy": ["value"], **(query or {})},
+                    "serializerOptions": serializer_options,
+                }
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def test_total_is_returned_with_the_page(self):
+        result = self._read(limit=3, offset=2, include_total=True)
+        self.assertEqual(result["metadata"]["total"], 7)
+        self.assertEqual(len(result["data"]["data"]), 3)
+
+        filtered = self._read(
+            {"filter": {"type": "filter", "conditions": {"value__gte": 5}}},
+            limit=1,
+            include_total=True,
+        )
+        self.assertEqual(filtered["metadata"]["total"], 2)
+
+    def test_total_is_omitted_unless_requested(self):
+        result = self._read(limit=3)
+        self.assertNotIn("total", result["metadata"])
+
+    def test_total_past_the_last_page(self):
+        result = self._read(limit=3, offset=10, include_total=True)
+        self.assertEqual(result["data"]["data"], [])
+        self.assertEqual(result["metadata"]["total"], 7)
+
+    def test_total_with_cursor_pagination(self):
+        result = self._read(limit=2, pagination="cursor", include_total=True)
+        self.assertEqual(result["metadata"]["total"], 7)
+        self.assertIsNotNone(result["metadata"]["next_cursor"])
+
+    def _postgres_read(self, query=None, **serializer_options):
+        postgres = mock.Mock(vendor="postgresql")
+        with mock.patch("statezero.adaptors.django.orm.connections", {"default": postgres}):
+            with CaptureQueriesContext(connection) as queries:
+                result = self._read(query, include_total=True, **serializer_options)
+        table = DummyModel._meta.db_table
+        return result, [q["sql"] for q in queries.captured_queries if table in q["sql"]]
+
+    def test_postgres_reads_the_total_from_the_page(self):
+        result, sql = self._postgres_read(limit=3, offset=2)
+        self.assertEqual(result["metadata"]["total"], 7)
+        self.assertEqual(
+            [DummyModel.objects.get(pk=pk).value for pk in result["data"]["data"]], [2, 3, 4]
+        )
+        self.assertEqual(len(sql), 1)
+        self.assertIn("OVER", sql[0])
+
+    def test_postgres_empty_page(self):
+        result, sql = self._postgres_read(
+            {"filter": {"type": "filter", "conditions": {"value__gte": 100}}}, limit=3
+        )
+        self.assertEqual(result["metadata"]["total"], 0)
+        self.assertEqual(len(sql), 1)
+
+        result, sql = self._postgres_read(limit=3, offset=10)
+        self.assertEqual(result["metadata"]["total"], 7)
+        self.assertEqual(len(sql), 2)
+        self.assertIn("COUNT(*)", sql[1])
+
+
+class IncludeTotalClientTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            username="total_client", password="password", email="client@test.com"
+        )
+        configure(transport=DjangoTestTransport(user=self.user))
+        for value in range(4):
+            DummyModel.objects.create(name=f"Row {value}", value=value)
+
+    def test_fetch_returns_total(self):
+        page = dummy_models.order_by("value").fetch(limit=2, include_total=True)
+        self.assertEqual([row.value for row in page], [0, 1])
+        self.assertEqual(page.total, 4)
@@ -0,0 +1,154 @@
+"""
+Tests for keyset (cursor) pagination of list reads.
+"""
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from statezero.adaptors.django.config import config, registry
+from statezero.adaptors.django.permissions import AllowAllPermission
+from statezero.client.runtime_template import Manager, configure
+from statezero.client.testing import DjangoTestTransport
+from tests.django_app.models import DummyModel, DummyRelatedModel
+
+# A bare manager: declaring another Model subclass for django_app.dummymodel
+# would replace the client class other test modules registered for it
+dummy_models = Manager("django_app.dummymodel")
+
+
+class HiddenNamePermission(AllowAllPermission):
+    def visible_fields(self, request, model):
+        return {"id"}
+
+
+class KeysetPaginationTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            username="keyset", password="password", email="keyset@test.com"
+        )
+        self.client.force_authenticate(user=self.user)
+        # Duplicate and NULL values exercise the pk tie-break and NULL ordering
+        for value in [3, 1, None, 2, 2, None, 5]:
+            DummyModel.objects.create(name=f"Row {value}", value=value)
+        self.url = reverse("statezero:model_view", args=["django_app.DummyModel"])
+
+    def _read(self, order_by, **serializer_options):
+        response = self.client.post(
+            self.url,
+            data={
+                "ast": {
+                    "query": {"type": "read", "orderBy": order_by},
+                    "serializerOptions": {"pagination": "cursor", **serializer_options},
+                }
+            },
+            format="json",
+        )
+        return response
+
+    def _page(self, order_by, **serializer_options):
+        response = self._read(order_by, **serializer_options)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data["data"]["data"], response.data["metadata"]
+
+    def _walk(self, order_by):
+        pks, metadata = self._page(order_by, limit=2)
+        pages = [pks]
+        while metadata["next_cursor"]:
+            pks, metadata = self._page(order_by, limit=2, after=metadata["next_cursor"])
+            pages.append(pks)
+        return pages
+
+    def test_pages_cover_every_row_once(self):
+        expected_asc = [
+            row.pk
+            for row in sorted(
+                DummyModel.objects.all(), key=lambda row: (row.value is None, row.value or 0, row.pk)
+            )
+        ]
+        pages = self._walk(["value"])
+        self.assertEqual([len(page) for page in pages], [2, 2, 2, 1])
+        self.assertEqual([pk for page in pages for pk in page], expected_asc)
+
+        non_null = sorted(
+            (row for row in DummyModel.objects.all() if row.value is not None),
+            key=lambda row: (-row.value, row.pk),
+        )
+        nulls = sorted(row.pk for row in DummyModel.objects.filter(value__isnull=True))
+        pages = self._walk(["-value"])
+        self.assertEqual([pk for page in pages for pk in page], [row.pk for row in non_null] + nulls)
+
+    def test_before_returns_the_previous_page(self):
+        first, metadata = self._page(["value"], limit=3)
+        self.assertIsNone(metadata["prev_cursor"])
+        second, metadata = self._page(["value"], limit=3, after=metadata["next_cursor"])
+
+        previous, metadata = self._page(["value"], limit=3, before=metadata["prev_cursor"])
+        self.assertEqual(previous, first)
+        self.assertIsNone(metadata["prev_cursor"])
+        self.assertIsNotNone(metadata["next_cursor"])
+
+    def test_inserted_rows_do_not_shift_pages(self):
+        first, metadata = self._page(["value"], limit=2)
+        DummyModel.objects.create(name="Early", value=0)
+        second, _ = self._page(["value"], limit=2, after=metadata["next_cursor"])
+        self.assertFalse(set(first) & set(second))
+        self.assertEqual(
+            [DummyModel.objects.get(pk=pk).value for pk in second], [2, 3]
+        )
+
+    def test_cursor_must_match_ordering(self):
+        _, metadata = self._page(["value"], limit=2)
+        response = self._read(["-value"], limit=2, after=metadata["next_cursor"])
+        self.assertEqual(response.status_code, 400)
+
+        response = self._read(["value"], limit=2, after="not-a-cursor")
+        self.assertEqual(response.status_code, 400)
+
+    def test_providers_without_keyset_pages_reject_cursors(self):
+        with mock.patch.object(config.orm_provider, "keyset_page", return_value=None):
+            response = self._read(["value"], limit=2)
+        self.assertEqual(response.status_code, 400)
+
+    def test_nested_ordering_fields_are_permission_checked(self):
+        related = DummyRelatedModel.objects.create(name="Secret")
+        DummyModel.objects.update(related=related)
+        _, metadata = self._page(["related__name"], limit=2)
+        self.assertIsNotNone(metadata["next_cursor"])
+
+        model_config = registry.get_config(DummyRelatedModel)
+        original_permissions = model_config._permissions
+        model_config._permissions = [HiddenNamePermission]
+        try:
+            response = self._read(["related__name"], limit=2)
+        finally:
+            model_config._permissions = original_permissions
+        self.assertEqual(response.status_code, 403, response.data)
+        self.assertNotIn("Secret", str(response.data))
+
+    def test_offset_is_rejected(self):
+        response = self._read(["value"], limit=2, offset=2)
+        self.assertEqual(response.status_code, 400)
+
+
+class KeysetClientTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            username="keyset_client", password="password", email="client@test.com"
+        )
+        configure(transport=DjangoTestTransport(user=self.user))
+        for value in range(5):
+            DummyModel.objects.create(name=f"Row {value}", value=value)
+
+    def test_fetch_follows_cursors(self):
+        queryset = dummy_models.order_by("-value")
+        page = queryset.fetch(limit=2, cursor=True)
+        values = [row.value for row in page]
+        while page.next_cursor:
+            page = queryset.fetch(limit=2, after=page.next_cursor)
+            values.extend(row.value for row in page)
+        self.assertEqual(values, [4, 3, 2, 1, 0])
+
+        back = queryset.fetch(limit=2, before=page.prev_cursor)
+        self.assertEqual([row.value for row in back], [2, 1])
@@ -0,0 +1,139 @@
+"""
+Tests for permissions that describe their rows with filter_condition, which
+are merged into a single WHERE clause instead of ORing filtered querysets.
+"""
+from itertools import combinations
+from typing import Any, Type
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db.models import Exists, OuterRef, Q
+from django.test import RequestFactory, TestCase
+
+from statezero.adaptors.django.config import config, registry
+from statezero.adaptors.django.permissions import (AllowAllPermission,
+                                                   IsStaffPermission)
+from statezero.core.config import ModelConfig
+from statezero.core.process_request import RequestProcessor
+from statezero.core.types import RequestType
+from tests.django_app.models import DummyModel, DummyRelatedModel
+
+
+class ValueAtLeastTen(AllowAllPermission):
+    def filter_queryset(self, request: RequestType, queryset: Any) -> Any:
+        return queryset.filter(value__gte=10)
+
+    def filter_condition(self, request: RequestType, model: Type) -> Any:
+        return Q(value__gte=10)
+
+
+class NameStartsWithA(AllowAllPermission):
+    def filter_queryset(self, request: RequestType, queryset: Any) -> Any:
+        return queryset.filter(name__startswith="A")
+
+    def filter_condition(self, request: RequestType, model: Type) -> Any:
+        return Q(name__startswith="A")
+
+
+class RelatedIsShared(AllowAllPermission):
+    def filter_queryset(self, request: RequestType, queryset: Any) -> Any:
+        return queryset.filter(related__name="Shared")
+
+    def filter_condition(self, request: RequestType, model: Type) -> Any:
+        return Exists(
+            DummyRelatedModel.objects.filter(pk=OuterRef("related_id"), name="Shared")
+        )
+
+
+class DenyAll(AllowAllPermission):
+    def filter_queryset(self, request: RequestType, queryset: Any) -> Any:
+        return queryset.none()
+
+    def filter_condition(self, request: RequestType, model: Type) -> Any:
+        return Q(pk__in=[])
+
+
+def _without_condition(permission_cls):
+    """The same permission, applied through filter_queryset only."""
+    return type(
+        f"Legacy{permission_cls.__name__}",
+        (permission_cls,),
+        {"filter_condition": lambda self, request, model: None},
+    )
+
+
+PERMISSIONS = [ValueAtLeastTen, NameStartsWithA, RelatedIsShared, DenyAll, AllowAllPermission]
+
+
+class PermissionConditionTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        shared = DummyRelatedModel.objects.create(name="Shared")
+        other = DummyRelatedModel.objects.create(name="Other")
+        for name, value, related in [
+            ("Alpha", 1, shared),
+            ("Apex", 20, None),
+            ("Beta", 15, other),
+            ("Gamma", 3, None),
+            ("Delta", 30, shared),
+            ("Axe", None, other),
+        ]:
+            DummyModel.objects.create(name=name, value=value, related=related)
+        cls.user = User.objects.create_user(username="conditions", password="password")
+
+    def setUp(self):
+        self.request = RequestFactory().get("/")
+        self.request.user = self.user
+        self.processor = RequestProcessor(config=config, registry=registry)
+
+    def _pks(self, permissions):
+        queryset = self.processor._get_permitted_queryset(
+            self.request, DummyModel, ModelConfig(model=DummyModel, permissions=permissions), {}
+        )
+        return sorted(queryset.values_list("pk", flat=True))
+
+    def test_conditions_match_or_of_querysets(self):
+        for size in (1, 2, 3):
+            for permissions in combinations(PERMISSIONS, size):
+                legacy = [_without_condition(p) for p in permissions]
+                with self.subTest(permissions=[p.__name__ for p in permissions]):
+                    self.assertEqual(self._pks(list(permissions)), self._pks(legacy))
+
+    def test_conditions_mix_with_queryset_permissions(self):
+        permissions = [ValueAtLeastTen, _without_condition(NameStartsWithA), RelatedIsShared]
+        legacy = [_without_condition(p) for p in permissions]
+        self.assertEqual(self._pks(permissions), self._pks(legacy))
+
+    def test_providers_without_filter_any_use_filter_queryset(self):
+        permissions = [ValueAtLeastTen, NameStartsWithA, RelatedIsShared]
+        expected = self._pks([_without_condition(p) for p in permissions])
+        with mock.patch.object(self.processor.orm_provider, "filter_any", return_value=None):
+            self.assertEqual(self._pks(permissions), expected)
+
+    def test_conditions_share_one_where_clause(self):
+        queryset = self.processor._get_permitted_queryset(
+            self.request,
+            DummyModel,
+            ModelConfig(model=DummyModel, permissions=[ValueAtLeastTen, NameStartsWithA]),
+            {},
+        )
+        sql = str(queryset.query)
+        self.assertEqual(sql.count("WHERE"), 1)
+        self.assertIn(" OR ", sql)
+
+    def test_builtin_permissions_provide_conditions(self):
+        self.assertEqual(self._pks([IsStaffPermission]), [])
+        self.assertEqual(
+            self._pks([IsStaffPermission, ValueAtLeastTen]),
+            self._pks([_without_condition(IsStaffPermission), _without_condition(ValueAtLeastTen)]),
+        )
+
+    def test_subclasses_overriding_filter_queryset_fall_back_to_it(self):
+        class OnlyGamma(AllowAllPermission):
+            def filter_queryset(self, request: RequestType, queryset: Any) -> Any:
+                return queryset.filter(name="Gamma")
+
+        self.assertIsNone(OnlyGamma().filter_condition(self.request, DummyModel))
+        self.assertEqual(
+            self._pks([OnlyGamma]), [DummyModel.objects.get(name="Gamma").pk]
+        )
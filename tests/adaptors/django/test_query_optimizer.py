@@ -1,9 +1,11 @@
 import time
-from django.test import TestCase
+from unittest import mock
+
+from django.test import TestCase, override_settings
 from django.db import connection, reset_queries
 from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 
 from tests.django_app.models import (
     Product, ProductCategory, Order, OrderItem,
@@ -11,8 +13,14 @@ from tests.django_app.models import (
     ComprehensiveModel, DailyRate, RatePlan
 )
 
+from statezero.adaptors.django.config import registry
+from statezero.core.classes import QueryCostHints
+from statezero.core.telemetry import clear_telemetry_context, create_telemetry_context
+
 # Update imports to include DjangoQueryOptimizer
-from statezero.adaptors.django.query_optimizer import DjangoQueryOptimizer
+from statezero.adaptors.django.query_optimizer import (
+    DjangoQueryOptimizer, build_optimization_plan, clear_optimization_plan_cache
+)
 
 class QueryOptimizerTests(TestCase):
     """Tests for the query optimizer covering various scenarios."""
@@ -634,4 +642,124 @@ class ForcePrefetchTests(TestCase):
             query_count, 1,
             f"Without prefetching, should have N+1 queries, got {query_count}"
         )
-        print(f"\nN+1 verification: {count} objects caused {query_count} queries (expected ~{count + 1})")
\ No newline at end of file
+        print(f"\nN+1 verification: {count} objects caused {query_count} queries (expected ~{count + 1})")
+
+
+class OptimizationPlanCacheTests(TestCase):
+    """Plans are computed once per model and field selection and reused."""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = ProductCategory.objects.create(name="Category")
+        for i in range(3):
+            Product.objects.create(name=f"Product {i}", description="", price=i, category=category)
+
+    def setUp(self):
+        clear_optimization_plan_cache()
+        self.optimizer = DjangoQueryOptimizer(get_model_name_func=lambda model: model.__name__)
+
+    def tearDown(self):
+        clear_optimization_plan_cache()
+
+    def test_plan_is_reused_for_same_fields(self):
+        fields = ['name', 'category__name']
+        with mock.patch(
+            "statezero.adaptors.django.query_optimizer.build_optimization_plan",
+            wraps=build_optimization_plan,
+        ) as build:
+            first = self.optimizer.optimize(Product.objects.all(), fields=fields)
+            second = self.optimizer.optimize(Product.objects.filter(price__gte=1), fields=list(reversed(fields)))
+            self.optimizer.optimize(Product.objects.all(), fields=['name'])
+        self.assertEqual(build.call_count, 2)
+
+        self.assertEqual(first.query.select_related, {'category': {}})
+        self.assertEqual(second.query.select_related, {'category': {}})
+        with self.assertNumQueries(1):
+            names = [product.category.name for product in second]
+        self.assertEqual(names, ["Category", "Category"])
+
+    def test_each_use_gets_its_own_prefetch_objects(self):
+        optimizer = DjangoQueryOptimizer(get_model_name_func=lambda model: model.__name__)
+        fields = ['name', 'products__name']
+        querysets = [optimizer.optimize(ProductCategory.objects.all(), fields=fields) for _ in range(2)]
+        first, second = (
+            [lookup for lookup in qs._prefetch_related_lookups if isinstance(lookup, Prefetch)]
+            for qs in querysets
+        )
+        self.assertTrue(first)
+        for a, b in zip(first, second):
+            self.assertIsNot(a, b)
+            self.assertIsNot(a.queryset, b.queryset)
+        # Running the prefetch leaves the next use untouched
+        for category in querysets[0]:
+            self.assertEqual(len(category.products.all()), 3)
+        third = optimizer.optimize(ProductCategory.objects.all(), fields=fields)
+        with self.assertNumQueries(2):
+            self.assertEqual([len(c.products.all()) for c in third], [3])
+
+    def test_clearing_the_cache_rebuilds_plans(self):
+        with mock.patch(
+            "statezero.adaptors.django.query_optimizer.build_optimization_plan",
+            wraps=build_optimization_plan,
+        ) as build:
+            self.optimizer.optimize(Product.objects.all(), fields=['name'])
+            clear_optimization_plan_cache()
+            self.optimizer.optimize(Product.objects.all(), fields=['name'])
+        self.assertEqual(build.call_count, 2)
+
+
+class CostBasedPlanningTests(TestCase):
+    """select_related vs prefetch per foreign key from the cost model."""
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(2):
+            category = ProductCategory.objects.create(name=f"Category {i}")
+            for j in range(3):
+                Product.objects.create(name=f"Product {i}-{j}", description="", price=j, category=category)
+
+    def setUp(self):
+        clear_optimization_plan_cache()
+        self.product_config = registry.get_config(Product)
+        self.category_config = registry.get_config(ProductCategory)
+        self.optimizer = DjangoQueryOptimizer(get_model_name_func=lambda model: model.__name__)
+
+    def tearDown(self):
+        self.product_config.query_cost = QueryCostHints()
+        self.category_config.query_cost = QueryCostHints()
+        clear_optimization_plan_cache()
+        clear_telemetry_context()
+
+    def _optimize(self):
+        return self.optimizer.optimize(Product.objects.order_by('id'), fields=['name', 'category__name'])
+
+    def _relations(self):
+        telemetry = create_telemetry_context(enabled=True)
+        queryset = self._optimize()
+        return queryset, telemetry.get_telemetry_data()['database']['query_plans'][0]['relations']
+
+    def test_joins_without_estimates(self):
+        queryset, relations = self._relations()
+        self.assertEqual(queryset.query.select_related, {'category': {}})
+        self.assertEqual(relations[0]['path'], 'category')
+        self.assertEqual(relations[0]['choice'], 'select_related')
+        self.assertEqual(relations[0]['fanout_source'], 'default')
+
+    def test_high_fanout_hint_prefetches(self):
+        self.product_config.query_cost = QueryCostHints(fanout={'category': 50})
+        queryset, relations = self._relations()
+        self.assertFalse(queryset.query.select_related)
+        self.assertEqual(relations[0]['choice'], 'prefetch')
+        self.assertLess(relations[0]['prefetch_cost'], relations[0]['join_cost'])
+
+        with self.assertNumQueries(2):
+            names = [product.category.name for product in queryset]
+        self.assertEqual(names, ['Category 0'] * 3 + ['Category 1'] * 3)
+
+    @override_settings(STATEZERO_OPTIMIZER_SAMPLE_SIZE=100)
+    def test_sampled_fanout(self):
+        self.category_config.query_cost = QueryCostHints(row_width=10000)
+        queryset, relations = self._relations()
+        self.assertEqual(relations[0]['fanout_source'], 'sampled')
+        self.assertEqual(relations[0]['fanout'], 3)
+        self.assertEqual(relations[0]['choice'], 'prefetch')
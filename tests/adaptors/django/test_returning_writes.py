@@ -0,0 +1,103 @@
+"""
+Tests for bulk update and delete with an exact affected set: UPDATE/DELETE
+... RETURNING on PostgreSQL and a pk snapshot elsewhere.
+
+SQLite also understands RETURNING, so the PostgreSQL path is exercised here by
+enabling it explicitly.
+"""
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from statezero.adaptors.django.returning import delete_returning, update_returning
+from tests.django_app.models import Book, DummyModel, Tag
+
+RETURNING = "statezero.adaptors.django.returning.supports_returning"
+
+
+class ReturningWritesTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            username="returning", password="password", email="returning@test.com"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.rows = [DummyModel.objects.create(name=f"Row {i}", value=1) for i in range(3)]
+        DummyModel.objects.create(name="Other", value=9)
+        self.url = reverse("statezero:model_view", args=["django_app.DummyModel"])
+
+    def _write(self, query):
+        response = self.client.post(self.url, data={"ast": {"query": query}}, format="json")
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def _update_value(self):
+        return self._write(
+            {
+                "type": "update",
+                "filter": {"type": "filter", "conditions": {"value": 1}},
+                "data": {"value": 2},
+            }
+        )
+
+    def test_update_returns_rows_moved_out_of_the_filter(self):
+        for returning in (False, True):
+            DummyModel.objects.filter(pk__in=[row.pk for row in self.rows]).update(value=1)
+            with self.subTest(returning=returning), mock.patch(RETURNING, return_value=returning):
+                result = self._update_value()
+                self.assertEqual(result["metadata"]["updated_count"], 3)
+                self.assertEqual(
+                    sorted(result["data"]["data"]), sorted(row.pk for row in self.rows)
+                )
+
+    def test_update_returning_replaces_snapshot_and_reload(self):
+        table = DummyModel._meta.db_table
+        statements = {}
+        for returning in (False, True):
+            DummyModel.objects.filter(pk__in=[row.pk for row in self.rows]).update(value=1)
+            with mock.patch(RETURNING, return_value=returning):
+                with CaptureQueriesContext(connection) as queries:
+                    self._update_value()
+            statements[returning] = [q["sql"] for q in queries.captured_queries if table in q["sql"]]
+
+        updates = [sql for sql in statements[True] if sql.startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn("RETURNING", updates[0])
+        self.assertEqual(len(statements[False]) - len(statements[True]), 2)
+
+    def test_update_returning_converts_values(self):
+        with mock.patch(RETURNING, return_value=True):
+            instances = update_returning(
+                DummyModel.objects.filter(value=1), {"name": "Renamed"}, ["name"]
+            )
+        self.assertEqual(sorted(i.pk for i in instances), sorted(row.pk for row in self.rows))
+        self.assertEqual({i.name for i in instances}, {"Renamed"})
+        self.assertEqual(instances[0].get_deferred_fields(), {"value", "related_id"})
+
+    def test_delete_reports_deleted_pks(self):
+        result = self._write(
+            {"type": "delete", "filter": {"type": "filter", "conditions": {"value": 1}}}
+        )
+        self.assertEqual(result["metadata"]["deleted_count"], 3)
+        self.assertEqual(
+            sorted(row["id"] for row in result["metadata"]["rows_deleted"]),
+            sorted(row.pk for row in self.rows),
+        )
+        self.assertEqual(DummyModel.objects.count(), 1)
+
+    def test_fast_delete_uses_returning(self):
+        books = [Book.objects.create(title=f"Book {i}") for i in range(2)]
+        tag = Tag.objects.create(name="returning")
+        tag.books.set(books)
+        links = Tag.books.through.objects.filter(tag=tag)
+        expected = sorted(links.values_list("pk", flat=True))
+
+        with mock.patch(RETURNING, return_value=True):
+            with CaptureQueriesContext(connection) as queries:
+                deleted, pks = delete_returning(links)
+        self.assertEqual((deleted, sorted(pks)), (2, expected))
+        self.assertEqual(len(queries.captured_queries), 1)
+        self.assertIn("RETURNING", queries.captured_queries[0]["sql"])
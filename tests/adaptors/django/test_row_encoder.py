@@ -0,0 +1,132 @@
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import serializers
+
+from statezero.adaptors.django.config import config
+from statezero.adaptors.django.row_encoder import _scalar_converter, get_row_encoder
+from statezero.adaptors.django.serializers import (DynamicModelSerializer,
+                                                   fields_map_context)
+from tests.django_app.models import (ComprehensiveModel, DailyRate,
+                                     DeepModelLevel1, DeepModelLevel2,
+                                     DeepModelLevel3, Order, OrderItem,
+                                     Product, ProductCategory, RatePlan)
+
+
+def _fields_map(*models_and_extra):
+    fields_map = {}
+    for model, extra in models_and_extra:
+        names = {field.name for field in model._meta.concrete_fields}
+        names |= {field.name for field in model._meta.many_to_many}
+        fields_map[config.orm_provider.get_model_name(model)] = names | set(extra)
+    return fields_map
+
+
+class RowEncoderParityTest(TestCase):
+    """The compiled encoder must produce exactly what the DRF path produces."""
+
+    def _serialize_both(self, queryset, fields_map):
+        model = queryset.model
+        with override_settings(STATEZERO_FAST_SERIALIZATION=False):
+            slow = config.serializer.serialize(
+                queryset.all(), model, 0, _copy(fields_map), many=True
+            )
+        with override_settings(STATEZERO_FAST_SERIALIZATION=True):
+            fast = config.serializer.serialize(
+                queryset.all(), model, 0, _copy(fields_map), many=True
+            )
+        return slow, fast
+
+    def test_orders_items_and_products(self):
+        category = ProductCategory.objects.create(name="Tools")
+        product = Product.objects.create(
+            name="Hammer", description="Heavy", price=Decimal("9.50"), category=category
+        )
+        order = Order.objects.create(
+            order_number="ORD-1", customer_name="Ann", customer_email="a@example.com",
+            total=Decimal("19.00"),
+        )
+        OrderItem.objects.create(order=order, product=product, quantity=2, price=Decimal("9.50"))
+
+        fields_map = _fields_map(
+            (Order, {"items"}),
+            (OrderItem, {"subtotal"}),
+            (Product, {"price_with_tax", "display_name"}),
+        )
+        slow, fast = self._serialize_both(Order.objects.all(), fields_map)
+        self.assertEqual(fast, slow)
+        self.assertEqual(set(fast["included"]), {"django_app.order", "django_app.orderitem", "django_app.product"})
+
+    def test_scalar_types_and_m2m(self):
+        level3 = DeepModelLevel3.objects.create(name="L3")
+        level2 = DeepModelLevel2.objects.create(name="L2", level3=level3)
+        level1 = DeepModelLevel1.objects.create(name="L1", level2=level2)
+        comprehensive = ComprehensiveModel.objects.create(
+            char_field="c", text_field="t", int_field=3, decimal_field=Decimal("1.25"),
+            json_field={"a": [1, 2]}, related=level1,
+        )
+        level1.comprehensive_models.add(comprehensive)
+
+        fields_map = _fields_map((DeepModelLevel1, ()), (ComprehensiveModel, ()))
+        slow, fast = self._serialize_both(DeepModelLevel1.objects.all(), fields_map)
+        self.assertEqual(fast, slow)
+        level1_row = fast["included"]["django_app.deepmodellevel1"][level1.pk]
+        self.assertEqual(level1_row["comprehensive_models"], [comprehensive.pk])
+
+    def test_dates_and_nulls(self):
+        plan = RatePlan.objects.create(name="Standard")
+        DailyRate.objects.create(rate_plan=plan, date="2024-01-02", price=None)
+        DailyRate.objects.create(rate_plan=plan, date="2024-01-03", price=Decimal("80.00"))
+
+        slow, fast = self._serialize_both(DailyRate.objects.all(), _fields_map((DailyRate, ())))
+        self.assertEqual(fast, slow)
+
+    def test_datetimes_follow_active_timezone(self):
+        Order.objects.create(
+            order_number="ORD-2", customer_name="Bo", customer_email="b@example.com",
+            total=Decimal("1.00"),
+        )
+        fields_map = _fields_map((Order, ()))
+        with timezone.override("Europe/Paris"):
+            slow, fast = self._serialize_both(Order.objects.all(), fields_map)
+        self.assertEqual(fast, slow)
+        _, utc = self._serialize_both(Order.objects.all(), fields_map)
+        self.assertNotEqual(utc, fast)
+
+
+class RowEncoderCompileTest(TestCase):
+    def test_encoder_is_compiled_once_per_serializer_class(self):
+        model_name = config.orm_provider.get_model_name(DailyRate)
+        with fields_map_context({model_name: {"id", "date", "price"}}):
+            serializer_class = DynamicModelSerializer.for_model(DailyRate)
+            encoder = get_row_encoder(serializer_class)
+            self.assertIs(get_row_encoder(serializer_class), encoder)
+
+        # repr needs the instance, so values() rows are not supported
+        self.assertFalse(encoder.supports_rows)
+        self.assertEqual([name for name, _ in encoder.plan], ["id", "repr", "date", "price"])
+
+    def test_decimal_converter_matches_drf(self):
+        fields = [
+            serializers.DecimalField(max_digits=10, decimal_places=2),
+            serializers.DecimalField(max_digits=10, decimal_places=2, coerce_to_string=False),
+            serializers.DecimalField(max_digits=5, decimal_places=3, normalize_output=True),
+            serializers.DecimalField(max_digits=None, decimal_places=None),
+            serializers.DecimalField(max_digits=6, decimal_places=1, rounding="ROUND_DOWN"),
+        ]
+        values = [Decimal("1.005"), Decimal("12.5"), Decimal("-0.10"), 3, 2.25]
+        for field in fields:
+            convert = _scalar_converter(field, None)
+            self.assertIsNotNone(convert)
+            for value in values:
+                with self.subTest(field=repr(field), value=value):
+                    self.assertEqual(convert(value), field.to_representation(value))
+                    self.assertIs(type(convert(value)), type(field.to_representation(value)))
+
+        localized = serializers.DecimalField(max_digits=10, decimal_places=2, localize=True)
+        self.assertIsNone(_scalar_converter(localized, None))
+
+
+def _copy(fields_map):
+    return {key: set(value) for key, value in fields_map.items()}
@@ -0,0 +1,59 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from statezero.adaptors.django.config import config
+from statezero.adaptors.django import serializers
+from statezero.adaptors.django.serializers import (DynamicModelSerializer,
+                                                   fields_map_context)
+from tests.django_app.models import DummyModel, DummyRelatedModel
+
+
+class SerializerClassCacheTest(TestCase):
+    def setUp(self):
+        self.model_name = config.orm_provider.get_model_name(DummyModel)
+        related = DummyRelatedModel.objects.create(name="Related")
+        self.instance = DummyModel.objects.create(name="One", value=1, related=related)
+
+    def _serializer_class(self, fields):
+        with fields_map_context({self.model_name: set(fields)}):
+            return DynamicModelSerializer.for_model(DummyModel)
+
+    def test_same_fields_reuse_class(self):
+        first = self._serializer_class({"id", "name"})
+        self.assertIs(self._serializer_class({"name", "id"}), first)
+
+    def test_different_fields_build_new_class(self):
+        narrow = self._serializer_class({"id", "name"})
+        wide = self._serializer_class({"id", "name", "value", "related"})
+        self.assertIsNot(narrow, wide)
+        self.assertIn("related", wide._declared_fields)
+        self.assertNotIn("related", narrow._declared_fields)
+
+    def test_cached_class_serializes_like_a_fresh_one(self):
+        fields = {"id", "name", "value", "related"}
+        with fields_map_context({self.model_name: set(fields)}):
+            serializer_class = DynamicModelSerializer.for_model(DummyModel)
+            first = serializer_class(self.instance).data
+            again = DynamicModelSerializer.for_model(DummyModel)(self.instance).data
+            fresh = DynamicModelSerializer._build_for_model(DummyModel, set(fields))(
+                self.instance
+            ).data
+
+        self.assertEqual(first, again)
+        self.assertEqual(first, fresh)
+        self.assertEqual(first["related"], self.instance.related_id)
+
+    def test_fields_are_not_shared_between_instances(self):
+        serializer_class = self._serializer_class({"id", "name"})
+        with fields_map_context({self.model_name: {"id", "name"}}):
+            first = serializer_class(self.instance)
+            second = serializer_class(self.instance)
+            self.assertIsNot(first.fields["name"], second.fields["name"])
+            self.assertIs(first.fields["name"].parent, first)
+
+    def test_cache_size_is_read_on_first_use(self):
+        with mock.patch.object(serializers, "_serializer_classes", None):
+            with override_settings(STATEZERO_SERIALIZER_CACHE_SIZE=0):
+                first = self._serializer_class({"id", "name"})
+                self.assertIsNot(self._serializer_class({"id", "name"}), first)
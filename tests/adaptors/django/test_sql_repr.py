@@ -0,0 +1,91 @@
+from unittest import mock
+
+from django.db.models import Value
+from django.db.models.functions import Concat
+from django.test import TestCase
+
+from statezero.adaptors.django.config import config, registry
+from statezero.adaptors.django.helpers import instance_repr
+from statezero.adaptors.django.query_optimizer import clear_optimization_plan_cache
+from statezero.adaptors.django.serializers import DRFDynamicSerializer
+from statezero.adaptors.django.values_serializer import ValuesReadSerializer
+from tests.django_app.models import DummyModel, DummyRelatedModel
+
+
+def _fields_map():
+    return {
+        config.orm_provider.get_model_name(DummyModel): {"id", "name", "value", "related"},
+        config.orm_provider.get_model_name(DummyRelatedModel): {"id", "name"},
+        "requested-fields::": {"id", "name", "value", "related__id", "related__name"},
+    }
+
+
+class SQLReprTest(TestCase):
+    def setUp(self):
+        self.dummy_config = registry.get_config(DummyModel)
+        self.related_config = registry.get_config(DummyRelatedModel)
+        self.dummy_config.repr_expression = Concat(Value("DummyModel "), "name")
+        self.related_config.repr_expression = Concat(Value("Related: "), "name")
+        self.related_config.repr_image = "name"
+        clear_optimization_plan_cache()
+
+        related = DummyRelatedModel.objects.create(name="R")
+        for index in range(3):
+            DummyModel.objects.create(name=f"D{index}", value=index, related=related)
+
+    def tearDown(self):
+        for model_config in (self.dummy_config, self.related_config):
+            model_config.repr_expression = None
+            model_config.repr_image = None
+        clear_optimization_plan_cache()
+
+    def _serialize(self, serializer):
+        return serializer.serialize(
+            DummyModel.objects.order_by("id"), DummyModel, 0, _fields_map(), many=True
+        )
+
+    def _reprs(self, result):
+        return {
+            model_name: {pk: row.get("repr") for pk, row in rows.items()}
+            for model_name, rows in result["included"].items()
+        }
+
+    def test_repr_is_read_from_sql(self):
+        expected = {
+            "django_app.dummymodel": {
+                instance.pk: {"str": str(instance), "img": instance.__img__()}
+                for instance in DummyModel.objects.all()
+            },
+            "django_app.dummyrelatedmodel": {
+                instance.pk: {"str": str(instance), "img": "R"}
+                for instance in DummyRelatedModel.objects.all()
+            },
+        }
+
+        with mock.patch.object(DummyModel, "__str__", side_effect=AssertionError), \
+                mock.patch.object(DummyRelatedModel, "__str__", side_effect=AssertionError):
+            # Root query plus one prefetch for the related model's annotated repr
+            with self.assertNumQueries(2):
+                result = self._serialize(DRFDynamicSerializer())
+        self.assertEqual(self._reprs(result), expected)
+
+    def test_values_engine_reads_repr_from_rows(self):
+        expected = self._reprs(self._serialize(DRFDynamicSerializer()))
+        # DummyModel keeps __img__ in Python, so it stays on the instance path
+        self.dummy_config.repr_expression = None
+        self.dummy_config.include_repr = False
+        try:
+            with mock.patch.object(DummyRelatedModel, "from_db", side_effect=AssertionError):
+                result = self._serialize(ValuesReadSerializer())
+        finally:
+            self.dummy_config.include_repr = True
+        self.assertEqual(
+            self._reprs(result)["django_app.dummyrelatedmodel"],
+            expected["django_app.dummyrelatedmodel"],
+        )
+
+    def test_instances_without_annotations_use_python_repr(self):
+        instance = DummyRelatedModel.objects.get()
+        self.assertEqual(
+            instance_repr(instance), {"str": "Related: R", "img": "/img/related/R.png"}
+        )
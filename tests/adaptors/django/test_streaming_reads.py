@@ -0,0 +1,177 @@
+"""
+Tests for streaming reads, which send a read as NDJSON frames serialized one
+chunk at a time.
+"""
+import json
+from contextlib import contextmanager
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from statezero.adaptors.django.config import config
+from statezero.adaptors.django.serializers import DRFDynamicSerializer
+from statezero.client.runtime_template import Manager, ValidationError, configure
+from statezero.client.testing import DjangoTestTransport
+from statezero.core.permission_resolver import _resolver_var
+from tests.django_app.models import DummyModel, DummyRelatedModel
+
+# A bare manager: declaring another Model subclass for django_app.dummymodel
+# would replace the client class other test modules registered for it
+dummy_models = Manager("django_app.dummymodel")
+
+
+class StreamingReadTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            username="stream", password="password", email="stream@test.com"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.related = DummyRelatedModel.objects.create(name="Related")
+        for value in range(5):
+            DummyModel.objects.create(name=f"Row {value}", value=value, related=self.related)
+        self.url = reverse("statezero:model_view", args=["django_app.DummyModel"])
+
+    def _stream(self, serializer_options, query=None):
+        response = self.client.post(
+            self.url,
+            data={
+                "ast": {
+                    "query": {"type": "read", "orderBy": ["value"], **(query or {})},
+                    "serializerOptions": serializer_options,
+                }
+            },
+            format="json",
+        )
+        self.assertTrue(response.streaming)
+        content = b"".join(response.streaming_content).decode()
+        return response, content
+
+    def test_frames_cover_every_row_in_chunks(self):
+        response, content = self._stream(
+            {"stream": True, "chunk_size": 2, "fields": ["name", "value", "related__name"]}
+        )
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        frames = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(frames[0]["frame"], "metadata")
+        self.assertEqual(frames[0]["metadata"]["chunk_size"], 2)
+        self.assertEqual(frames[-1], {"frame": "end", "count": 5})
+
+        chunks = [frame["data"] for frame in frames if frame["frame"] == "chunk"]
+        self.assertEqual([len(chunk["data"]) for chunk in chunks], [2, 2, 1])
+        ordered = list(DummyModel.objects.order_by("value").values_list("pk", flat=True))
+        self.assertEqual([pk for chunk in chunks for pk in chunk["data"]], ordered)
+        # Related objects are included with every chunk that references them
+        for chunk in chunks:
+            self.assertIn(str(self.related.pk), chunk["included"]["django_app.dummyrelatedmodel"])
+
+    @override_settings(STATEZERO_STREAM_TIMEOUT_MS=1234)
+    def test_chunks_are_serialized_inside_the_stream_scope(self):
+        timeouts, resolvers = [], []
+        original_timeout = config.context_manager
+        original_serialize = DRFDynamicSerializer.serialize
+
+        @contextmanager
+        def recording_timeout(timeout_ms):
+            timeouts.append(timeout_ms)
+            with original_timeout(timeout_ms):
+                yield
+
+        def recording_serialize(serializer, *args, **kwargs):
+            resolvers.append(_resolver_var.get())
+            return original_serialize(serializer, *args, **kwargs)
+
+        with mock.patch.object(config, "context_manager", recording_timeout):
+            response = self.client.post(
+                self.url,
+                data={
+                    "ast": {
+                        "query": {"type": "read", "orderBy": ["value"]},
+                        "serializerOptions": {"stream": True, "chunk_size": 2},
+                    }
+                },
+                format="json",
+            )
+            timeouts.clear()
+            with mock.patch.object(DRFDynamicSerializer, "serialize", recording_serialize):
+                b"".join(response.streaming_content)
+
+        self.assertEqual(timeouts, [1234])
+        self.assertEqual(len(resolvers), 3)
+        self.assertTrue(all(resolver is not None for resolver in resolvers))
+
+    def test_stream_matches_regular_read(self):
+        _, content = self._stream({"stream": True, "chunk_size": 10})
+        chunk = json.loads(content.splitlines()[1])["data"]
+
+        regular = self.client.post(
+            self.url, data={"ast": {"query": {"type": "read", "orderBy": ["value"]}}}, format="json"
+        )
+        self.assertEqual(regular.status_code, 200, regular.data)
+        self.assertEqual(json.loads(json.dumps(regular.data["data"])), chunk)
+
+    def test_offset_and_limit_apply(self):
+        _, content = self._stream({"stream": True, "chunk_size": 2, "offset": 1, "limit": 3})
+        frames = [json.loads(line) for line in content.splitlines()]
+        values = [
+            row["value"]
+            for frame in frames
+            if frame["frame"] == "chunk"
+            for row in frame["data"]["included"]["django_app.dummymodel"].values()
+        ]
+        self.assertEqual(sorted(values), [1, 2, 3])
+
+    @override_settings(STATEZERO_STREAM_CHUNK_SIZE=2)
+    def test_chunk_size_is_capped(self):
+        _, content = self._stream({"stream": True, "chunk_size": 100})
+        self.assertEqual(json.loads(content.splitlines()[0])["metadata"]["chunk_size"], 2)
+
+    def test_json_seq_format(self):
+        response, content = self._stream({"stream": "json-seq"})
+        self.assertEqual(response["Content-Type"], "application/json-seq")
+        records = [record for record in content.split("\x1e") if record]
+        self.assertEqual(json.loads(records[-1])["frame"], "end")
+
+    def test_unknown_format_is_rejected(self):
+        response = self.client.post(
+            self.url,
+            data={"ast": {"query": {"type": "read"}, "serializerOptions": {"stream": "csv"}}},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_streams_are_rejected_in_batches(self):
+        response = self.client.post(
+            reverse("statezero:batch"),
+            data={
+                "queries": [
+                    {
+                        "model_name": "django_app.DummyModel",
+                        "ast": {"query": {"type": "read"}, "serializerOptions": {"stream": True}},
+                    }
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class StreamingClientTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            username="stream_client", password="password", email="client@test.com"
+        )
+        configure(transport=DjangoTestTransport(user=self.user))
+        for value in range(5):
+            DummyModel.objects.create(name=f"Row {value}", value=value)
+
+    def test_iterator_yields_every_row(self):
+        rows = list(dummy_models.order_by("value").iterator(chunk_size=2))
+        self.assertEqual([row.value for row in rows], [0, 1, 2, 3, 4])
+
+    def test_iterator_raises_request_errors(self):
+        with self.assertRaises(ValidationError):
+            list(dummy_models.all().iterator(chunk_size=0))
@@ -0,0 +1,133 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.test import TestCase
+
+from statezero.adaptors.django.config import config, registry
+from statezero.adaptors.django.serializers import DRFDynamicSerializer
+from statezero.adaptors.django.values_serializer import ValuesReadSerializer
+from tests.django_app.models import (ComprehensiveModel, DeepModelLevel1,
+                                     DeepModelLevel2, DeepModelLevel3, Order,
+                                     OrderItem, Product, ProductCategory)
+
+DEEP_MODELS = (DeepModelLevel1, DeepModelLevel2, DeepModelLevel3, ComprehensiveModel)
+
+
+def _fields_map(*models):
+    fields_map = {}
+    for model in models:
+        names = {field.name for field in model._meta.concrete_fields}
+        names |= {field.name for field in model._meta.many_to_many}
+        fields_map[config.orm_provider.get_model_name(model)] = names
+    return fields_map
+
+
+def _copy(fields_map):
+    return {key: set(value) for key, value in fields_map.items()}
+
+
+class ValuesReadSerializerTest(TestCase):
+    def setUp(self):
+        self.configs = [registry.get_config(model) for model in DEEP_MODELS]
+        for model_config in self.configs:
+            model_config.include_repr = False
+
+        level3 = DeepModelLevel3.objects.create(name="L3")
+        level2 = DeepModelLevel2.objects.create(name="L2", level3=level3)
+        self.level1 = DeepModelLevel1.objects.create(name="L1", level2=level2)
+        DeepModelLevel1.objects.create(name="Other", level2=level2)
+        for index in range(3):
+            comprehensive = ComprehensiveModel.objects.create(
+                char_field=f"c{index}", text_field="t", int_field=index,
+                decimal_field=Decimal("1.25"), json_field={"i": index}, related=self.level1,
+            )
+            self.level1.comprehensive_models.add(comprehensive)
+
+        self.fields_map = _fields_map(*DEEP_MODELS)
+        # djmoney fields need model instances; they are covered by the fallback tests
+        self.fields_map["django_app.comprehensivemodel"] = {
+            name for name in self.fields_map["django_app.comprehensivemodel"]
+            if "money" not in name
+        }
+
+    def tearDown(self):
+        for model_config in self.configs:
+            model_config.include_repr = True
+
+    def _serialize(self, serializer, queryset, fields_map=None):
+        return serializer.serialize(
+            queryset, queryset.model, 0, _copy(fields_map or self.fields_map), many=True
+        )
+
+    def test_matches_instance_serializer(self):
+        queryset = DeepModelLevel1.objects.order_by("name")
+        expected = self._serialize(DRFDynamicSerializer(), queryset)
+        actual = self._serialize(ValuesReadSerializer(), queryset)
+
+        self.assertEqual(actual, expected)
+        self.assertEqual(
+            set(actual["included"]),
+            {"django_app.deepmodellevel1", "django_app.deepmodellevel2",
+             "django_app.deepmodellevel3", "django_app.comprehensivemodel"},
+        )
+        row = actual["included"]["django_app.deepmodellevel1"][self.level1.pk]
+        self.assertNotIn("repr", row)
+        self.assertEqual(len(row["comprehensive_models"]), 3)
+
+    def test_sliced_querysets(self):
+        queryset = DeepModelLevel1.objects.order_by("-name")[1:2]
+        expected = self._serialize(DRFDynamicSerializer(), queryset)
+        actual = self._serialize(ValuesReadSerializer(), queryset)
+        self.assertEqual(actual, expected)
+        self.assertEqual(actual["data"], [self.level1.pk])
+
+    def test_related_rows_fetched_in_batches(self):
+        serializer = ValuesReadSerializer()
+        queryset = ComprehensiveModel.objects.order_by("pk")
+        expected = self._serialize(DRFDynamicSerializer(), queryset)
+        with self.settings(STATEZERO_PK_IN_BATCH_SIZE=1):
+            actual = self._serialize(serializer, queryset)
+        self.assertEqual(actual, expected)
+
+    def test_builds_no_model_instances(self):
+        with mock.patch.object(
+            DeepModelLevel1, "from_db", side_effect=AssertionError("instance built")
+        ):
+            self._serialize(ValuesReadSerializer(), DeepModelLevel1.objects.all())
+
+    def test_falls_back_when_repr_is_needed(self):
+        self.configs[0].include_repr = True
+        serializer = ValuesReadSerializer()
+        with mock.patch.object(serializer, "_serialize_values") as values_path:
+            result = self._serialize(serializer, DeepModelLevel1.objects.all())
+        values_path.assert_not_called()
+        row = result["included"]["django_app.deepmodellevel1"][self.level1.pk]
+        self.assertIn("repr", row)
+
+    def test_falls_back_for_instance_only_fields(self):
+        serializer = ValuesReadSerializer()
+        with mock.patch.object(serializer, "_serialize_values") as values_path:
+            self._serialize(
+                serializer, DeepModelLevel1.objects.all(), _fields_map(*DEEP_MODELS)
+            )
+        values_path.assert_not_called()
+
+
+class ValuesReadSerializerFallbackTest(TestCase):
+    def test_additional_fields_use_instances(self):
+        category = ProductCategory.objects.create(name="Tools")
+        product = Product.objects.create(
+            name="Hammer", description="Heavy", price=Decimal("9.50"), category=category
+        )
+        order = Order.objects.create(
+            order_number="ORD-1", customer_name="Ann", customer_email="a@example.com",
+            total=Decimal("19.00"),
+        )
+        OrderItem.objects.create(order=order, product=product, quantity=2, price=Decimal("9.50"))
+        fields_map = _fields_map(Order, OrderItem)
+        fields_map["django_app.orderitem"].add("subtotal")
+
+        serializer = ValuesReadSerializer()
+        with mock.patch.object(serializer, "_serialize_values") as values_path:
+            serializer.serialize(Order.objects.all(), Order, 0, _copy(fields_map), many=True)
+        values_path.assert_not_called()
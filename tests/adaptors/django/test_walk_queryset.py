@@ -455,5 +455,36 @@ class ModelCollectorTests(TestCase):
         
         print("\n==== END DEBUG TEST ====")
 
+    def test_shared_related_instances_collected_once_in_order(self):
+        """Related rows reached from many parents are collected once, depth-first."""
+        extra = [
+            DeepModelLevel1.objects.create(name=f"fan_{i}", level2=self.level2_1)
+            for i in range(50)
+        ]
+        fields_map = {
+            self.MODEL_NAMES[DeepModelLevel1]: {"name", "level2"},
+            self.MODEL_NAMES[DeepModelLevel2]: {"name", "level3"},
+            self.MODEL_NAMES[DeepModelLevel3]: {"name"},
+        }
+        queryset = DeepModelLevel1.objects.select_related("level2__level3").order_by("pk")
+
+        collected = collect_from_queryset(
+            queryset,
+            fields_map,
+            get_model_name=config.orm_provider.get_model_name,
+            get_model=config.orm_provider.get_model_by_name,
+        )
+
+        self.assertEqual(
+            [obj.pk for obj in collected[self.MODEL_NAMES[DeepModelLevel1]]],
+            [self.level1_1.pk, self.level1_2.pk] + [obj.pk for obj in extra],
+        )
+        self.assertEqual(
+            collected[self.MODEL_NAMES[DeepModelLevel2]], [self.level2_1, self.level2_2]
+        )
+        self.assertEqual(
+            collected[self.MODEL_NAMES[DeepModelLevel3]], [self.level3_1, self.level3_2]
+        )
+
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
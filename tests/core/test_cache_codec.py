@@ -0,0 +1,83 @@
+"""
+Tests for query cache value codecs.
+"""
+import uuid
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+
+from statezero.core.cache_codec import (
+    CODEC_VERSION,
+    NONE,
+    PICKLE,
+    ZLIB,
+    BinaryCacheCodec,
+    PickleCacheCodec,
+)
+
+
+class BinaryCacheCodecTest(SimpleTestCase):
+    def setUp(self):
+        rows = {
+            i: {
+                "id": i,
+                "name": f"Customer {i}",
+                "email": f"customer{i}@example.com",
+                "status": "active",
+                "created_at": "2024-01-01T00:00:00Z",
+            }
+            for i in range(200)
+        }
+        self.value = {
+            "data": list(rows),
+            "included": {"app.model": rows},
+            "metadata": {"read": True},
+        }
+
+    def test_roundtrip(self):
+        codec = BinaryCacheCodec()
+        self.assertEqual(codec.decode(codec.encode(self.value)), self.value)
+
+    def test_header_has_version_and_format(self):
+        codec = BinaryCacheCodec(serializer="pickle", compressor="zlib", threshold=10)
+        encoded = codec.encode(self.value)
+
+        self.assertEqual(encoded[0], CODEC_VERSION)
+        self.assertEqual(encoded[1], PICKLE | (ZLIB << 4))
+
+    def test_small_payloads_are_not_compressed(self):
+        codec = BinaryCacheCodec(serializer="pickle", compressor="zlib", threshold=10_000)
+        encoded = codec.encode({"data": 1})
+
+        self.assertEqual(encoded[1] >> 4, NONE)
+        self.assertEqual(codec.decode(encoded), {"data": 1})
+
+    def test_compression_shrinks_wide_payloads(self):
+        plain = PickleCacheCodec().encode(self.value)
+        compressed = BinaryCacheCodec(compressor="zlib").encode(self.value)
+
+        self.assertLess(len(compressed) * 3, len(plain))
+
+    def test_unknown_version_decodes_as_miss(self):
+        codec = BinaryCacheCodec()
+        encoded = bytearray(codec.encode(self.value))
+        encoded[0] = CODEC_VERSION + 1
+
+        self.assertIsNone(codec.decode(bytes(encoded)))
+
+    def test_non_bytes_decode_as_miss(self):
+        # e.g. an entry written before the codec was enabled
+        self.assertIsNone(BinaryCacheCodec().decode({"data": []}))
+
+    def test_exact_types_preserved(self):
+        value = {"amount": Decimal("1.50"), "id": uuid.uuid4()}
+        codec = BinaryCacheCodec()
+
+        self.assertEqual(codec.decode(codec.encode(value)), value)
+
+    def test_codecs_read_each_others_pickle_payloads(self):
+        encoded = PickleCacheCodec().encode(self.value)
+        self.assertEqual(
+            BinaryCacheCodec(serializer="pickle", compressor="none").decode(encoded),
+            self.value,
+        )
@@ -0,0 +1,108 @@
+from collections import Counter
+from types import SimpleNamespace
+
+from django.test import TestCase, override_settings
+
+from statezero.adaptors.django.config import config, registry
+from statezero.adaptors.django.permissions import AllowAllPermission
+from statezero.core.ast_parser import ASTParser, clear_field_map_cache
+from statezero.core.permission_resolver import permission_resolution
+from tests.django_app.models import DummyModel
+
+
+class RolePermission(AllowAllPermission):
+    """Field visibility depends only on the user's role, which it fingerprints."""
+
+    calls = Counter()
+
+    def visible_fields(self, request, model):
+        type(self).calls["visible_fields"] += 1
+        if request.user.role == "admin":
+            return "__all__"
+        return {"id", "name"}
+
+    def create_fields(self, request, model):
+        type(self).calls["create_fields"] += 1
+        return "__all__"
+
+    def cache_fingerprint(self, request, model):
+        return request.user.role
+
+
+class UnfingerprintedRolePermission(RolePermission):
+    def cache_fingerprint(self, request, model):
+        return None
+
+
+class FieldMapCacheTest(TestCase):
+    def setUp(self):
+        self.model_config = registry.get_config(DummyModel)
+        self.original_permissions = self.model_config._permissions
+        self.model_config._permissions = [RolePermission]
+        self.model_name = config.orm_provider.get_model_name(DummyModel)
+        RolePermission.calls = Counter()
+        clear_field_map_cache()
+
+    def tearDown(self):
+        self.model_config._permissions = self.original_permissions
+        clear_field_map_cache()
+
+    def _parse(self, role):
+        request = SimpleNamespace(user=SimpleNamespace(role=role, pk=None))
+        with permission_resolution(registry, request):
+            return ASTParser(
+                engine=config.orm_provider,
+                serializer=config.serializer,
+                model=DummyModel,
+                config=config,
+                registry=registry,
+                base_queryset=DummyModel.objects.all(),
+                serializer_options={},
+                request=request,
+            )
+
+    def test_write_maps_are_built_lazily(self):
+        parser = self._parse("user")
+        self.assertEqual(RolePermission.calls["create_fields"], 0)
+        self.assertNotIn("create_fields_map", parser.serializer_options)
+
+        with permission_resolution(registry, parser.request):
+            create_map = parser.create_fields_map
+        self.assertIn("value", create_map[self.model_name])
+        self.assertEqual(RolePermission.calls["create_fields"], 1)
+        self.assertIs(parser.serializer_options["create_fields_map"], create_map)
+
+    def test_field_maps_are_shared_between_requests_with_same_fingerprint(self):
+        first = self._parse("user").read_fields_map
+        self.assertEqual(RolePermission.calls["visible_fields"], 1)
+
+        second = self._parse("user").read_fields_map
+        self.assertEqual(second, first)
+        self.assertEqual(RolePermission.calls["visible_fields"], 1)
+
+        # A different role is computed separately and gets its own fields
+        admin = self._parse("admin").read_fields_map
+        self.assertEqual(RolePermission.calls["visible_fields"], 2)
+        self.assertEqual(first[self.model_name], {"id", "name"})
+        self.assertIn("value", admin[self.model_name])
+
+        # Both variants stay cached
+        self._parse("user")
+        self._parse("admin")
+        self.assertEqual(RolePermission.calls["visible_fields"], 2)
+
+    def test_cached_maps_are_not_shared_by_reference(self):
+        self._parse("user").read_fields_map[self.model_name].add("value")
+        self.assertEqual(self._parse("user").read_fields_map[self.model_name], {"id", "name"})
+
+    def test_permissions_without_fingerprint_are_not_shared(self):
+        self.model_config._permissions = [UnfingerprintedRolePermission]
+        self._parse("user")
+        self._parse("user")
+        self.assertEqual(RolePermission.calls["visible_fields"], 2)
+
+    @override_settings(STATEZERO_FIELD_MAP_CACHE_SIZE=0)
+    def test_cache_can_be_disabled(self):
+        self._parse("user")
+        self._parse("user")
+        self.assertEqual(RolePermission.calls["visible_fields"], 2)
@@ -0,0 +1,61 @@
+import networkx as nx
+from django.test import TestCase
+
+from statezero.adaptors.django.config import config, registry
+from statezero.core.classes import FieldNode, ModelNode
+from statezero.core.model_graph import ModelGraph
+from tests.django_app.models import DummyModel, Order
+
+
+class ModelGraphTest(TestCase):
+    def setUp(self):
+        self.adapter = config.orm_provider
+
+    def _digraph_for_registry(self):
+        graph = nx.DiGraph()
+        for model in registry._models_config.keys():
+            self.adapter.build_model_graph(model, graph)
+        return graph
+
+    def test_frozen_graph_matches_networkx_graph(self):
+        digraph = self._digraph_for_registry()
+        frozen = self.adapter.build_model_graph(DummyModel)
+
+        self.assertIsInstance(frozen, ModelGraph)
+        self.assertEqual(set(frozen.nodes), set(digraph.nodes))
+        for node in digraph.nodes:
+            self.assertEqual(list(frozen.successors(node)), list(digraph.successors(node)))
+            self.assertEqual(frozen.nodes[node].get("data"), digraph.nodes[node].get("data"))
+
+    def test_graph_is_shared_between_calls(self):
+        first = self.adapter.build_model_graph(DummyModel)
+        self.assertIs(self.adapter.build_model_graph(DummyModel), first)
+        self.assertIs(self.adapter.build_model_graph(Order), first)
+
+    def test_field_lookups(self):
+        graph = self.adapter.build_model_graph(DummyModel)
+        model_name = self.adapter.get_model_name(DummyModel)
+
+        self.assertIsInstance(graph.nodes[model_name].get("data"), ModelNode)
+        related = graph.field(model_name, "related")
+        self.assertIsInstance(related, FieldNode)
+        self.assertTrue(related.is_relation)
+        self.assertEqual(related.related_model, "django_app.dummyrelatedmodel")
+        self.assertIsNone(graph.field(model_name, "does_not_exist"))
+        self.assertEqual(
+            [field.field_name for field in graph.fields(model_name)],
+            [target.split("::")[-1] for target in graph.successors(model_name)],
+        )
+
+    def test_reverse_relations_only_when_declared(self):
+        graph = self.adapter.build_model_graph(Order)
+        order_name = self.adapter.get_model_name(Order)
+        # Order declares its reverse "items" relation in its config fields
+        self.assertIsNotNone(graph.field(order_name, "items"))
+
+    def test_graph_is_read_only(self):
+        graph = self.adapter.build_model_graph(DummyModel)
+        with self.assertRaises(TypeError):
+            graph._data["new"] = None
+        with self.assertRaises(AttributeError):
+            graph.extra = True
@@ -0,0 +1,140 @@
+from collections import Counter
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from statezero.adaptors.django.config import registry
+from statezero.adaptors.django.permissions import AllowAllPermission
+from statezero.core.config import ModelConfig
+from statezero.core.permission_resolver import (PermissionResolver,
+                                                get_permission_resolver,
+                                                permission_resolution)
+from statezero.core.types import ActionType
+from tests.django_app.models import DummyModel, DummyRelatedModel
+
+
+class CountingPermission(AllowAllPermission):
+    """AllowAllPermission that records how often each method is called."""
+
+    calls = Counter()
+    instances = 0
+
+    def __init__(self):
+        type(self).instances += 1
+
+    def allowed_actions(self, request, model):
+        type(self).calls["allowed_actions"] += 1
+        return super().allowed_actions(request, model)
+
+    def visible_fields(self, request, model):
+        type(self).calls["visible_fields"] += 1
+        return {"name", "value"}
+
+    @classmethod
+    def reset(cls):
+        cls.calls = Counter()
+        cls.instances = 0
+
+
+class InvalidPermission(AllowAllPermission):
+    def visible_fields(self, request, model):
+        return None
+
+
+class PermissionResolverTest(TestCase):
+    def setUp(self):
+        self.config = registry.get_config(DummyModel)
+        self.original_permissions = self.config._permissions
+        self.config._permissions = [CountingPermission]
+        CountingPermission.reset()
+
+    def tearDown(self):
+        self.config._permissions = self.original_permissions
+
+    def test_instances_and_results_are_memoized(self):
+        request = object()
+        resolver = PermissionResolver(registry, request)
+
+        first = resolver.get_permissions(DummyModel)
+        self.assertIs(resolver.get_permissions(DummyModel)[0], first[0])
+        self.assertEqual(CountingPermission.instances, 1)
+
+        for _ in range(3):
+            resolver.allowed_actions(first[0], DummyModel)
+            resolver.visible_fields(first[0], DummyModel)
+            resolver.model_allowed_actions(DummyModel)
+        self.assertEqual(CountingPermission.calls["allowed_actions"], 1)
+        self.assertEqual(CountingPermission.calls["visible_fields"], 1)
+
+    def test_results_are_copies(self):
+        resolver = PermissionResolver(registry, object())
+        perm = resolver.get_permissions(DummyModel)[0]
+
+        fields = resolver.visible_fields(perm, DummyModel)
+        fields &= {"name"}
+        self.assertEqual(resolver.visible_fields(perm, DummyModel), {"name", "value"})
+
+        actions = resolver.model_allowed_actions(DummyModel)
+        actions.clear()
+        self.assertIn(ActionType.READ, resolver.model_allowed_actions(DummyModel))
+
+    def test_scope_is_bound_to_request(self):
+        request = object()
+        with permission_resolution(registry, request) as resolver:
+            self.assertIs(get_permission_resolver(registry, request), resolver)
+            with permission_resolution(registry, request) as nested:
+                self.assertIs(nested, resolver)
+            self.assertIsNot(get_permission_resolver(registry, object()), resolver)
+        self.assertIsNot(get_permission_resolver(registry, request), resolver)
+
+    def test_model_config_caches_resolved_classes(self):
+        config = ModelConfig(
+            DummyModel,
+            permissions=["statezero.adaptors.django.permissions.AllowAllPermission"],
+        )
+        self.assertIs(config.permissions[0], config.permissions[0])
+
+        config._permissions = [CountingPermission]
+        self.assertEqual(config.permissions[0].__name__, "ValidatedCountingPermission")
+
+    def test_invalid_return_types_are_rejected(self):
+        config = ModelConfig(DummyModel, permissions=[InvalidPermission])
+        perm = config.permissions[0]()
+        with self.assertRaises(TypeError):
+            perm.visible_fields(None, DummyModel)
+
+
+class PermissionResolverRequestTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="resolver", password="password")
+        self.client.force_authenticate(user=self.user)
+        related = DummyRelatedModel.objects.create(name="Related")
+        DummyModel.objects.create(name="One", value=1, related=related)
+
+        self.config = registry.get_config(DummyModel)
+        self.original_permissions = self.config._permissions
+        self.config._permissions = [CountingPermission]
+        CountingPermission.reset()
+
+    def tearDown(self):
+        self.config._permissions = self.original_permissions
+
+    def test_permissions_resolved_once_per_request(self):
+        url = reverse("statezero:model_view", args=["django_app.DummyModel"])
+        payload = {
+            "ast": {
+                "query": {
+                    "type": "read",
+                    "filter": {"type": "filter", "conditions": {"name": "One"}},
+                }
+            }
+        }
+        response = self.client.post(url, data=payload, format="json")
+        self.assertEqual(response.status_code, 200, response.data)
+
+        self.assertEqual(CountingPermission.instances, 1)
+        self.assertEqual(CountingPermission.calls["allowed_actions"], 1)
+        self.assertEqual(CountingPermission.calls["visible_fields"], 1)
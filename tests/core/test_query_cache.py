@@ -10,11 +10,22 @@ from django.core.cache import cache
 from django.test import TestCase, RequestFactory
 
 from statezero.core.context_storage import current_canonical_id
+from statezero.core.exceptions import NotFound, QueryTimeout
 from statezero.core.query_cache import (
     _get_cache_key,
+    _LocalCache,
     _get_sql_from_queryset,
+    _lead,
+    _store_error,
+    _store_result,
     cache_query_result,
     get_cached_query_result,
+    get_or_execute_query,
+    bump_model_generations,
+    get_model_generations,
+    get_query_cache_stats,
+    get_query_fingerprint,
+    reset_query_cache_stats,
 )
 
 
@@ -237,6 +248,551 @@ class TestCachingFunctions(TestCase):
         # Different transaction, so won't find it anyway
 
 
+class TestQueryFingerprint(TestCase):
+    """Test that the SQL is compiled once and reused across the cache API."""
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+        current_canonical_id.set(None)
+
+    def test_fingerprint_requires_canonical_id(self):
+        current_canonical_id.set(None)
+        assert get_query_fingerprint(User.objects.all()) is None
+
+    def test_fingerprint_matches_cache_key(self):
+        queryset = User.objects.filter(username="fp")
+        current_canonical_id.set("txn-fp-001")
+
+        fingerprint = get_query_fingerprint(queryset, "read")
+        sql, params = _get_sql_from_queryset(queryset)
+
+        assert fingerprint.key == _get_cache_key(sql, params, "txn-fp-001", "read")
+        assert fingerprint.compile_ms >= 0
+
+    def test_fingerprint_compiles_sql_once(self):
+        queryset = User.objects.filter(username="fp")
+        current_canonical_id.set("txn-fp-002")
+
+        with patch(
+            "statezero.core.query_cache._get_sql_from_queryset",
+            wraps=_get_sql_from_queryset,
+        ) as compile_mock:
+            fingerprint = get_query_fingerprint(queryset, "read")
+            assert get_cached_query_result(queryset, "read", fingerprint=fingerprint) is None
+            get_or_execute_query(queryset, lambda: {"data": []}, "read", fingerprint=fingerprint)
+            assert get_cached_query_result(queryset, "read", fingerprint=fingerprint) == {"data": []}
+
+        assert compile_mock.call_count == 1
+
+    def test_compile_time_recorded_in_telemetry(self):
+        from statezero.core.telemetry import clear_telemetry_context, create_telemetry_context
+
+        current_canonical_id.set("txn-fp-003")
+        ctx = create_telemetry_context(enabled=True)
+        try:
+            fingerprint = get_query_fingerprint(User.objects.all(), "read")
+            data = ctx.get_telemetry_data()
+        finally:
+            clear_telemetry_context()
+
+        assert data["cache"]["compile_details"][0]["cache_key"] == fingerprint.key
+        assert data["cache"]["compile_ms"] == fingerprint.compile_ms
+
+
+class TestGenerationKeying(TestCase):
+    """Test generation-scoped cache keys used when there is no canonical_id."""
+
+    def setUp(self):
+        cache.clear()
+        current_canonical_id.set(None)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_no_fingerprint_without_canonical_id_by_default(self):
+        from tests.django_app.models import DummyModel
+
+        assert get_query_fingerprint(DummyModel.objects.all()) is None
+
+    def test_fingerprint_includes_root_joined_and_extra_models(self):
+        from django.test import override_settings
+        from tests.django_app.models import DummyModel
+
+        queryset = DummyModel.objects.filter(related__name="x")
+        with override_settings(STATEZERO_QUERY_CACHE_GENERATIONS=True):
+            fingerprint = get_query_fingerprint(queryset, "read", models=["auth.user"])
+
+        assert fingerprint.txn_id.startswith("gen:")
+        assert set(dict(fingerprint.generations)) == {
+            "auth.user",
+            "django_app.dummymodel",
+            "django_app.dummyrelatedmodel",
+        }
+        assert get_model_generations(["auth.user"]) == (
+            ("auth.user", dict(fingerprint.generations)["auth.user"]),
+        )
+
+    def test_generation_lookup_is_timed_apart_from_compilation(self):
+        import time
+
+        from django.test import override_settings
+        from statezero.core.telemetry import clear_telemetry_context, create_telemetry_context
+        from tests.django_app.models import DummyModel
+
+        def slow_lookup(model_names):
+            time.sleep(0.05)
+            return get_model_generations(model_names)
+
+        ctx = create_telemetry_context(enabled=True)
+        try:
+            with override_settings(STATEZERO_QUERY_CACHE_GENERATIONS=True), patch(
+                "statezero.core.query_cache.get_model_generations", side_effect=slow_lookup
+            ):
+                fingerprint = get_query_fingerprint(DummyModel.objects.all(), "read")
+            data = ctx.get_telemetry_data()
+        finally:
+            clear_telemetry_context()
+
+        assert fingerprint.generation_ms >= 50
+        assert fingerprint.compile_ms < 50
+        assert data["cache"]["generation_ms"] == fingerprint.generation_ms
+        assert data["cache"]["compile_ms"] == fingerprint.compile_ms
+
+    def test_bump_moves_dependent_queries_to_new_key(self):
+        from django.test import override_settings
+        from tests.django_app.models import DummyModel
+
+        queryset = DummyModel.objects.filter(related__name="x")
+        with override_settings(STATEZERO_QUERY_CACHE_GENERATIONS=True):
+            before = get_query_fingerprint(queryset, "read")
+            with self.captureOnCommitCallbacks(execute=True):
+                bump_model_generations(["django_app.dummyrelatedmodel"])
+            after = get_query_fingerprint(queryset, "read")
+
+        assert before.key != after.key
+        assert dict(after.generations)["django_app.dummyrelatedmodel"] == (
+            dict(before.generations)["django_app.dummyrelatedmodel"] + 1
+        )
+
+    def test_evicted_counters_do_not_repeat_generations(self):
+        from django.test import override_settings
+        from tests.django_app.models import DummyModel
+
+        queryset = DummyModel.objects.all()
+        key = "statezero:gen:django_app.dummymodel"
+        seen = set()
+        with override_settings(STATEZERO_QUERY_CACHE_GENERATIONS=True):
+            for _ in range(3):
+                seen.add(get_query_fingerprint(queryset, "read").key)
+                with self.captureOnCommitCallbacks(execute=True):
+                    bump_model_generations(["django_app.dummymodel"])
+                seen.add(get_query_fingerprint(queryset, "read").key)
+                cache.delete(key)
+
+        assert len(seen) == 6
+
+    def test_model_events_bump_generation(self):
+        from django.test import override_settings
+        from tests.django_app.models import DummyModel
+
+        with override_settings(STATEZERO_QUERY_CACHE_GENERATIONS=True):
+            with self.captureOnCommitCallbacks(execute=True):
+                DummyModel.objects.create(name="gen", value=1)
+
+        assert dict(get_model_generations(["django_app.dummymodel"]))["django_app.dummymodel"] >= 1
+
+    def test_generation_keyed_result_is_reused(self):
+        from django.test import override_settings
+        from tests.django_app.models import DummyModel
+
+        queryset = DummyModel.objects.all()
+        compute = Mock(return_value={"data": [1]})
+        with override_settings(STATEZERO_QUERY_CACHE_GENERATIONS=True):
+            get_or_execute_query(queryset, compute, "read")
+            get_or_execute_query(queryset, compute, "read")
+
+        assert compute.call_count == 1
+
+
+class TestTwoTierCache(TestCase):
+    """Test the optional per-process L1 tier in front of the Django cache."""
+
+    def setUp(self):
+        cache.clear()
+        reset_query_cache_stats()
+
+    def tearDown(self):
+        cache.clear()
+        reset_query_cache_stats()
+        current_canonical_id.set(None)
+
+    def test_l1_disabled_by_default(self):
+        queryset = User.objects.filter(username="tier")
+        current_canonical_id.set("txn-tier-001")
+        cache_query_result(queryset, {"data": [1]})
+
+        assert get_cached_query_result(queryset) == {"data": [1]}
+        stats = get_query_cache_stats()
+        assert stats["l2"]["hits"] == 1
+        assert stats["l1"] == {"hits": 0, "misses": 0, "bytes": 0}
+
+    def test_l1_serves_repeat_hits_without_l2(self):
+        from django.test import override_settings
+
+        queryset = User.objects.filter(username="tier")
+        current_canonical_id.set("txn-tier-002")
+        with override_settings(STATEZERO_QUERY_CACHE_L1_MAX_BYTES=1024 * 1024):
+            cache_query_result(queryset, {"data": [1]})
+            with patch("statezero.core.query_cache.cache.get") as l2_get:
+                assert get_cached_query_result(queryset) == {"data": [1]}
+                l2_get.assert_not_called()
+
+            stats = get_query_cache_stats()
+        assert stats["l1"]["hits"] == 1
+        assert stats["l1"]["bytes"] > 0
+
+    def test_l1_populated_from_l2_hit(self):
+        from django.test import override_settings
+
+        queryset = User.objects.filter(username="tier")
+        current_canonical_id.set("txn-tier-003")
+        cache_query_result(queryset, {"data": [2]})
+
+        with override_settings(STATEZERO_QUERY_CACHE_L1_MAX_BYTES=1024 * 1024):
+            assert get_cached_query_result(queryset) == {"data": [2]}
+            assert get_cached_query_result(queryset) == {"data": [2]}
+            stats = get_query_cache_stats()
+
+        assert stats["l1"]["misses"] == 1
+        assert stats["l1"]["hits"] == 1
+        assert stats["l2"]["hits"] == 1
+
+    def test_l1_sized_from_l2_bytes(self):
+        from django.test import override_settings
+
+        queryset = User.objects.filter(username="tier")
+        current_canonical_id.set("txn-tier-004")
+        cache_query_result(queryset, {"data": [3]})
+        stored = cache.get(get_query_fingerprint(queryset).key)
+
+        with override_settings(STATEZERO_QUERY_CACHE_L1_MAX_BYTES=1024 * 1024):
+            with patch("statezero.core.query_cache._payload_size") as payload_size:
+                assert get_cached_query_result(queryset) == {"data": [3]}
+                payload_size.assert_not_called()
+            stats = get_query_cache_stats()
+
+        assert stats["l1"]["bytes"] == len(stored)
+
+    def test_lru_evicts_by_size(self):
+        local = _LocalCache(max_bytes=300, ttl=60)
+        local.set("a", "x" * 100)
+        local.set("b", "x" * 100)
+        local.get("a")
+        local.set("c", "x" * 100)
+
+        assert local.get("a") is not None
+        assert local.get("b") is None
+        assert local.get("c") is not None
+        assert local.size <= 300
+
+    def test_oversized_values_are_not_stored(self):
+        local = _LocalCache(max_bytes=50, ttl=60)
+        local.set("big", "x" * 100)
+        assert local.get("big") is None
+        assert local.size == 0
+
+    def test_entries_expire_after_ttl(self):
+        local = _LocalCache(max_bytes=1000, ttl=60)
+        with patch("statezero.core.query_cache.time.monotonic", return_value=0):
+            local.set("a", "value")
+        with patch("statezero.core.query_cache.time.monotonic", return_value=61):
+            assert local.get("a") is None
+        assert local.size == 0
+
+
+class TestCachePolicyStorage(TestCase):
+    """Test TTL and payload-size limits applied when storing results."""
+
+    def setUp(self):
+        cache.clear()
+        current_canonical_id.set("txn-policy-001")
+
+    def tearDown(self):
+        cache.clear()
+        current_canonical_id.set(None)
+
+    def test_ttl_is_passed_to_cache(self):
+        queryset = User.objects.filter(username="policy")
+        with patch("statezero.core.query_cache.cache.set") as cache_set:
+            get_or_execute_query(queryset, lambda: {"data": []}, "read", ttl=30)
+
+        timeouts = {c.args[0].rsplit(":", 1)[-1]: c.kwargs["timeout"] for c in cache_set.call_args_list}
+        fingerprint = get_query_fingerprint(queryset, "read")
+        assert cache_set.call_args_list[0].args[0] == fingerprint.key
+        assert cache_set.call_args_list[0].kwargs["timeout"] == 30
+        assert timeouts["pending"] == 10
+
+    def test_pending_key_points_at_main_key(self):
+        queryset = User.objects.filter(username="policy-pointer")
+        fingerprint = get_query_fingerprint(queryset, "read")
+
+        get_or_execute_query(queryset, lambda: {"data": [1]}, "read", fingerprint=fingerprint)
+
+        assert cache.get(f"{fingerprint.key}:pending") == fingerprint.key
+        assert isinstance(cache.get(fingerprint.key), bytes)
+
+    def test_codec_can_be_disabled(self):
+        from django.test import override_settings
+
+        queryset = User.objects.filter(username="policy-raw")
+        with override_settings(STATEZERO_QUERY_CACHE_CODEC=None):
+            fingerprint = get_query_fingerprint(queryset, "read")
+            get_or_execute_query(queryset, lambda: {"data": [1]}, "read", fingerprint=fingerprint)
+            assert cache.get(fingerprint.key) == {"data": [1]}
+            assert get_cached_query_result(queryset, "read") == {"data": [1]}
+
+    def test_oversized_payload_is_not_cached(self):
+        queryset = User.objects.filter(username="policy")
+        compute = Mock(return_value={"data": ["x" * 500]})
+
+        get_or_execute_query(queryset, compute, "read", max_payload_bytes=100)
+        get_or_execute_query(queryset, compute, "read", max_payload_bytes=100)
+
+        assert compute.call_count == 2
+
+    def test_remote_followers_receive_uncached_leader_result(self):
+        import threading
+        import time
+
+        queryset = User.objects.filter(username="policy-remote")
+        fingerprint = get_query_fingerprint(queryset, "read")
+        leader_result = {"data": ["x" * 500]}
+        cache.add(f"{fingerprint.key}:lock", "processing")
+
+        # Followers in other processes go straight to the cross-process wait
+        compute = Mock(return_value={"data": ["mine"]})
+        results = []
+        followers = [
+            threading.Thread(
+                target=lambda: results.append(_lead(fingerprint.key, compute, 5, 60, 100))
+            )
+            for _ in range(3)
+        ]
+        for follower in followers:
+            follower.start()
+        time.sleep(0.1)
+        _store_result(fingerprint.key, leader_result, max_payload_bytes=100)
+        for follower in followers:
+            follower.join()
+
+        assert results == [leader_result] * 3
+        assert compute.call_count == 0
+        assert get_cached_query_result(queryset, "read", fingerprint=fingerprint) is None
+
+    def test_remote_followers_execute_when_handoff_is_refused(self):
+        import threading
+
+        queryset = User.objects.filter(username="policy-refused")
+        fingerprint = get_query_fingerprint(queryset, "read")
+        cache.add(f"{fingerprint.key}:lock", "processing")
+
+        def leader_without_handoff():
+            # What a leader leaves behind when the cache rejects the handoff value
+            cache.set(f"{fingerprint.key}:uncached", True)
+            cache.delete(f"{fingerprint.key}:lock")
+
+        threading.Timer(0.2, leader_without_handoff).start()
+
+        result = get_or_execute_query(queryset, lambda: {"data": ["mine"]}, "read", fingerprint=fingerprint)
+        assert result == {"data": ["mine"]}
+
+
+class TestStaleWhileRevalidate(TestCase):
+    """Test serving the previous canonical_id's response while refreshing in the background."""
+
+    def setUp(self):
+        cache.clear()
+        self.queryset = User.objects.filter(username="swr")
+        current_canonical_id.set("txn-swr-old")
+        get_or_execute_query(
+            self.queryset,
+            lambda: {"data": ["old"], "metadata": {"read": True}},
+            "read",
+            stale_while_revalidate=True,
+        )
+        current_canonical_id.set("txn-swr-new")
+
+    def tearDown(self):
+        cache.clear()
+        current_canonical_id.set(None)
+
+    def _inline_executor(self):
+        executor = Mock()
+        executor.submit.side_effect = lambda fn, *args: fn(*args)
+        return patch("statezero.core.query_cache._get_revalidation_executor", return_value=executor)
+
+    def test_miss_returns_stale_result_flagged(self):
+        compute = Mock(return_value={"data": ["new"], "metadata": {"read": True}})
+        with self._inline_executor():
+            result = get_or_execute_query(self.queryset, compute, "read", stale_while_revalidate=True)
+
+        assert result == {"data": ["old"], "metadata": {"read": True, "stale": True}}
+
+    def test_background_revalidation_refreshes_current_key(self):
+        compute = Mock(return_value={"data": ["new"], "metadata": {"read": True}})
+        with self._inline_executor():
+            get_or_execute_query(self.queryset, compute, "read", stale_while_revalidate=True)
+            result = get_or_execute_query(self.queryset, compute, "read", stale_while_revalidate=True)
+
+        assert compute.call_count == 1
+        assert result == {"data": ["new"], "metadata": {"read": True}}
+
+    def test_single_revalidation_while_one_is_running(self):
+        executor = Mock()
+        compute = Mock()
+        with patch("statezero.core.query_cache._get_revalidation_executor", return_value=executor):
+            for _ in range(5):
+                result = get_or_execute_query(self.queryset, compute, "read", stale_while_revalidate=True)
+                assert result["metadata"]["stale"] is True
+
+        assert executor.submit.call_count == 1
+
+    def test_disabled_by_default(self):
+        compute = Mock(return_value={"data": ["new"], "metadata": {"read": True}})
+        result = get_or_execute_query(self.queryset, compute, "read")
+
+        assert result == {"data": ["new"], "metadata": {"read": True}}
+        compute.assert_called_once()
+
+    def test_different_operation_context_is_not_served(self):
+        compute = Mock(return_value={"data": ["other"], "metadata": {}})
+        result = get_or_execute_query(self.queryset, compute, "read:other", stale_while_revalidate=True)
+
+        assert result == {"data": ["other"], "metadata": {}}
+
+
+class TestSingleFlight(TestCase):
+    """Test hard single-flight coalescing in get_or_execute_query."""
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+        current_canonical_id.set(None)
+
+    def _run_concurrently(self, target, count=20):
+        import threading
+
+        threads = [threading.Thread(target=target) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_in_process_followers_share_leader_result(self):
+        """Concurrent callers for the same key execute the query exactly once."""
+        import threading
+
+        queryset = User.objects.filter(username="single-flight")
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def compute():
+            calls.append(1)
+            release.wait(1)
+            return {"data": [1], "metadata": {"read": True}}
+
+        def worker():
+            current_canonical_id.set("txn-sf-001")
+            results.append(get_or_execute_query(queryset, compute, "read"))
+
+        threading.Timer(0.2, release.set).start()
+        self._run_concurrently(worker)
+
+        assert len(calls) == 1
+        assert len(results) == 20
+        assert all(r == {"data": [1], "metadata": {"read": True}} for r in results)
+
+    def test_leader_error_propagates_to_followers(self):
+        """Followers receive the leader's error instead of re-executing the query."""
+        import threading
+
+        queryset = User.objects.filter(username="single-flight-error")
+        release = threading.Event()
+        calls = []
+        errors = []
+
+        def compute():
+            calls.append(1)
+            release.wait(1)
+            raise NotFound("boom")
+
+        def worker():
+            current_canonical_id.set("txn-sf-002")
+            try:
+                get_or_execute_query(queryset, compute, "read")
+            except NotFound as e:
+                errors.append(e)
+
+        threading.Timer(0.2, release.set).start()
+        self._run_concurrently(worker)
+
+        assert len(calls) == 1
+        assert len(errors) == 20
+
+    def test_cross_process_follower_receives_leader_result(self):
+        """A follower blocked on another process's lock picks up the published result."""
+        import threading
+
+        queryset = User.objects.filter(username="single-flight-remote")
+        current_canonical_id.set("txn-sf-003")
+        sql, params = _get_sql_from_queryset(queryset)
+        cache_key = _get_cache_key(sql, params, "txn-sf-003", "read")
+        cache.add(f"{cache_key}:lock", "processing")
+
+        expected = {"data": [2], "metadata": {"read": True}}
+        threading.Timer(0.2, _store_result, args=(cache_key, expected)).start()
+
+        result = get_or_execute_query(queryset, Mock(side_effect=AssertionError), "read")
+        assert result == expected
+
+    def test_cross_process_follower_receives_leader_error(self):
+        """A leader's error in another process is rebuilt and raised by followers."""
+        import threading
+
+        queryset = User.objects.filter(username="single-flight-remote-error")
+        current_canonical_id.set("txn-sf-004")
+        sql, params = _get_sql_from_queryset(queryset)
+        cache_key = _get_cache_key(sql, params, "txn-sf-004", "read")
+        cache.add(f"{cache_key}:lock", "processing")
+
+        threading.Timer(0.2, _store_error, args=(cache_key, NotFound("gone"))).start()
+
+        with self.assertRaises(NotFound):
+            get_or_execute_query(queryset, Mock(side_effect=AssertionError), "read")
+
+    def test_follower_times_out_without_executing(self):
+        """If the leader never finishes, followers raise QueryTimeout rather than fanning out."""
+        from django.test import override_settings
+
+        queryset = User.objects.filter(username="single-flight-timeout")
+        current_canonical_id.set("txn-sf-005")
+        sql, params = _get_sql_from_queryset(queryset)
+        cache_key = _get_cache_key(sql, params, "txn-sf-005", "read")
+        cache.add(f"{cache_key}:lock", "processing")
+
+        compute = Mock()
+        with override_settings(STATEZERO_QUERY_TIMEOUT_MS=0):
+            with self.assertRaises(QueryTimeout):
+                get_or_execute_query(queryset, compute, "read")
+        compute.assert_not_called()
+
+
 class TestPermissionSafety(TestCase):
     """Test that permissions are automatically safe."""
 
@@ -1587,3 +2143,131 @@ class QueryCacheIntegrationTest(TransactionTestCase):
             50,  # Allow up to 10% to execute due to timing
             f"Too many requests executed queries ({requests_with_queries}). Request coalescing may not be working."
         )
+
+
+class CachePolicyIntegrationTest(TransactionTestCase):
+    """Test that ModelConfig.cache_policy is honoured by reads and aggregates."""
+
+    def setUp(self):
+        from rest_framework.test import APIClient
+        from statezero.adaptors.django.config import registry
+
+        cache.clear()
+        DummyModel.objects.all().delete()
+        self.user = User.objects.create_user(username="policyuser", password="password")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        DummyModel.objects.create(name="PolicyA", value=1)
+        self.registry = registry
+        self.original_config = registry._models_config[DummyModel]
+        self.url = reverse("statezero:model_view", args=["django_app.DummyModel"])
+
+    def tearDown(self):
+        self.registry._models_config[DummyModel] = self.original_config
+        cache.clear()
+        DummyModel.objects.all().delete()
+        User.objects.all().delete()
+
+    def _use_policy(self, policy, permissions=None):
+        from statezero.core.config import ModelConfig
+
+        config = self.original_config
+        self.registry._models_config[DummyModel] = ModelConfig(
+            model=DummyModel,
+            permissions=permissions or config._permissions,
+            filterable_fields=config.filterable_fields,
+            searchable_fields=config.searchable_fields,
+            ordering_fields=config.ordering_fields,
+            fields=config.fields,
+            cache_policy=policy,
+        )
+
+    def _post(self, query, canonical_id="txn-policy-int"):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                self.url,
+                data={"ast": {"query": query}},
+                format="json",
+                HTTP_X_CANONICAL_ID=canonical_id,
+            )
+        self.assertEqual(response.status_code, 200)
+        return response, len(ctx.captured_queries)
+
+    def test_uncacheable_model_always_executes(self):
+        from statezero.core.classes import CachePolicy
+
+        self._use_policy(CachePolicy(cacheable=False))
+
+        _, first = self._post({"type": "read"})
+        _, second = self._post({"type": "read"})
+        _, count_first = self._post({"type": "count", "field": "id"})
+        _, count_second = self._post({"type": "count", "field": "id"})
+
+        self.assertEqual(first, second)
+        self.assertEqual(count_first, count_second)
+
+    def test_cacheable_model_hits_cache(self):
+        from statezero.core.classes import CachePolicy
+
+        self._use_policy(CachePolicy(ttl=60))
+
+        _, first = self._post({"type": "read"})
+        _, second = self._post({"type": "read"})
+
+        self.assertLess(second, first)
+
+    def _read_as_other_user(self):
+        from rest_framework.test import APIClient
+
+        other = User.objects.create_user(username="policyother", password="password")
+        self.client = APIClient()
+        self.client.force_authenticate(user=other)
+        return self._post({"type": "read"})[1]
+
+    def test_permission_scope_separates_users_without_fingerprint(self):
+        from statezero.adaptors.django.permissions import AllowAllPermission
+        from statezero.core.classes import CachePolicy, CacheScope
+
+        class UserScopedPermission(AllowAllPermission):
+            pass
+
+        self._use_policy(CachePolicy(scope=CacheScope.PERMISSION), [UserScopedPermission])
+        _, first = self._post({"type": "read"})
+        other_first = self._read_as_other_user()
+        _, other_second = self._post({"type": "read"})
+
+        self.assertEqual(other_first, first)
+        self.assertLess(other_second, other_first)
+
+    def test_permission_scope_shares_matching_fingerprints(self):
+        from statezero.core.classes import CachePolicy, CacheScope
+
+        self._use_policy(CachePolicy(scope=CacheScope.PERMISSION))
+        _, first = self._post({"type": "read"})
+        other_first = self._read_as_other_user()
+
+        self.assertLess(other_first, first)
+
+    def test_stale_while_revalidate_serves_previous_response(self):
+        import time
+        from statezero.core.classes import CachePolicy
+
+        self._use_policy(CachePolicy(stale_while_revalidate=True))
+        first, _ = self._post({"type": "read"}, canonical_id="txn-swr-1")
+        DummyModel.objects.create(name="PolicyB", value=2)
+
+        stale, _ = self._post({"type": "read"}, canonical_id="txn-swr-2")
+        self.assertTrue(stale.data["metadata"]["stale"])
+        self.assertEqual(stale.data["data"], first.data["data"])
+
+        # The background revalidation refreshes the entry for txn-swr-2
+        for _ in range(50):
+            fresh, _ = self._post({"type": "read"}, canonical_id="txn-swr-2")
+            if not fresh.data["metadata"].get("stale"):
+                break
+            time.sleep(0.05)
+        self.assertNotIn("stale", fresh.data["metadata"])
+        self.assertEqual(len(fresh.data["data"]["data"]), 2)